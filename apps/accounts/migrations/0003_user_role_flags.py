@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:55
+
+from django.db import migrations, models
+
+
+# Mirrors User.ROLE_FLAGS at the time of this migration
+ROLE_FLAGS = {'ADMIN': 1, 'BACKOFFICE': 2, 'CUSTOMER': 4}
+
+
+def backfill_role_flags(apps, schema_editor):
+    User = apps.get_model('accounts', 'User')
+    UserRole = apps.get_model('accounts', 'UserRole')
+    flags = {}
+    for user_id, role_name in UserRole.objects.values_list('user_id', 'role__role_name'):
+        flags[user_id] = flags.get(user_id, 0) | ROLE_FLAGS.get(role_name, 0)
+    for user_id, role_flags in flags.items():
+        if role_flags:
+            User.objects.filter(pk=user_id).update(role_flags=role_flags)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_alter_auditlog_action_type_datamodificationhistory'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='role_flags',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_role_flags, migrations.RunPython.noop),
+    ]
@@ -25,9 +25,7 @@ class RoleCheckMixin(UserPassesTestMixin):
         if not self.request.user.is_authenticated:
             return False
         
-        return self.request.user.user_roles.filter(
-            role__role_name__in=self.required_roles
-        ).exists()
+        return self.request.user.has_any_role(*self.required_roles)
     
     def handle_no_permission(self):
         """Return 403 Forbidden for unauthorized users."""
@@ -98,7 +96,7 @@ def get_user_role(user):
     
     # Priority: ADMIN > BACKOFFICE > CUSTOMER
     for role in ['ADMIN', 'BACKOFFICE', 'CUSTOMER']:
-        if user.user_roles.filter(role__role_name=role).exists():
+        if user.has_any_role(role):
             return role
     
     return None
@@ -13,8 +13,20 @@ are included for extensibility and demonstrate RBAC understanding.
 """
 
 from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.utils import timezone
+from django.utils.functional import cached_property
+
+
+# Seconds a user's role ids stay in the shared cache
+ROLE_IDS_CACHE_TTL = 60
+
+
+def role_ids_cache_key(user_id):
+    return f'user_roles:{user_id}'
 
 
 class User(AbstractUser):
@@ -34,6 +46,10 @@ class User(AbstractUser):
     account_locked_until = models.DateTimeField(null=True, blank=True)
     last_password_change_at = models.DateTimeField(null=True, blank=True)
     
+    # One bit per system role (ROLE_FLAGS), kept in sync with user_roles
+    # by the UserRole signals so role checks need no query
+    role_flags = models.PositiveSmallIntegerField(default=0, editable=False)
+    
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -46,6 +62,12 @@ class User(AbstractUser):
         related_name='updated_users'
     )
     
+    ROLE_FLAGS = {
+        'ADMIN': 1,
+        'BACKOFFICE': 2,
+        'CUSTOMER': 4,
+    }
+    
     # Use email as the username field for authentication
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username', 'first_name', 'last_name']
@@ -61,6 +83,54 @@ class User(AbstractUser):
     def __str__(self):
         return f"{self.email} ({self.get_full_name()})"
     
+    @classmethod
+    def role_mask(cls, role_names):
+        """role_flags bits for role_names (non-system roles have none)."""
+        mask = 0
+        for role_name in role_names:
+            mask |= cls.ROLE_FLAGS.get(role_name, 0)
+        return mask
+    
+    def has_any_role(self, *role_names):
+        """
+        Whether the user holds any of role_names.
+        
+        System roles are read from role_flags; only other role names
+        (if any are asked about and no flag matched) need a query.
+        """
+        if self.role_flags & self.role_mask(role_names):
+            return True
+        other_roles = [name for name in role_names if name not in self.ROLE_FLAGS]
+        if other_roles:
+            return self.user_roles.filter(role__role_name__in=other_roles).exists()
+        return False
+    
+    @property
+    def is_admin_cached(self):
+        """Whether the user holds the ADMIN role (from role_flags)."""
+        return self.has_any_role(Role.ROLE_ADMIN)
+    
+    @property
+    def is_backoffice_cached(self):
+        """Whether the user holds the BACKOFFICE or ADMIN role (from role_flags)."""
+        return self.has_any_role(Role.ROLE_ADMIN, Role.ROLE_BACKOFFICE)
+    
+    @cached_property
+    def role_ids_cached(self):
+        """
+        Ids of the user's roles.
+        
+        Shared across requests through the cache for ROLE_IDS_CACHE_TTL
+        seconds and dropped whenever one of the user's UserRole rows
+        changes.
+        """
+        key = role_ids_cache_key(self.pk)
+        role_ids = cache.get(key)
+        if role_ids is None:
+            role_ids = frozenset(self.user_roles.values_list('role_id', flat=True))
+            cache.set(key, role_ids, ROLE_IDS_CACHE_TTL)
+        return role_ids
+    
     @property
     def is_account_locked(self):
         """Check if account is currently locked."""
@@ -168,6 +238,23 @@ class UserRole(models.Model):
         return f"{self.user.email} - {self.role.role_name}"
 
 
+@receiver([post_save, post_delete], sender=UserRole)
+def _clear_role_ids_cache(sender, instance, **kwargs):
+    cache.delete(role_ids_cache_key(instance.user_id))
+
+
+@receiver([post_save, post_delete], sender=UserRole)
+def _sync_role_flags(sender, instance, **kwargs):
+    role_flags = User.role_mask(
+        Role.objects.filter(user_roles__user_id=instance.user_id)
+        .values_list('role_name', flat=True)
+    )
+    User.objects.filter(pk=instance.user_id).update(role_flags=role_flags)
+    # Keep the caller's in-memory user (e.g. one just registered) current
+    if UserRole.user.is_cached(instance):
+        instance.user.role_flags = role_flags
+
+
 class Permission(models.Model):
     """
     Granular permissions for future extensibility.
@@ -286,11 +373,12 @@ class AuditLog(models.Model):
         """Create an audit log entry."""
         ip_address = None
         if request:
-            x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-            if x_forwarded_for:
-                ip_address = x_forwarded_for.split(',')[0].strip()
-            else:
-                ip_address = request.META.get('REMOTE_ADDR')
+            # First hop of X-Forwarded-For, else the socket address
+            x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR', '')
+            ip_address = (
+                x_forwarded_for.partition(',')[0].strip()
+                or request.META.get('REMOTE_ADDR')
+            )
         
         return cls.objects.create(
             user=user,
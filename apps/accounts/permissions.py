@@ -17,7 +17,7 @@ class IsAdmin(BasePermission):
     def has_permission(self, request, view):
         if not request.user or not request.user.is_authenticated:
             return False
-        return request.user.user_roles.filter(role__role_name='ADMIN').exists()
+        return is_request_admin(request)
 
 
 class IsBackoffice(BasePermission):
@@ -30,9 +30,7 @@ class IsBackoffice(BasePermission):
     def has_permission(self, request, view):
         if not request.user or not request.user.is_authenticated:
             return False
-        return request.user.user_roles.filter(
-            role__role_name__in=['ADMIN', 'BACKOFFICE']
-        ).exists()
+        return is_request_backoffice(request)
 
 
 class IsCustomer(BasePermission):
@@ -44,7 +42,7 @@ class IsCustomer(BasePermission):
     def has_permission(self, request, view):
         if not request.user or not request.user.is_authenticated:
             return False
-        return request.user.user_roles.filter(role__role_name='CUSTOMER').exists()
+        return request.user.has_any_role('CUSTOMER')
 
 
 class IsAdminOrBackoffice(BasePermission):
@@ -56,9 +54,7 @@ class IsAdminOrBackoffice(BasePermission):
     def has_permission(self, request, view):
         if not request.user or not request.user.is_authenticated:
             return False
-        return request.user.user_roles.filter(
-            role__role_name__in=['ADMIN', 'BACKOFFICE']
-        ).exists()
+        return is_request_backoffice(request)
 
 
 class IsOwnerOrAdmin(BasePermission):
@@ -73,7 +69,7 @@ class IsOwnerOrAdmin(BasePermission):
             return False
         
         # Admin can access anything
-        if request.user.user_roles.filter(role__role_name='ADMIN').exists():
+        if is_request_admin(request):
             return True
         
         # Check ownership
@@ -110,7 +106,7 @@ def has_role(user, role_name):
     """
     if not user or not user.is_authenticated:
         return False
-    return user.user_roles.filter(role__role_name=role_name).exists()
+    return user.has_any_role(role_name)
 
 
 def is_admin(user):
@@ -118,6 +114,32 @@ def is_admin(user):
     return has_role(user, 'ADMIN')
 
 
+def is_request_admin(request):
+    """
+    Check if the request's user is an admin.
+    
+    Uses User.is_admin_cached, which reads the denormalized role_flags
+    column rather than querying user_roles.
+    """
+    user = request.user
+    if not user or not user.is_authenticated:
+        return False
+    return user.is_admin_cached
+
+
+def is_request_backoffice(request):
+    """
+    Check if the request's user is backoffice staff (or an admin).
+    
+    Uses User.is_backoffice_cached, which reads the denormalized
+    role_flags column rather than querying user_roles.
+    """
+    user = request.user
+    if not user or not user.is_authenticated:
+        return False
+    return user.is_backoffice_cached
+
+
 def is_backoffice(user):
     """Check if user is backoffice staff."""
     return has_role(user, 'BACKOFFICE') or has_role(user, 'ADMIN')
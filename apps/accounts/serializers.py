@@ -87,6 +87,10 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         if customer_role:
             UserRole.objects.create(user=user, role=customer_role)
         
+        # Create the (empty) profile now rather than on first profile request
+        from apps.customers.models import CustomerProfile
+        CustomerProfile.objects.create(user=user)
+        
         return user
 
 
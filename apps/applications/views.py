@@ -83,7 +83,7 @@ class InsuranceApplicationViewSet(viewsets.ModelViewSet):
         if insurance_type:
             queryset = queryset.filter(insurance_type_id=insurance_type)
         
-        return queryset.distinct()
+        return queryset
     
     def get_serializer_class(self):
         if self.action == 'create':
@@ -11,9 +11,38 @@ This module contains configuration-driven business rules:
 - CompanyConfiguration: Per-company settings
 """
 
+import time
+
+from django.core.cache import cache
 from django.db import models
+from django.db.models import Q
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
-from decimal import Decimal
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from types import MappingProxyType
+
+
+# Seed defaults, shared read-only; callers that need to mutate use dict(d)
+_DEFAULT_CONFIGS = tuple(MappingProxyType(d) for d in [
+    {'config_key': 'GST_RATE', 'config_value': '18', 'config_type': 'TAX',
+     'config_description': 'GST rate percentage'},
+    {'config_key': 'QUOTE_VALIDITY_DAYS', 'config_value': '30', 'config_type': 'QUOTE',
+     'config_description': 'Days a quote remains valid'},
+    {'config_key': 'CLAIM_SLA_DAYS', 'config_value': '15', 'config_type': 'CLAIM',
+     'config_description': 'SLA for claim settlement in days'},
+    {'config_key': 'MAX_PAYMENT_RETRIES', 'config_value': '3', 'config_type': 'PAYMENT',
+     'config_description': 'Maximum payment retry attempts'},
+    {'config_key': 'ACCOUNT_LOCK_THRESHOLD', 'config_value': '5', 'config_type': 'SECURITY',
+     'config_description': 'Failed login attempts before lockout'},
+    {'config_key': 'ACCOUNT_LOCK_DURATION', 'config_value': '30', 'config_type': 'SECURITY',
+     'config_description': 'Account lockout duration in minutes'},
+    {'config_key': 'SESSION_TIMEOUT', 'config_value': '30', 'config_type': 'SECURITY',
+     'config_description': 'Session timeout in minutes'},
+])
 
 
 class PremiumSlab(models.Model):
@@ -31,7 +60,8 @@ class PremiumSlab(models.Model):
         max_digits=15, decimal_places=2, default=Decimal('0.00')
     )
     max_coverage_amount = models.DecimalField(
-        max_digits=15, decimal_places=2, default=Decimal('9999999999.99')
+        max_digits=15, decimal_places=2, null=True, blank=True,
+        help_text="Null = no upper limit"
     )
     base_premium = models.DecimalField(
         max_digits=12, decimal_places=2,
@@ -50,10 +80,36 @@ class PremiumSlab(models.Model):
         db_table = 'premium_slabs'
         ordering = ['insurance_type', 'min_coverage_amount']
         unique_together = ['insurance_type', 'min_coverage_amount', 'max_coverage_amount']
+        indexes = [
+            models.Index(fields=['insurance_type', 'is_active', 'min_coverage_amount']),
+        ]
     
     def __str__(self):
         return f"{self.slab_name} ({self.insurance_type.type_code})"
     
+    def clean(self):
+        # unique_together can't stop this: MySQL unique indexes allow
+        # repeated NULLs, and it has no conditional unique constraints
+        if self.max_coverage_amount is None and self.insurance_type_id:
+            unbounded = PremiumSlab.objects.filter(
+                insurance_type_id=self.insurance_type_id,
+                max_coverage_amount__isnull=True,
+            ).exclude(pk=self.pk)
+            if unbounded.exists():
+                raise ValidationError({
+                    'max_coverage_amount': 'This insurance type already has an unbounded slab.'
+                })
+    
+    @classmethod
+    def find_for_amount(cls, insurance_type, coverage_amount):
+        """Get the active slab covering an amount (null max = unbounded)."""
+        return cls.objects.filter(
+            Q(max_coverage_amount__isnull=True) | Q(max_coverage_amount__gte=coverage_amount),
+            insurance_type=insurance_type,
+            min_coverage_amount__lte=coverage_amount,
+            is_active=True
+        ).first()
+    
     def calculate_premium(self, coverage_amount):
         """Calculate premium for a given coverage amount."""
         base = self.base_premium
@@ -93,6 +149,9 @@ class PolicyEligibilityRule(models.Model):
     class Meta:
         db_table = 'policy_eligibility_rules'
         ordering = ['insurance_type', '-rule_priority']
+        indexes = [
+            models.Index(fields=['insurance_type', 'is_active']),
+        ]
     
     def __str__(self):
         return f"{self.rule_name} ({self.insurance_type.type_code})"
@@ -146,13 +205,45 @@ class DiscountRule(models.Model):
     class Meta:
         db_table = 'discount_rules'
         ordering = ['-rule_priority', 'rule_name']
+        indexes = [
+            models.Index(fields=['insurance_type', 'is_active']),
+        ]
     
     def __str__(self):
         return f"{self.rule_name} ({self.discount_percentage}%)"
     
+    @classmethod
+    def hot_fields(cls):
+        """Columns needed to evaluate a rule and report the discount."""
+        return (
+            'id', 'insurance_type_id', 'rule_name', 'rule_code',
+            'rule_condition', 'discount_percentage', 'discount_max_amount',
+            'rule_priority', 'is_combinable', 'effective_from', 'effective_to',
+        )
+    
+    @classmethod
+    def evaluator_qs(cls):
+        """Active rules loaded with evaluation columns only."""
+        return cls.objects.filter(is_active=True).only(*cls.hot_fields())
+    
+    @classmethod
+    def get_applicable_rules(cls, insurance_type, check_date=None):
+        """
+        Get active rules in effect on a date for an insurance type.
+        
+        Type, active flag and effective window are filtered in SQL, so
+        only candidate rules reach the JSON condition evaluation.
+        """
+        check_date = check_date or date.today()
+        
+        return cls.evaluator_qs().filter(
+            Q(insurance_type=insurance_type) | Q(insurance_type__isnull=True),
+            Q(effective_from__isnull=True) | Q(effective_from__lte=check_date),
+            Q(effective_to__isnull=True) | Q(effective_to__gte=check_date),
+        ).order_by('-rule_priority')
+    
     def is_valid_for_date(self, check_date=None):
         """Check if discount is valid for a given date."""
-        from datetime import date
         check_date = check_date or date.today()
         
         if self.effective_from and check_date < self.effective_from:
@@ -205,6 +296,19 @@ class QuoteCalculationWeight(models.Model):
     
     def __str__(self):
         return f"{self.factor_name}: {self.factor_weight} ({self.insurance_type.type_code})"
+    
+    @classmethod
+    def hot_fields(cls):
+        """Columns needed by the quote scoring path."""
+        return (
+            'id', 'insurance_type_id', 'factor_name', 'factor_weight',
+            'min_weight_value', 'max_weight_value',
+        )
+    
+    @classmethod
+    def evaluator_qs(cls):
+        """Active weights loaded without the formula description."""
+        return cls.objects.filter(is_active=True).only(*cls.hot_fields())
 
 
 class ClaimApprovalThreshold(models.Model):
@@ -252,6 +356,52 @@ class ClaimApprovalThreshold(models.Model):
     
     def __str__(self):
         return f"{self.approval_level} ({self.min_claim_amount}-{self.max_claim_amount})"
+    
+    @classmethod
+    def for_amount(cls, insurance_type_id, amount):
+        """
+        Get the active threshold covering a claim amount.
+        
+        Served from an in-process cache of each type's thresholds,
+        keyed on a shared version stamp that any threshold write replaces.
+        """
+        version = _memo_version(THRESHOLD_CACHE_VERSION_KEY)
+        for threshold in _thresholds_for_type(insurance_type_id, version):
+            if threshold.min_claim_amount <= amount <= threshold.max_claim_amount:
+                return threshold
+        return None
+
+
+# In-process memos of config rows are keyed on a version stamp kept in
+# the Django cache. A save or delete replaces the stamp, so with a shared
+# cache backend every worker reloads on its next read; the stamp's
+# timeout bounds staleness when the backend is per-process (LocMemCache).
+CONFIG_MEMO_TIMEOUT = 60
+
+THRESHOLD_CACHE_VERSION_KEY = 'claim_thresholds:version'
+
+
+def _memo_version(key):
+    return cache.get_or_set(key, time.time_ns, CONFIG_MEMO_TIMEOUT)
+
+
+def _bump_memo_version(key):
+    cache.set(key, time.time_ns(), CONFIG_MEMO_TIMEOUT)
+
+
+@lru_cache(maxsize=1024)
+def _thresholds_for_type(insurance_type_id, version):
+    """Active thresholds for an insurance type, lowest amount band first."""
+    return tuple(
+        ClaimApprovalThreshold.objects.filter(
+            insurance_type_id=insurance_type_id, is_active=True
+        ).select_related('required_approver_role').order_by('min_claim_amount')
+    )
+
+
+@receiver([post_save, post_delete], sender=ClaimApprovalThreshold)
+def _clear_threshold_cache(sender, **kwargs):
+    _bump_memo_version(THRESHOLD_CACHE_VERSION_KEY)
 
 
 class BusinessConfiguration(models.Model):
@@ -269,8 +419,24 @@ class BusinessConfiguration(models.Model):
         ('TAX', 'Tax Settings'),
     ]
     
+    VALUE_TYPE_CHOICES = [
+        ('STR', 'Text'),
+        ('INT', 'Integer'),
+        ('DECIMAL', 'Decimal'),
+        ('BOOL', 'Boolean'),
+    ]
+    
+    BOOL_VALUES = {'true': True, 'yes': True, 'false': False, 'no': False}
+    
     config_key = models.CharField(max_length=255, unique=True, db_index=True)
     config_value = models.TextField()
+    config_value_type = models.CharField(
+        max_length=10, choices=VALUE_TYPE_CHOICES, default='STR'
+    )
+    config_value_parsed = models.JSONField(
+        null=True, blank=True, editable=False,
+        help_text="config_value parsed per config_value_type on save"
+    )
     config_type = models.CharField(
         max_length=20, choices=CONFIG_TYPE_CHOICES, default='GENERAL'
     )
@@ -293,52 +459,115 @@ class BusinessConfiguration(models.Model):
     def __str__(self):
         return f"{self.config_key}: {self.config_value}"
     
+    def save(self, *args, **kwargs):
+        try:
+            self.config_value_parsed = self.parse_value(
+                self.config_value_type, self.config_value
+            )
+        except (ValueError, KeyError, InvalidOperation):
+            raise ValidationError({
+                'config_value': f"'{self.config_value}' is not a valid "
+                                f"{self.get_config_value_type_display().lower()} value."
+            })
+        super().save(*args, **kwargs)
+    
+    @classmethod
+    def infer_value_type(cls, raw):
+        """Guess the value type of a raw config string."""
+        raw = raw.strip()
+        if raw.lower() in cls.BOOL_VALUES:
+            return 'BOOL'
+        for value_type, parse in (('INT', int), ('DECIMAL', Decimal)):
+            try:
+                parse(raw)
+                return value_type
+            except (ValueError, InvalidOperation):
+                pass
+        return 'STR'
+    
+    @classmethod
+    def parse_value(cls, value_type, raw):
+        """
+        Parse a raw config string into its JSON-storable typed form.
+        
+        Decimals are kept as canonical strings since JSON has no
+        decimal type. Raises ValueError/KeyError/InvalidOperation.
+        """
+        if value_type == 'INT':
+            return int(raw.strip())
+        if value_type == 'DECIMAL':
+            return str(Decimal(raw.strip()))
+        if value_type == 'BOOL':
+            return cls.BOOL_VALUES[raw.strip().lower()]
+        return raw
+    
+    @classmethod
+    def get_typed(cls, key, default=None):
+        """
+        Get an active configuration value as its declared type.
+        
+        Served from an in-process cache of already-parsed values, keyed
+        on a shared version stamp that any configuration write replaces.
+        """
+        return _typed_configs(_memo_version(CONFIG_CACHE_VERSION_KEY)).get(key, default)
+    
     @classmethod
     def get_value(cls, key, default=None):
         """Get configuration value by key."""
         try:
-            config = cls.objects.get(config_key=key, is_active=True)
+            config = cls.objects.only('config_value').get(config_key=key, is_active=True)
             return config.config_value
         except cls.DoesNotExist:
             return default
     
     @classmethod
     def get_int(cls, key, default=0):
-        """Get configuration value as integer."""
-        value = cls.get_value(key)
+        """Get configuration value as integer (prefer get_typed)."""
+        value = cls.get_typed(key)
+        if value is None or value == '':
+            return default
         try:
-            return int(value) if value else default
+            return int(value)
         except (ValueError, TypeError):
             return default
     
     @classmethod
     def get_decimal(cls, key, default=Decimal('0')):
-        """Get configuration value as Decimal."""
-        value = cls.get_value(key)
+        """Get configuration value as Decimal (prefer get_typed)."""
+        value = cls.get_typed(key)
+        if value is None or value == '':
+            return default
         try:
-            return Decimal(value) if value else default
-        except:
+            return Decimal(value)
+        except (InvalidOperation, ValueError, TypeError):
             return default
     
-    @classmethod
-    def get_default_configs(cls):
-        """Return default system configurations for seeding."""
-        return [
-            {'config_key': 'GST_RATE', 'config_value': '18', 'config_type': 'TAX', 
-             'config_description': 'GST rate percentage'},
-            {'config_key': 'QUOTE_VALIDITY_DAYS', 'config_value': '30', 'config_type': 'QUOTE',
-             'config_description': 'Days a quote remains valid'},
-            {'config_key': 'CLAIM_SLA_DAYS', 'config_value': '15', 'config_type': 'CLAIM',
-             'config_description': 'SLA for claim settlement in days'},
-            {'config_key': 'MAX_PAYMENT_RETRIES', 'config_value': '3', 'config_type': 'PAYMENT',
-             'config_description': 'Maximum payment retry attempts'},
-            {'config_key': 'ACCOUNT_LOCK_THRESHOLD', 'config_value': '5', 'config_type': 'SECURITY',
-             'config_description': 'Failed login attempts before lockout'},
-            {'config_key': 'ACCOUNT_LOCK_DURATION', 'config_value': '30', 'config_type': 'SECURITY',
-             'config_description': 'Account lockout duration in minutes'},
-            {'config_key': 'SESSION_TIMEOUT', 'config_value': '30', 'config_type': 'SECURITY',
-             'config_description': 'Session timeout in minutes'},
-        ]
+    @staticmethod
+    def get_default_configs():
+        """Return default system configurations for seeding (read-only mappings)."""
+        return _DEFAULT_CONFIGS
+
+
+CONFIG_CACHE_VERSION_KEY = 'business_config:version'
+
+
+@lru_cache(maxsize=1)
+def _typed_configs(version):
+    """Map of active config_key -> typed value."""
+    typed = {}
+    rows = BusinessConfiguration.objects.filter(is_active=True).values_list(
+        'config_key', 'config_value', 'config_value_type', 'config_value_parsed'
+    )
+    for key, raw, value_type, parsed in rows:
+        if parsed is None:
+            parsed = raw
+        typed[key] = Decimal(parsed) if value_type == 'DECIMAL' else parsed
+    return typed
+
+
+@receiver([post_save, post_delete], sender=BusinessConfiguration)
+def _clear_config_cache(sender, **kwargs):
+    _bump_memo_version(CONFIG_CACHE_VERSION_KEY)
 
 
 class CompanyConfiguration(models.Model):
@@ -346,6 +575,11 @@ class CompanyConfiguration(models.Model):
     Per-company configuration settings.
     
     Allows different settings for each insurance company.
+    
+    Lookups always lead with insurance_company, so the
+    (insurance_company, config_key) unique index keeps a company's rows
+    in one contiguous index range. Table partitioning is not used: MySQL
+    does not allow foreign keys on partitioned InnoDB tables.
     """
     insurance_company = models.ForeignKey(
         'InsuranceCompany', on_delete=models.CASCADE,
@@ -365,3 +599,11 @@ class CompanyConfiguration(models.Model):
     
     def __str__(self):
         return f"{self.insurance_company.company_code}: {self.config_key}"
+    
+    @classmethod
+    def get_value(cls, company, key, default=None):
+        """Get a company's configuration value by key."""
+        value = cls.objects.filter(
+            insurance_company=company, config_key=key, is_active=True
+        ).values_list('config_value', flat=True).first()
+        return default if value is None else value
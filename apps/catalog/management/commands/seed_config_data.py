@@ -3,15 +3,24 @@ Seed Config Data Command
 
 Creates sample configuration data for:
 - PremiumSlab
-- PolicyEligibilityRule  
+- PolicyEligibilityRule
 - DiscountRule
 - BusinessConfiguration
 
+Rows for all four tables are gathered first, then written with one
+executemany() per table on a raw cursor (no model construction).
+Already seeded keys are skipped up front, and on MySQL the insert is
+INSERT IGNORE, so a row added concurrently (e.g. by a second seed run)
+is skipped rather than rolling back the whole seed.
+
 Usage: python manage.py seed_config_data
 """
 
+import json
+
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.db import connection, transaction
+from django.utils import timezone
 from decimal import Decimal
 
 from apps.catalog.models import InsuranceType
@@ -36,24 +45,62 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR('No insurance types found. Run seed_data first.'))
             return
         
-        # Seed Premium Slabs
-        self._seed_premium_slabs(insurance_types)
-        
-        # Seed Eligibility Rules
-        self._seed_eligibility_rules(insurance_types)
-        
-        # Seed Discount Rules
-        self._seed_discount_rules()
+        now = connection.ops.adapt_datetimefield_value(timezone.now())
+        
+        # (label, model, columns, rows) - rows exclude already seeded keys
+        plan = [
+            ('premium slabs', PremiumSlab, (
+                'insurance_type_id', 'slab_name', 'min_coverage_amount',
+                'max_coverage_amount', 'base_premium', 'percentage_markup',
+                'is_active', 'created_at', 'updated_at',
+            ), self._premium_slab_rows(insurance_types, now)),
+            ('eligibility rules', PolicyEligibilityRule, (
+                'insurance_type_id', 'rule_name', 'rule_condition',
+                'rule_priority', 'error_message', 'is_active',
+                'created_at', 'updated_at',
+            ), self._eligibility_rule_rows(insurance_types, now)),
+            ('discount rules', DiscountRule, (
+                'rule_name', 'rule_code', 'discount_percentage',
+                'rule_condition', 'rule_priority', 'is_active',
+                'is_combinable', 'created_at', 'updated_at',
+            ), self._discount_rule_rows(now)),
+            ('business configurations', BusinessConfiguration, (
+                'config_key', 'config_value', 'config_value_type',
+                'config_value_parsed', 'config_type', 'config_description',
+                'is_active', 'min_value', 'max_value', 'created_at', 'updated_at',
+            ), self._business_config_rows(now)),
+        ]
         
-        # Seed Business Configuration
-        self._seed_business_config()
+        for label, model, columns, rows in plan:
+            count = self._insert_rows(model, columns, rows)
+            self.stdout.write(f'  Created {count} {label}')
         
         self.stdout.write(self.style.SUCCESS('\nConfiguration data seeded successfully!'))
     
-    def _seed_premium_slabs(self, insurance_types):
-        """Create premium slabs for each insurance type."""
-        self.stdout.write('Creating Premium Slabs...')
-        
+    def _insert_rows(self, model, columns, rows):
+        """
+        Insert rows into the model's table with a single executemany.
+        
+        Returns the number of rows written; on MySQL rows that hit a
+        unique key are ignored and not counted.
+        """
+        if not rows:
+            return 0
+        
+        quote = connection.ops.quote_name
+        verb = 'INSERT IGNORE' if connection.vendor == 'mysql' else 'INSERT'
+        sql = '{} INTO {} ({}) VALUES ({})'.format(
+            verb,
+            quote(model._meta.db_table),
+            ', '.join(quote(column) for column in columns),
+            ', '.join(['%s'] * len(columns)),
+        )
+        with connection.cursor() as cursor:
+            cursor.executemany(sql, rows)
+            return len(rows) if cursor.rowcount < 0 else cursor.rowcount
+    
+    def _premium_slab_rows(self, insurance_types, now):
+        """Build premium slab rows for each insurance type."""
         slabs_data = [
             # (min, max, base_premium, markup%)
             (0, 100000, 1000, Decimal('1.5')),
@@ -63,29 +110,24 @@ class Command(BaseCommand):
             (5000001, 10000000, 25000, Decimal('0.6')),
         ]
         
-        count = 0
+        existing = set(PremiumSlab.objects.values_list(
+            'insurance_type_id', 'min_coverage_amount', 'max_coverage_amount'
+        ))
+        
+        rows = []
         for ins_type in insurance_types:
             for i, (min_cov, max_cov, base, markup) in enumerate(slabs_data):
-                slab, created = PremiumSlab.objects.get_or_create(
-                    insurance_type=ins_type,
-                    min_coverage_amount=min_cov,
-                    max_coverage_amount=max_cov,
-                    defaults={
-                        'slab_name': f'{ins_type.type_code} Slab {i+1}',
-                        'base_premium': Decimal(str(base)),
-                        'percentage_markup': markup,
-                        'is_active': True
-                    }
-                )
-                if created:
-                    count += 1
-        
-        self.stdout.write(f'  Created {count} premium slabs')
+                if (ins_type.id, Decimal(min_cov), Decimal(max_cov)) in existing:
+                    continue
+                rows.append((
+                    ins_type.id, f'{ins_type.type_code} Slab {i+1}',
+                    Decimal(min_cov), Decimal(max_cov), Decimal(str(base)),
+                    markup, True, now, now,
+                ))
+        return rows
     
-    def _seed_eligibility_rules(self, insurance_types):
-        """Create eligibility rules for insurance types."""
-        self.stdout.write('Creating Eligibility Rules...')
-        
+    def _eligibility_rule_rows(self, insurance_types, now):
+        """Build eligibility rule rows for insurance types."""
         rules_data = {
             'HEALTH': [
                 ('Age Requirement', {'min_age': 18, 'max_age': 65}, 1, 'Applicant must be between 18 and 65 years old'),
@@ -105,30 +147,25 @@ class Command(BaseCommand):
             ],
         }
         
-        count = 0
+        existing = set(PolicyEligibilityRule.objects.values_list(
+            'insurance_type_id', 'rule_name'
+        ))
+        
+        rows = []
         for ins_type in insurance_types:
             type_code = ins_type.type_code
             if type_code in rules_data:
                 for rule_name, condition, priority, error_msg in rules_data[type_code]:
-                    rule, created = PolicyEligibilityRule.objects.get_or_create(
-                        insurance_type=ins_type,
-                        rule_name=rule_name,
-                        defaults={
-                            'rule_condition': condition,  # Singular!
-                            'rule_priority': priority,
-                            'error_message': error_msg,
-                            'is_active': True
-                        }
-                    )
-                    if created:
-                        count += 1
-        
-        self.stdout.write(f'  Created {count} eligibility rules')
+                    if (ins_type.id, rule_name) in existing:
+                        continue
+                    rows.append((
+                        ins_type.id, rule_name, json.dumps(condition),
+                        priority, error_msg, True, now, now,
+                    ))
+        return rows
     
-    def _seed_discount_rules(self):
-        """Create discount rules."""
-        self.stdout.write('Creating Discount Rules...')
-        
+    def _discount_rule_rows(self, now):
+        """Build discount rule rows."""
         discounts = [
             # (name, code, percentage, conditions, priority)
             ('Early Bird Discount', 'EARLY_BIRD', Decimal('5.0'), {'days_before_expiry': 30}, 1),
@@ -141,28 +178,17 @@ class Command(BaseCommand):
             ('Women Driver Discount', 'WOMEN_DRV', Decimal('5.0'), {'gender': 'F'}, 8),
         ]
         
-        count = 0
-        for name, code, percentage, condition, priority in discounts:
-            discount, created = DiscountRule.objects.get_or_create(
-                rule_code=code,  # Unique identifier
-                defaults={
-                    'rule_name': name,
-                    'discount_percentage': percentage,
-                    'rule_condition': condition,  # Singular!
-                    'rule_priority': priority,
-                    'is_active': True,
-                    'is_combinable': True
-                }
-            )
-            if created:
-                count += 1
+        existing = set(DiscountRule.objects.values_list('rule_code', flat=True))
         
-        self.stdout.write(f'  Created {count} discount rules')
+        return [
+            (name, code, percentage, json.dumps(condition), priority,
+             True, True, now, now)
+            for name, code, percentage, condition, priority in discounts
+            if code not in existing
+        ]
     
-    def _seed_business_config(self):
-        """Create business configuration settings."""
-        self.stdout.write('Creating Business Configuration...')
-        
+    def _business_config_rows(self, now):
+        """Build business configuration rows."""
         configs = [
             ('GST_RATE', '18', 'TAX', 'GST percentage applied to premiums'),
             ('DEFAULT_POLICY_TENURE', '12', 'GENERAL', 'Default policy tenure in months'),
@@ -176,18 +202,16 @@ class Command(BaseCommand):
             ('CURRENCY_CODE', 'INR', 'GENERAL', 'Currency code for transactions'),
         ]
         
-        count = 0
-        for key, value, config_type, desc in configs:
-            config, created = BusinessConfiguration.objects.get_or_create(
-                config_key=key,
-                defaults={
-                    'config_value': value,
-                    'config_type': config_type,
-                    'config_description': desc,  # Correct field name
-                    'is_active': True
-                }
-            )
-            if created:
-                count += 1
+        existing = set(BusinessConfiguration.objects.values_list('config_key', flat=True))
         
-        self.stdout.write(f'  Created {count} business configurations')
+        rows = []
+        for key, value, config_type, desc in configs:
+            if key in existing:
+                continue
+            value_type = BusinessConfiguration.infer_value_type(value)
+            parsed = BusinessConfiguration.parse_value(value_type, value)
+            rows.append((
+                key, value, value_type, json.dumps(parsed), config_type,
+                desc, True, '', '', now, now,
+            ))
+        return rows
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0002_businessconfiguration_claimapprovalthreshold_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='discountrule',
+            index=models.Index(fields=['insurance_type', 'is_active'], name='discount_ru_insuran_16b60c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='policyeligibilityrule',
+            index=models.Index(fields=['insurance_type', 'is_active'], name='policy_elig_insuran_fd7883_idx'),
+        ),
+    ]
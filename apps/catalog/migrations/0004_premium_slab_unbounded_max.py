@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:18
+
+from decimal import Decimal
+
+from django.db import migrations, models
+
+
+UNBOUNDED_SENTINEL = Decimal('9999999999.99')
+
+
+def sentinel_to_null(apps, schema_editor):
+    PremiumSlab = apps.get_model('catalog', 'PremiumSlab')
+    PremiumSlab.objects.filter(
+        max_coverage_amount=UNBOUNDED_SENTINEL
+    ).update(max_coverage_amount=None)
+
+
+def null_to_sentinel(apps, schema_editor):
+    PremiumSlab = apps.get_model('catalog', 'PremiumSlab')
+    PremiumSlab.objects.filter(
+        max_coverage_amount__isnull=True
+    ).update(max_coverage_amount=UNBOUNDED_SENTINEL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0003_discount_and_eligibility_rule_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='premiumslab',
+            name='max_coverage_amount',
+            field=models.DecimalField(blank=True, decimal_places=2, help_text='Null = no upper limit', max_digits=15, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='premiumslab',
+            index=models.Index(fields=['insurance_type', 'is_active', 'min_coverage_amount'], name='premium_sla_insuran_9e4d94_idx'),
+        ),
+        migrations.RunPython(sentinel_to_null, null_to_sentinel),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:20
+
+from decimal import Decimal, InvalidOperation
+
+from django.db import migrations, models
+
+
+BOOL_VALUES = {'true': True, 'yes': True, 'false': False, 'no': False}
+
+
+def backfill_typed_values(apps, schema_editor):
+    BusinessConfiguration = apps.get_model('catalog', 'BusinessConfiguration')
+    for config in BusinessConfiguration.objects.all():
+        raw = config.config_value.strip()
+        if raw.lower() in BOOL_VALUES:
+            value_type, parsed = 'BOOL', BOOL_VALUES[raw.lower()]
+        else:
+            value_type, parsed = 'STR', config.config_value
+            for candidate, parse in (('INT', int), ('DECIMAL', lambda v: str(Decimal(v)))):
+                try:
+                    value_type, parsed = candidate, parse(raw)
+                    break
+                except (ValueError, InvalidOperation):
+                    pass
+        config.config_value_type = value_type
+        config.config_value_parsed = parsed
+        config.save(update_fields=['config_value_type', 'config_value_parsed'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0004_premium_slab_unbounded_max'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='businessconfiguration',
+            name='config_value_parsed',
+            field=models.JSONField(blank=True, editable=False, help_text='config_value parsed per config_value_type on save', null=True),
+        ),
+        migrations.AddField(
+            model_name='businessconfiguration',
+            name='config_value_type',
+            field=models.CharField(choices=[('STR', 'Text'), ('INT', 'Integer'), ('DECIMAL', 'Decimal'), ('BOOL', 'Boolean')], default='STR', max_length=10),
+        ),
+        migrations.RunPython(backfill_typed_values, migrations.RunPython.noop),
+    ]
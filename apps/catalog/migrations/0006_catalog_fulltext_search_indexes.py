@@ -0,0 +1,42 @@
+from django.db import migrations
+
+
+# (table, index name, columns) searched together by catalog.search.text_search
+FULLTEXT_INDEXES = (
+    ('insurance_types', 'insurance_types_search_ft', ('type_name', 'type_code', 'description')),
+    ('insurance_companies', 'insurance_companies_search_ft', ('company_name', 'company_code', 'registration_number')),
+    ('coverage_types', 'coverage_types_search_ft', ('coverage_name', 'description')),
+    ('riders_addons', 'riders_addons_search_ft', ('addon_name', 'description')),
+)
+
+
+def add_fulltext_indexes(apps, schema_editor):
+    """FULLTEXT/ngram is MySQL-only; other backends keep icontains scans."""
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    quote = schema_editor.quote_name
+    # The default stopword list drops every ngram containing e.g. 'a'
+    schema_editor.execute('SET SESSION innodb_ft_enable_stopword = OFF')
+    for table, name, columns in FULLTEXT_INDEXES:
+        schema_editor.execute('ALTER TABLE {} ADD FULLTEXT INDEX {} ({}) WITH PARSER ngram'.format(
+            quote(table), quote(name), ', '.join(quote(column) for column in columns)
+        ))
+
+
+def drop_fulltext_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    quote = schema_editor.quote_name
+    for table, name, columns in FULLTEXT_INDEXES:
+        schema_editor.execute('ALTER TABLE {} DROP INDEX {}'.format(quote(table), quote(name)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0005_business_config_typed_values'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_fulltext_indexes, drop_fulltext_indexes),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0006_catalog_fulltext_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='insurancecompany',
+            index=models.Index(fields=['is_active', 'service_rating'], name='insurance_c_is_acti_6499e2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='insurancetype',
+            index=models.Index(fields=['is_active', 'type_code'], name='insurance_t_is_acti_0f7529_idx'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:32
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, Q, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_stats(apps, schema_editor):
+    InsuranceType = apps.get_model('catalog', 'InsuranceType')
+    InsuranceTypeStats = apps.get_model('catalog', 'InsuranceTypeStats')
+    priced = Q(coverage_types__base_premium_per_unit__gt=0)
+    zero = Value(Decimal('0.00'), output_field=models.DecimalField())
+    rows = InsuranceType.objects.order_by().annotate(
+        n_policies=Count('policies', distinct=True),
+        n_coverages=Count('coverage_types', distinct=True),
+        lowest=Coalesce(Min('coverage_types__base_premium_per_unit', filter=priced), zero),
+        highest=Coalesce(Max('coverage_types__base_premium_per_unit', filter=priced), zero),
+    ).values_list('pk', 'n_policies', 'n_coverages', 'lowest', 'highest')
+    InsuranceTypeStats.objects.bulk_create([
+        InsuranceTypeStats(
+            insurance_type_id=type_id, policy_count=n_policies,
+            coverage_count=n_coverages, min_base=lowest, max_base=highest,
+        )
+        for type_id, n_policies, n_coverages, lowest, highest in rows
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0007_catalog_filter_indexes'),
+        ('policies', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InsuranceTypeStats',
+            fields=[
+                ('insurance_type', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='explore_stats', serialize=False, to='catalog.insurancetype')),
+                ('policy_count', models.PositiveIntegerField(default=0)),
+                ('coverage_count', models.PositiveIntegerField(default=0)),
+                ('min_base', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('max_base', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Insurance type stats',
+                'db_table': 'insurance_type_stats',
+                'indexes': [models.Index(fields=['policy_count'], name='insurance_t_policy__6f727e_idx'), models.Index(fields=['min_base'], name='insurance_t_min_bas_1bc4d5_idx'), models.Index(fields=['max_base'], name='insurance_t_max_bas_35b624_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_stats, migrations.RunPython.noop),
+    ]
@@ -6,14 +6,42 @@ This module contains models for:
 - InsuranceCompany: Insurance providers
 - CoverageType: Coverage options for each insurance type
 - RiderAddon: Optional add-ons/riders
+- InsuranceTypeStats: Per-type explore summary (maintained by signals)
 
 These are master data tables managed by Admin.
 Customers can only view (read-only access).
 """
 
-from django.db import models
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import models, transaction
+from django.db.models import Count, Max, Min, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
 from django.core.validators import MinValueValidator, MaxValueValidator
 from decimal import Decimal
+from types import MappingProxyType
+
+
+# Seed defaults, shared read-only; callers that need to mutate use dict(d)
+_DEFAULT_TYPES = tuple(MappingProxyType(d) for d in [
+    {'type_name': 'Motor Insurance', 'type_code': 'MOTOR', 'description': 'Vehicle/Auto Insurance'},
+    {'type_name': 'Health Insurance', 'type_code': 'HEALTH', 'description': 'Medical and Health Coverage'},
+    {'type_name': 'Travel Insurance', 'type_code': 'TRAVEL', 'description': 'Travel and Trip Insurance'},
+    {'type_name': 'Workers Compensation', 'type_code': 'WC', 'description': 'Employee Injury/Compensation'},
+    {'type_name': 'Commercial Property', 'type_code': 'CPM', 'description': 'Business Property Insurance'},
+])
+
+_DEFAULT_COMPANIES = tuple(MappingProxyType(d) for d in [
+    {'company_name': 'SafeGuard Insurance', 'company_code': 'SAFEGUARD', 'claim_settlement_ratio': Decimal('0.95'), 'service_rating': Decimal('4.5')},
+    {'company_name': 'TrustShield Insurance', 'company_code': 'TRUSTSHIELD', 'claim_settlement_ratio': Decimal('0.92'), 'service_rating': Decimal('4.2')},
+    {'company_name': 'SecureLife Insurance', 'company_code': 'SECURELIFE', 'claim_settlement_ratio': Decimal('0.88'), 'service_rating': Decimal('4.0')},
+    {'company_name': 'PremiumCare Insurance', 'company_code': 'PREMIUMCARE', 'claim_settlement_ratio': Decimal('0.90'), 'service_rating': Decimal('4.3')},
+    {'company_name': 'ValueFirst Insurance', 'company_code': 'VALUEFIRST', 'claim_settlement_ratio': Decimal('0.85'), 'service_rating': Decimal('3.8')},
+])
 
 
 class InsuranceType(models.Model):
@@ -39,20 +67,17 @@ class InsuranceType(models.Model):
     class Meta:
         db_table = 'insurance_types'
         ordering = ['type_name']
+        indexes = [
+            models.Index(fields=['is_active', 'type_code']),
+        ]
     
     def __str__(self):
         return f"{self.type_name} ({self.type_code})"
     
-    @classmethod
-    def get_default_types(cls):
-        """Return default insurance types for seeding."""
-        return [
-            {'type_name': 'Motor Insurance', 'type_code': 'MOTOR', 'description': 'Vehicle/Auto Insurance'},
-            {'type_name': 'Health Insurance', 'type_code': 'HEALTH', 'description': 'Medical and Health Coverage'},
-            {'type_name': 'Travel Insurance', 'type_code': 'TRAVEL', 'description': 'Travel and Trip Insurance'},
-            {'type_name': 'Workers Compensation', 'type_code': 'WC', 'description': 'Employee Injury/Compensation'},
-            {'type_name': 'Commercial Property', 'type_code': 'CPM', 'description': 'Business Property Insurance'},
-        ]
+    @staticmethod
+    def get_default_types():
+        """Return default insurance types for seeding (read-only mappings)."""
+        return _DEFAULT_TYPES
 
 
 class InsuranceCompany(models.Model):
@@ -94,20 +119,17 @@ class InsuranceCompany(models.Model):
         db_table = 'insurance_companies'
         verbose_name_plural = 'Insurance companies'
         ordering = ['company_name']
+        indexes = [
+            models.Index(fields=['is_active', 'service_rating']),
+        ]
     
     def __str__(self):
         return f"{self.company_name} ({self.company_code})"
     
-    @classmethod
-    def get_default_companies(cls):
-        """Return default insurance companies for seeding."""
-        return [
-            {'company_name': 'SafeGuard Insurance', 'company_code': 'SAFEGUARD', 'claim_settlement_ratio': Decimal('0.95'), 'service_rating': Decimal('4.5')},
-            {'company_name': 'TrustShield Insurance', 'company_code': 'TRUSTSHIELD', 'claim_settlement_ratio': Decimal('0.92'), 'service_rating': Decimal('4.2')},
-            {'company_name': 'SecureLife Insurance', 'company_code': 'SECURELIFE', 'claim_settlement_ratio': Decimal('0.88'), 'service_rating': Decimal('4.0')},
-            {'company_name': 'PremiumCare Insurance', 'company_code': 'PREMIUMCARE', 'claim_settlement_ratio': Decimal('0.90'), 'service_rating': Decimal('4.3')},
-            {'company_name': 'ValueFirst Insurance', 'company_code': 'VALUEFIRST', 'claim_settlement_ratio': Decimal('0.85'), 'service_rating': Decimal('3.8')},
-        ]
+    @staticmethod
+    def get_default_companies():
+        """Return default insurance companies for seeding (read-only mappings)."""
+        return _DEFAULT_COMPANIES
 
 
 class CoverageType(models.Model):
@@ -138,6 +160,10 @@ class CoverageType(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # insurance_type_id as last read from or written to the database;
+    # None until then
+    _stored_insurance_type_id = None
+    
     class Meta:
         db_table = 'coverage_types'
         unique_together = ['insurance_type', 'coverage_code']
@@ -145,6 +171,12 @@ class CoverageType(models.Model):
     
     def __str__(self):
         return f"{self.coverage_name} ({self.insurance_type.type_code})"
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._stored_insurance_type_id = instance.__dict__.get('insurance_type_id')
+        return instance
 
 
 class RiderAddon(models.Model):
@@ -187,6 +219,164 @@ class RiderAddon(models.Model):
         return f"{self.addon_name} ({self.insurance_type.type_code})"
 
 
+class InsuranceTypeStats(models.Model):
+    """
+    Precomputed explore summary for an insurance type.
+    
+    Stands in for a materialized view (MySQL has none): one row per
+    type holding the aggregates the explore endpoint sorts, filters and
+    badges on. Rows are refreshed after commit whenever a type, one of
+    its coverages or one of its policies changes.
+    """
+    insurance_type = models.OneToOneField(
+        InsuranceType, on_delete=models.CASCADE,
+        primary_key=True, related_name='explore_stats'
+    )
+    policy_count = models.PositiveIntegerField(default=0)
+    coverage_count = models.PositiveIntegerField(default=0)
+    # Range over coverages with a positive base premium (0 when none)
+    min_base = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal('0.00'))
+    max_base = models.DecimalField(max_digits=12, decimal_places=2, default=Decimal('0.00'))
+    
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'insurance_type_stats'
+        verbose_name_plural = 'Insurance type stats'
+        indexes = [
+            models.Index(fields=['policy_count']),
+            models.Index(fields=['min_base']),
+            models.Index(fields=['max_base']),
+        ]
+    
+    def __str__(self):
+        return f"Stats for {self.insurance_type_id}"
+    
+    @classmethod
+    def refresh(cls, insurance_type_ids):
+        """Recompute stats rows for the given insurance type ids."""
+        from apps.policies.models import Policy
+        
+        # One correlated subquery per aggregate, so policies and
+        # coverages are each scanned on their own index instead of
+        # through a policies x coverages join
+        def per_type(queryset, aggregate):
+            return Subquery(
+                queryset.filter(insurance_type=OuterRef('pk')).order_by()
+                .values('insurance_type').annotate(value=aggregate).values('value')
+            )
+        
+        coverages = CoverageType.objects.all()
+        priced = coverages.filter(base_premium_per_unit__gt=0)
+        zero = Value(Decimal('0.00'), output_field=models.DecimalField())
+        rows = InsuranceType.objects.filter(
+            pk__in=insurance_type_ids
+        ).order_by().annotate(
+            n_policies=Coalesce(per_type(Policy.objects.all(), Count('pk')), 0),
+            n_coverages=Coalesce(per_type(coverages, Count('pk')), 0),
+            lowest=Coalesce(per_type(priced, Min('base_premium_per_unit')), zero),
+            highest=Coalesce(per_type(priced, Max('base_premium_per_unit')), zero),
+        ).values_list('pk', 'n_policies', 'n_coverages', 'lowest', 'highest')
+        
+        existing = cls.objects.in_bulk(insurance_type_ids)
+        for type_id, n_policies, n_coverages, lowest, highest in rows:
+            values = {
+                'policy_count': n_policies,
+                'coverage_count': n_coverages,
+                'min_base': lowest,
+                'max_base': highest,
+            }
+            stats = existing.get(type_id)
+            if stats is None:
+                cls.objects.create(insurance_type_id=type_id, **values)
+            elif any(getattr(stats, name) != value for name, value in values.items()):
+                for name, value in values.items():
+                    setattr(stats, name, value)
+                stats.save()
+            # Unchanged rows are not written, so the explore cache survives
+
+
+# Type ids waiting for a stats refresh on this thread
+_pending_stats = threading.local()
+
+
+def _flush_stats_refresh():
+    type_ids = getattr(_pending_stats, 'ids', None)
+    if type_ids:
+        _pending_stats.ids = set()
+        InsuranceTypeStats.refresh(type_ids)
+
+
+def schedule_stats_refresh(insurance_type_id):
+    """
+    Refresh a type's stats once the current transaction commits.
+    
+    Every call registers a flush, but the first flush after commit
+    refreshes all pending ids at once and the rest find nothing to do,
+    so bulk edits cost one refresh per type. Ids left over from a
+    rolled-back transaction are just refreshed by the next flush.
+    """
+    if not hasattr(_pending_stats, 'ids'):
+        _pending_stats.ids = set()
+    _pending_stats.ids.add(insurance_type_id)
+    transaction.on_commit(_flush_stats_refresh)
+
+
+@receiver(post_save, sender=InsuranceType)
+def _refresh_type_stats(sender, instance, created, **kwargs):
+    if created:
+        schedule_stats_refresh(instance.pk)
+
+
+@receiver(post_delete, sender=CoverageType)
+@receiver(post_delete, sender='policies.Policy')
+def _refresh_child_stats(sender, instance, **kwargs):
+    schedule_stats_refresh(instance.insurance_type_id)
+
+
+@receiver(post_save, sender=CoverageType)
+def _refresh_coverage_type_stats(sender, instance, created, **kwargs):
+    # Any edit can change the premium range; a move also changes the
+    # type the coverage left
+    old_type_id = None if created else instance._stored_insurance_type_id
+    if old_type_id is not None and old_type_id != instance.insurance_type_id:
+        schedule_stats_refresh(old_type_id)
+    schedule_stats_refresh(instance.insurance_type_id)
+    instance._stored_insurance_type_id = instance.insurance_type_id
+
+
+@receiver(post_save, sender='policies.Policy')
+def _refresh_policy_type_stats(sender, instance, created, **kwargs):
+    # Only policy_count depends on policies, so status and other edits
+    # that keep the policy on its type leave the stats alone
+    old_type_id = None if created else instance._stored_insurance_type_id
+    if old_type_id != instance.insurance_type_id:
+        if old_type_id is not None:
+            schedule_stats_refresh(old_type_id)
+        schedule_stats_refresh(instance.insurance_type_id)
+    instance._stored_insurance_type_id = instance.insurance_type_id
+
+
+# Explore responses are cached under a version stamp that any catalog
+# write replaces, which drops every cached filter combination at once
+# in every worker sharing the cache (see CACHES in settings)
+EXPLORE_CACHE_VERSION_KEY = 'policy_explore:version'
+
+
+def explore_cache_version():
+    """Current policy explore cache version."""
+    return cache.get_or_set(EXPLORE_CACHE_VERSION_KEY, time.time_ns, None)
+
+
+@receiver([post_save, post_delete], sender=InsuranceType)
+@receiver([post_save, post_delete], sender=InsuranceCompany)
+@receiver([post_save, post_delete], sender=CoverageType)
+@receiver([post_save, post_delete], sender=RiderAddon)
+@receiver([post_save, post_delete], sender=InsuranceTypeStats)
+def _invalidate_explore_cache(sender, **kwargs):
+    cache.set(EXPLORE_CACHE_VERSION_KEY, time.time_ns(), None)
+
+
 # Import configuration models for convenience
 from .config_models import (
     PremiumSlab,
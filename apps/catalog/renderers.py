@@ -0,0 +1,22 @@
+"""
+Renderers for Insurance Product Catalog module.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+    
+    Types orjson doesn't handle natively (Decimal, lazy strings, ...)
+    fall back to DRF's encoder, so output matches JSONRenderer.
+    """
+    _fallback = JSONEncoder().default
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=self._fallback, option=orjson.OPT_NON_STR_KEYS)
@@ -0,0 +1,63 @@
+"""
+Catalog text search.
+
+On MySQL the searchable catalog columns carry FULLTEXT indexes built
+with the ngram parser (see migration 0006), so a quoted boolean-mode
+phrase behaves like a case-insensitive substring match without the
+full scan a leading-wildcard LIKE needs. Other backends, and queries
+shorter than one ngram, fall back to the icontains chain.
+"""
+
+from functools import reduce
+from operator import or_
+
+from django.db import connection
+from django.db.models import FloatField, Func, Q
+
+
+# Must match the server's ngram_token_size (MySQL default)
+NGRAM_TOKEN_SIZE = 2
+
+
+class MatchAgainst(Func):
+    """MATCH (columns) AGAINST ('"phrase"' IN BOOLEAN MODE) relevance."""
+    template = 'MATCH (%(expressions)s) AGAINST (%%s IN BOOLEAN MODE)'
+    output_field = FloatField()
+
+    def __init__(self, *fields, query):
+        super().__init__(*fields)
+        # Quoted phrase so the ngrams have to appear contiguously
+        self.phrase = '"{}"'.format(query.replace('"', ' '))
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sql, params = super().as_sql(compiler, connection, **extra_context)
+        return sql, (*params, self.phrase)
+
+
+def text_search(queryset, query, fields, related_fields=()):
+    """
+    Filter queryset to rows where any of the fields contain query.
+
+    Args:
+        fields: Columns on the queryset's own table, covered together
+            by one FULLTEXT index on MySQL.
+        related_fields: 'relation__column' lookups one FK hop away.
+            Each is matched in its own subquery on the related table
+            (relation IN (SELECT pk ...)), so the OR doesn't need the
+            join and each branch can use its own table's indexes.
+    """
+    if connection.vendor == 'mysql' and len(query) >= NGRAM_TOKEN_SIZE:
+        queryset = queryset.alias(search_rank=MatchAgainst(*fields, query=query))
+        condition = Q(search_rank__gt=0)
+    else:
+        condition = reduce(or_, (Q(**{f'{field}__icontains': query}) for field in fields))
+
+    for lookup in related_fields:
+        relation, field = lookup.split('__', 1)
+        related_model = queryset.model._meta.get_field(relation).related_model
+        matches = related_model._default_manager.filter(
+            **{f'{field}__icontains': query}
+        ).values('pk')
+        condition |= Q(**{f'{relation}__in': matches})
+
+    return queryset.filter(condition)
@@ -3,13 +3,41 @@ Serializers for Insurance Product Catalog module.
 """
 
 from rest_framework import serializers
+
 from .models import InsuranceType, InsuranceCompany, CoverageType, RiderAddon
 
 
+# Explore card icon per insurance type code (default 'shield')
+ICON_MAP = {
+    'MOTOR': 'car-front',
+    'HEALTH': 'heart-pulse',
+    'TRAVEL': 'airplane',
+    'WC': 'briefcase',
+    'CPM': 'building',
+}
+
+# Explore badge thresholds: policies sold, coverages on a health
+# product, lowest base premium and highest base premium
+POPULAR_THRESHOLD = 5
+FAMILY_MIN_COVERAGES = 3
+BUDGET_THRESHOLD = 5000
+HIGH_COVERAGE_THRESHOLD = 50000
+
+BADGE_POPULAR = {'type': 'popular', 'label': 'Most Popular'}
+BADGE_FAMILY = {'type': 'family', 'label': 'Best for Families'}
+BADGE_BUDGET = {'type': 'budget', 'label': 'Budget Friendly'}
+BADGE_PREMIUM = {'type': 'premium', 'label': 'Premium Protection'}
+
+
 class InsuranceTypeSerializer(serializers.ModelSerializer):
-    """Serializer for InsuranceType model."""
-    coverages_count = serializers.SerializerMethodField()
-    addons_count = serializers.SerializerMethodField()
+    """
+    Serializer for InsuranceType model.
+    
+    Counts are read from coverages_count/addons_count annotations
+    added by InsuranceTypeViewSet.get_queryset.
+    """
+    coverages_count = serializers.IntegerField(read_only=True)
+    addons_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = InsuranceType
@@ -19,12 +47,6 @@ class InsuranceTypeSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
         read_only_fields = ['created_at', 'updated_at']
-    
-    def get_coverages_count(self, obj):
-        return obj.coverage_types.count()
-    
-    def get_addons_count(self, obj):
-        return obj.addons.count()
 
 
 class InsuranceCompanySerializer(serializers.ModelSerializer):
@@ -92,3 +114,74 @@ class InsuranceTypeDetailSerializer(serializers.ModelSerializer):
             'id', 'type_name', 'type_code', 'description', 'is_active',
             'coverage_types', 'addons', 'created_at', 'updated_at'
         ]
+
+
+class ExploreCoverageSerializer(serializers.ModelSerializer):
+    """Coverage summary shown on explore product cards."""
+    base_premium_per_unit = serializers.DecimalField(
+        max_digits=12, decimal_places=2, coerce_to_string=False, read_only=True
+    )
+    
+    class Meta:
+        model = CoverageType
+        fields = [
+            'id', 'coverage_name', 'description',
+            'base_premium_per_unit', 'is_mandatory'
+        ]
+
+
+class ExploreProductSerializer(serializers.ModelSerializer):
+    """
+    Product card for the policy explore marketplace.
+    
+    Expects policy_count/coverage_count/min_base/max_base annotations
+    and prefetched coverage_types (see PolicyExploreView). The company
+    list is shared by every product and passed in as context['companies'].
+    """
+    name = serializers.CharField(source='type_name')
+    category = serializers.CharField(source='type_code')
+    icon = serializers.SerializerMethodField()
+    base_premium_range = serializers.SerializerMethodField()
+    coverages = serializers.SerializerMethodField()
+    total_coverages = serializers.SerializerMethodField()
+    badges = serializers.SerializerMethodField()
+    companies = serializers.SerializerMethodField()
+    policy_count = serializers.IntegerField(read_only=True)
+    
+    class Meta:
+        model = InsuranceType
+        fields = [
+            'id', 'name', 'category', 'description', 'icon',
+            'base_premium_range', 'coverages', 'total_coverages',
+            'badges', 'companies', 'policy_count'
+        ]
+    
+    def get_icon(self, obj):
+        return ICON_MAP.get(obj.type_code, 'shield')
+    
+    def get_base_premium_range(self, obj):
+        return {
+            'min': float(obj.min_base) if obj.min_base else 0,
+            'max': float(obj.max_base) if obj.max_base else 0,
+        }
+    
+    def get_coverages(self, obj):
+        # Top 5 coverages, sliced from the prefetched list
+        return ExploreCoverageSerializer(obj.coverage_types.all()[:5], many=True).data
+    
+    def get_total_coverages(self, obj):
+        return obj.coverage_count
+    
+    def get_badges(self, obj):
+        min_base, max_base = obj.min_base, obj.max_base
+        rules = (
+            (obj.policy_count >= POPULAR_THRESHOLD, BADGE_POPULAR),
+            ('HEALTH' in obj.type_code.upper()
+             and obj.coverage_count >= FAMILY_MIN_COVERAGES, BADGE_FAMILY),
+            (bool(min_base) and min_base <= BUDGET_THRESHOLD, BADGE_BUDGET),
+            (bool(max_base) and max_base >= HIGH_COVERAGE_THRESHOLD, BADGE_PREMIUM),
+        )
+        return [dict(badge) for earned, badge in rules if earned]
+    
+    def get_companies(self, obj):
+        return self.context.get('companies', [])
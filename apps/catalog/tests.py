@@ -1,3 +1,203 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.test import TestCase
+from django.utils import timezone
+
+from apps.accounts.models import Role, User
+from apps.applications.models import InsuranceApplication
+from apps.customers.models import CustomerProfile
+from apps.policies.models import Policy
+from apps.quotes.models import Quote
+
+from .config_models import (
+    CONFIG_CACHE_VERSION_KEY, THRESHOLD_CACHE_VERSION_KEY,
+    BusinessConfiguration, ClaimApprovalThreshold, PremiumSlab,
+)
+from .models import (
+    CoverageType, InsuranceCompany, InsuranceType, InsuranceTypeStats,
+    explore_cache_version,
+)
+
+
+class PremiumSlabTests(TestCase):
+    
+    def setUp(self):
+        self.motor = InsuranceType.objects.create(type_name='Motor', type_code='MOTOR')
+        PremiumSlab.objects.create(
+            insurance_type=self.motor, slab_name='Top',
+            min_coverage_amount=Decimal('100000'), base_premium=Decimal('5000'),
+        )
+    
+    def test_rejects_second_unbounded_slab(self):
+        slab = PremiumSlab(
+            insurance_type=self.motor, slab_name='Top again',
+            min_coverage_amount=Decimal('200000'), base_premium=Decimal('6000'),
+        )
+        with self.assertRaises(ValidationError):
+            slab.full_clean()
+    
+    def test_allows_bounded_slab_and_resaving_unbounded(self):
+        PremiumSlab(
+            insurance_type=self.motor, slab_name='Low',
+            min_coverage_amount=Decimal('0'), max_coverage_amount=Decimal('99999'),
+            base_premium=Decimal('1000'),
+        ).full_clean()
+        PremiumSlab.objects.get(slab_name='Top').full_clean()
+    
+    def test_find_for_amount_uses_unbounded_slab(self):
+        slab = PremiumSlab.find_for_amount(self.motor, Decimal('5000000'))
+        self.assertEqual(slab.slab_name, 'Top')
+
+
+class ConfigMemoTests(TestCase):
+    
+    def setUp(self):
+        self.motor = InsuranceType.objects.create(type_name='Motor', type_code='MOTOR')
+        # The cache outlives each test's rollback; drop stamps so memos
+        # built from rolled-back rows aren't reused by later tests
+        for key in (CONFIG_CACHE_VERSION_KEY, THRESHOLD_CACHE_VERSION_KEY):
+            self.addCleanup(cache.delete, key)
+    
+    def test_threshold_memo_follows_shared_version_stamp(self):
+        ClaimApprovalThreshold.objects.create(
+            insurance_type=self.motor, approval_level='OFFICER_APPROVAL',
+            required_approver_role=Role.objects.get_or_create(role_name=Role.ROLE_BACKOFFICE)[0],
+        )
+        self.assertIsNotNone(ClaimApprovalThreshold.for_amount(self.motor.pk, Decimal('100')))
+        
+        # A write from another worker: no local signal, only a new stamp
+        ClaimApprovalThreshold.objects.update(is_active=False)
+        self.assertIsNotNone(ClaimApprovalThreshold.for_amount(self.motor.pk, Decimal('100')))
+        cache.set(THRESHOLD_CACHE_VERSION_KEY, 'other-worker')
+        self.assertIsNone(ClaimApprovalThreshold.for_amount(self.motor.pk, Decimal('100')))
+    
+    def test_typed_config_memo_follows_shared_version_stamp(self):
+        BusinessConfiguration.objects.create(config_key='CLAIM_SLA_DAYS', config_value='15')
+        self.assertEqual(BusinessConfiguration.get_int('CLAIM_SLA_DAYS'), 15)
+        
+        BusinessConfiguration.objects.update(config_value='10', config_value_parsed=10)
+        self.assertEqual(BusinessConfiguration.get_int('CLAIM_SLA_DAYS'), 15)
+        cache.set(CONFIG_CACHE_VERSION_KEY, 'other-worker')
+        self.assertEqual(BusinessConfiguration.get_int('CLAIM_SLA_DAYS'), 10)
+
 
-# Create your tests here.
+class InsuranceTypeStatsTests(TestCase):
+    
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.motor = InsuranceType.objects.create(type_name='Motor', type_code='MOTOR')
+    
+    def add_coverage(self, code, premium):
+        return CoverageType.objects.create(
+            insurance_type=self.motor, coverage_name=code, coverage_code=code,
+            base_premium_per_unit=Decimal(premium),
+        )
+    
+    def test_batches_refresh_per_transaction(self):
+        with mock.patch.object(InsuranceTypeStats, 'refresh', wraps=InsuranceTypeStats.refresh) as refresh:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.add_coverage('OD', '1000')
+                self.add_coverage('TP', '400')
+        refresh.assert_called_once_with({self.motor.pk})
+        
+        stats = InsuranceTypeStats.objects.get(pk=self.motor.pk)
+        self.assertEqual(
+            (stats.coverage_count, stats.min_base, stats.max_base),
+            (2, Decimal('400'), Decimal('1000')),
+        )
+    
+    def test_moving_and_deleting_coverage_refreshes_both_types(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            health = InsuranceType.objects.create(type_name='Health', type_code='HEALTH')
+            self.add_coverage('OD', '1000')
+            self.add_coverage('TP', '400')
+        
+        coverage = CoverageType.objects.get(coverage_code='TP')
+        with self.captureOnCommitCallbacks(execute=True):
+            coverage.insurance_type = health
+            coverage.save()
+        motor_stats = InsuranceTypeStats.objects.get(pk=self.motor.pk)
+        health_stats = InsuranceTypeStats.objects.get(pk=health.pk)
+        self.assertEqual(
+            (motor_stats.coverage_count, motor_stats.min_base, motor_stats.max_base),
+            (1, Decimal('1000'), Decimal('1000')),
+        )
+        self.assertEqual((health_stats.coverage_count, health_stats.min_base), (1, Decimal('400')))
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            coverage.delete()
+        health_stats.refresh_from_db()
+        self.assertEqual(
+            (health_stats.coverage_count, health_stats.min_base, health_stats.max_base),
+            (0, Decimal('0'), Decimal('0')),
+        )
+    
+    def test_unchanged_refresh_keeps_explore_cache(self):
+        version = explore_cache_version()
+        InsuranceTypeStats.refresh([self.motor.pk])
+        self.assertEqual(explore_cache_version(), version)
+    
+    def test_ids_from_rolled_back_savepoint_are_refreshed_later(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    self.add_coverage('OD', '1000')
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+        with self.captureOnCommitCallbacks(execute=True):
+            self.add_coverage('TP', '400')
+        
+        stats = InsuranceTypeStats.objects.get(pk=self.motor.pk)
+        self.assertEqual(stats.coverage_count, 1)
+    
+    def make_policy(self):
+        customer = CustomerProfile.objects.create(user=User.objects.create_user(
+            username='holder@example.com', email='holder@example.com', password='Str0ngPass!x',
+        ))
+        company = InsuranceCompany.objects.create(company_name='Acme', company_code='ACME')
+        quote = Quote.objects.create(
+            application=InsuranceApplication.objects.create(
+                customer=customer, insurance_type=self.motor,
+            ),
+            customer=customer, insurance_type=self.motor, insurance_company=company,
+            status='ACCEPTED', base_premium=Decimal('10000'),
+            adjusted_premium=Decimal('10000'), final_premium=Decimal('10000'),
+            gst_amount=Decimal('1800'), total_premium_with_gst=Decimal('11800'),
+            sum_insured=Decimal('500000'),
+            expiry_at=timezone.now() + timedelta(days=30),
+        )
+        return Policy.objects.create(
+            quote=quote, customer=customer,
+            insurance_type=self.motor, insurance_company=company,
+            policy_start_date=date.today(),
+            policy_end_date=date.today() + timedelta(days=365),
+            policy_tenure_months=12, premium_amount=Decimal('10000'),
+            gst_amount=Decimal('1800'), total_premium_with_gst=Decimal('11800'),
+            sum_insured=Decimal('500000'),
+        )
+    
+    def test_policy_refresh_only_when_type_membership_changes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            policy = self.make_policy()
+        self.assertEqual(InsuranceTypeStats.objects.get(pk=self.motor.pk).policy_count, 1)
+        
+        with mock.patch('apps.catalog.models.schedule_stats_refresh') as schedule:
+            policy.status = 'EXPIRED'
+            policy.save()
+            Policy.objects.get(pk=policy.pk).save()
+        schedule.assert_not_called()
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            health = InsuranceType.objects.create(type_name='Health', type_code='HEALTH')
+        with self.captureOnCommitCallbacks(execute=True):
+            policy.insurance_type = health
+            policy.save()
+        self.assertEqual(InsuranceTypeStats.objects.get(pk=self.motor.pk).policy_count, 0)
+        self.assertEqual(InsuranceTypeStats.objects.get(pk=health.pk).policy_count, 1)
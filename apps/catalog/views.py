@@ -14,11 +14,20 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
-from django.db.models import Q, Count
+from rest_framework.utils.encoders import JSONEncoder
+from django.db.models import Count
+from django.http import StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.vary import vary_on_headers
 
-from apps.accounts.permissions import IsAdmin
+from apps.accounts.permissions import IsAdmin, is_request_admin
 
-from .models import InsuranceType, InsuranceCompany, CoverageType, RiderAddon
+from .models import (
+    InsuranceType, InsuranceCompany, CoverageType, RiderAddon, explore_cache_version
+)
+from .renderers import ORJSONRenderer
+from .search import text_search
 from .serializers import (
     InsuranceTypeSerializer,
     InsuranceTypeDetailSerializer,
@@ -26,9 +35,21 @@ from .serializers import (
     InsuranceCompanyListSerializer,
     CoverageTypeSerializer,
     RiderAddonSerializer,
+    ExploreProductSerializer,
 )
 
 
+def stream_json_array(rows):
+    """Yield a JSON array of rows chunk by chunk."""
+    encoder = JSONEncoder()
+    yield '['
+    for index, row in enumerate(rows):
+        if index:
+            yield ','
+        yield from encoder.iterencode(row)
+    yield ']'
+
+
 class InsuranceTypeViewSet(viewsets.ModelViewSet):
     """
     API endpoint for insurance types.
@@ -41,7 +62,7 @@ class InsuranceTypeViewSet(viewsets.ModelViewSet):
     
     Search params: ?q= (name, category, description)
     """
-    queryset = InsuranceType.objects.prefetch_related('coverage_types', 'addons').all()
+    queryset = InsuranceType.objects.all()
     
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -56,20 +77,27 @@ class InsuranceTypeViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         queryset = super().get_queryset()
         
+        # Detail nests children; everything else only needs their counts
+        if self.action == 'retrieve':
+            queryset = queryset.prefetch_related('coverage_types', 'addons')
+        else:
+            # Aggregates drop Meta.ordering, so restate it for pagination
+            queryset = queryset.annotate(
+                coverages_count=Count('coverage_types', distinct=True),
+                addons_count=Count('addons', distinct=True)
+            ).order_by('type_name')
+        
         # Non-admin users only see active types
         if self.action in ['list', 'retrieve']:
-            if not self.request.user.is_authenticated:
-                queryset = queryset.filter(is_active=True)
-            elif not self.request.user.user_roles.filter(role__role_name='ADMIN').exists():
+            if not is_request_admin(self.request):
                 queryset = queryset.filter(is_active=True)
         
         # Search functionality
         search_query = self.request.query_params.get('q', '').strip()
         if search_query:
-            queryset = queryset.filter(
-                Q(type_name__icontains=search_query) |
-                Q(type_code__icontains=search_query) |
-                Q(description__icontains=search_query)
+            queryset = text_search(
+                queryset, search_query,
+                ('type_name', 'type_code', 'description')
             )
         
         # Filter by category (type_code)
@@ -77,7 +105,7 @@ class InsuranceTypeViewSet(viewsets.ModelViewSet):
         if category:
             queryset = queryset.filter(type_code__iexact=category)
         
-        return queryset.distinct()
+        return queryset
 
 
 class InsuranceCompanyViewSet(viewsets.ModelViewSet):
@@ -91,6 +119,9 @@ class InsuranceCompanyViewSet(viewsets.ModelViewSet):
     DELETE /api/v1/companies/{id}/    - Delete company (Admin)
     
     Search params: ?q= (name, code, registration), ?min_rating=, ?max_rating=
+    
+    List with ?stream=true returns every matching company as one JSON
+    array, streamed in chunks instead of paginated.
     """
     queryset = InsuranceCompany.objects.all()
     
@@ -104,34 +135,51 @@ class InsuranceCompanyViewSet(viewsets.ModelViewSet):
             return [AllowAny()]
         return [IsAuthenticated(), IsAdmin()]
     
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get('stream') != 'true':
+            return super().list(request, *args, **kwargs)
+        
+        # Serialize row by row off a server-side cursor
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer_class = self.get_serializer_class()
+        context = self.get_serializer_context()
+        rows = (
+            serializer_class(company, context=context).data
+            for company in queryset.iterator(chunk_size=500)
+        )
+        return StreamingHttpResponse(
+            stream_json_array(rows), content_type='application/json'
+        )
+    
     def get_queryset(self):
         queryset = super().get_queryset()
         
+        # List serializer only needs the card columns
+        if self.action == 'list':
+            queryset = queryset.only(*InsuranceCompanyListSerializer.Meta.fields)
+        
         if self.action in ['list', 'retrieve']:
-            if not self.request.user.is_authenticated:
-                queryset = queryset.filter(is_active=True)
-            elif not self.request.user.user_roles.filter(role__role_name='ADMIN').exists():
+            if not is_request_admin(self.request):
                 queryset = queryset.filter(is_active=True)
         
         # Search functionality
         search_query = self.request.query_params.get('q', '').strip()
         if search_query:
-            queryset = queryset.filter(
-                Q(company_name__icontains=search_query) |
-                Q(company_code__icontains=search_query) |
-                Q(registration_number__icontains=search_query)
+            queryset = text_search(
+                queryset, search_query,
+                ('company_name', 'company_code', 'registration_number')
             )
         
         # Filter by rating
         min_rating = self.request.query_params.get('min_rating')
         if min_rating:
-            queryset = queryset.filter(rating__gte=min_rating)
+            queryset = queryset.filter(service_rating__gte=min_rating)
         
         max_rating = self.request.query_params.get('max_rating')
         if max_rating:
-            queryset = queryset.filter(rating__lte=max_rating)
+            queryset = queryset.filter(service_rating__lte=max_rating)
         
-        return queryset.distinct()
+        return queryset
 
 
 class CoverageTypeViewSet(viewsets.ModelViewSet):
@@ -148,6 +196,11 @@ class CoverageTypeViewSet(viewsets.ModelViewSet):
     """
     queryset = CoverageType.objects.select_related('insurance_type').all()
     serializer_class = CoverageTypeSerializer
+    list_fields = (
+        'id', 'coverage_name', 'coverage_code', 'insurance_type__type_name',
+        'description', 'is_mandatory', 'base_premium_per_unit',
+        'unit_of_measurement', 'created_at', 'updated_at',
+    )
     
     def get_permissions(self):
         if self.action in ['list', 'retrieve']:
@@ -157,13 +210,17 @@ class CoverageTypeViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         queryset = super().get_queryset()
         
+        # Only the parent's name is serialized, not the whole joined row
+        if self.action == 'list':
+            queryset = queryset.only(*self.list_fields)
+        
         # Search functionality
         search_query = self.request.query_params.get('q', '').strip()
         if search_query:
-            queryset = queryset.filter(
-                Q(coverage_name__icontains=search_query) |
-                Q(description__icontains=search_query) |
-                Q(insurance_type__type_name__icontains=search_query)
+            queryset = text_search(
+                queryset, search_query,
+                ('coverage_name', 'description'),
+                related_fields=('insurance_type__type_name',)
             )
         
         # Filter by insurance type
@@ -171,7 +228,7 @@ class CoverageTypeViewSet(viewsets.ModelViewSet):
         if insurance_type_id:
             queryset = queryset.filter(insurance_type_id=insurance_type_id)
         
-        return queryset.distinct()
+        return queryset
 
 
 class RiderAddonViewSet(viewsets.ModelViewSet):
@@ -188,6 +245,11 @@ class RiderAddonViewSet(viewsets.ModelViewSet):
     """
     queryset = RiderAddon.objects.select_related('insurance_type').all()
     serializer_class = RiderAddonSerializer
+    list_fields = (
+        'id', 'addon_name', 'addon_code', 'insurance_type__type_name',
+        'description', 'premium_percentage', 'is_optional',
+        'max_coverage_limit', 'created_at', 'updated_at',
+    )
     
     def get_permissions(self):
         if self.action in ['list', 'retrieve']:
@@ -197,13 +259,17 @@ class RiderAddonViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         queryset = super().get_queryset()
         
+        # Only the parent's name is serialized, not the whole joined row
+        if self.action == 'list':
+            queryset = queryset.only(*self.list_fields)
+        
         # Search functionality
         search_query = self.request.query_params.get('q', '').strip()
         if search_query:
-            queryset = queryset.filter(
-                Q(addon_name__icontains=search_query) |
-                Q(description__icontains=search_query) |
-                Q(insurance_type__type_name__icontains=search_query)
+            queryset = text_search(
+                queryset, search_query,
+                ('addon_name', 'description'),
+                related_fields=('insurance_type__type_name',)
             )
         
         # Filter by insurance type
@@ -211,187 +277,223 @@ class RiderAddonViewSet(viewsets.ModelViewSet):
         if insurance_type_id:
             queryset = queryset.filter(insurance_type_id=insurance_type_id)
         
-        return queryset.distinct()
+        return queryset
 
 
-from rest_framework.views import APIView
+import hashlib
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db.models import DecimalField, FloatField, Prefetch, Value
+from django.db.models.functions import Cast, Coalesce
+from rest_framework import generics
+from rest_framework.pagination import CursorPagination
+from rest_framework.renderers import BrowsableAPIRenderer
 from apps.policies.models import Policy
 
+# Seconds an explore result count is reused before recounting
+EXPLORE_COUNT_TTL = 60
+
+# Seconds a rendered explore response is reused (catalog writes
+# invalidate earlier, see catalog.models.explore_cache_version)
+EXPLORE_RESPONSE_TTL = 300
 
-class PolicyExploreView(APIView):
+# Seconds the explore filter options (categories, companies) are reused
+EXPLORE_FILTERS_TTL = 3600
+
+
+class CatalogCursorPagination(CursorPagination):
+    """
+    Cursor pagination for the explore catalog.
+    
+    Pages are fetched with a keyset WHERE on the sort column instead of
+    OFFSET. The ordering follows the view's ?sort= param; type name
+    breaks ties, matching the default ordering.
+    """
+    page_size = 10
+    page_size_query_param = 'per_page'
+    max_page_size = 50
+    ordering = ('-policy_count', 'type_name')
+    
+    SORT_ORDERINGS = {
+        'premium_asc': ('min_base', 'type_name'),
+        'premium_desc': ('-max_base', 'type_name'),
+        'popular': ('-policy_count', 'type_name'),
+    }
+    
+    def get_ordering(self, request, queryset, view):
+        sort_by = request.query_params.get('sort', 'popular')
+        return self.SORT_ORDERINGS.get(sort_by, ('type_name',))
+    
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'count': self.view.get_total_count(),
+            'filters': self.view.get_filters(),
+            'results': data,
+        })
+    
+    def paginate_queryset(self, queryset, request, view=None):
+        self.view = view
+        return super().paginate_queryset(queryset, request, view)
+
+
+class PolicyExploreView(generics.ListAPIView):
     """
     API endpoint for policy marketplace/discovery.
     
     GET /api/v1/policies/explore/
     
-    This is a READ-ONLY marketplace endpoint for customers to browse
-    available insurance products (NOT their purchased policies).
+    This is a READ-ONLY, public marketplace endpoint for browsing
+    available insurance products (NOT anyone's purchased policies).
     
     Query params:
     - q: Search term (insurance type, company name)
-    - insurance_type: Filter by insurance type ID
     - company: Filter by company ID
     - min_premium: Minimum premium range
     - max_premium: Maximum premium range
     - category: Filter by category (health, life, auto, etc.)
     - sort: Sorting option (premium_asc, premium_desc, popular, rating)
-    - page: Page number for pagination
+    - cursor / per_page: Cursor pagination (follow the next/previous links)
     """
-    permission_classes = [IsAuthenticated]
+    # Public catalog data: no per-visitor auth lookup, and shared caches
+    # (browser/CDN) may hold a response as long as the server-side cache
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    serializer_class = ExploreProductSerializer
+    pagination_class = CatalogCursorPagination
+    
+    @method_decorator(cache_control(public=True, max_age=EXPLORE_RESPONSE_TTL))
+    @method_decorator(vary_on_headers('Accept-Language'))
+    def list(self, request, *args, **kwargs):
+        # The payload doesn't depend on the user, only on the query params
+        params = '&'.join(
+            f'{key}={value}' for key, value in sorted(request.query_params.items())
+        )
+        cache_key = 'policy_explore:{}:{}'.format(
+            explore_cache_version(), hashlib.md5(params.encode()).hexdigest()
+        )
+        data = cache.get(cache_key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(cache_key, data, EXPLORE_RESPONSE_TTL)
+        return Response(data)
     
-    def get(self, request):
-        # Get all active insurance types with their companies and coverages
+    def get_queryset(self):
+        """Active insurance types with popularity and base premium range."""
+        params = self.request.query_params
+        
+        # Aggregates are read from the precomputed InsuranceTypeStats row
+        # (a type whose row hasn't been written yet reads as zeros)
         queryset = InsuranceType.objects.filter(
             is_active=True
         ).prefetch_related(
-            'coverage_types',
-            'addons'
+            # Only the columns ExploreCoverageSerializer reads (plus the FK
+            # the prefetch joins on); add-ons aren't part of the payload
+            Prefetch('coverage_types', queryset=CoverageType.objects.only(
+                'id', 'insurance_type', 'coverage_name', 'description',
+                'base_premium_per_unit', 'is_mandatory'
+            ))
         ).annotate(
-            policy_count=Count('policies')
+            policy_count=Coalesce('explore_stats__policy_count', 0),
+            coverage_count=Coalesce('explore_stats__coverage_count', 0),
+            min_base=Coalesce(
+                'explore_stats__min_base',
+                Value(Decimal('0')), output_field=DecimalField()
+            ),
+            max_base=Coalesce(
+                'explore_stats__max_base',
+                Value(Decimal('0')), output_field=DecimalField()
+            ),
         )
         
         # Search functionality
-        search_query = request.query_params.get('q', '').strip()
+        search_query = params.get('q', '').strip()
         if search_query:
-            queryset = queryset.filter(
-                Q(type_name__icontains=search_query) |
-                Q(type_code__icontains=search_query) |
-                Q(description__icontains=search_query)
+            queryset = text_search(
+                queryset, search_query,
+                ('type_name', 'type_code', 'description')
             )
         
         # Filter by category (using type_code)
-        category = request.query_params.get('category')
+        category = params.get('category')
         if category:
             queryset = queryset.filter(type_code__iexact=category)
         
+        # Filter by premium range
+        min_premium = params.get('min_premium')
+        if min_premium:
+            queryset = queryset.filter(max_base__gte=min_premium)
+        
+        max_premium = params.get('max_premium')
+        if max_premium:
+            queryset = queryset.filter(min_base__lte=max_premium)
+        
+        return queryset
+    
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context['companies'] = self.get_companies_data()
+        return context
+    
+    def get_companies_data(self):
+        """Company payload shared by every product; built once."""
         # Get active companies
         companies = InsuranceCompany.objects.filter(is_active=True)
         
         # Filter by company
-        company_id = request.query_params.get('company')
+        company_id = self.request.query_params.get('company')
         if company_id:
             companies = companies.filter(id=company_id)
         
         # Filter by rating
-        min_rating = request.query_params.get('min_rating')
+        min_rating = self.request.query_params.get('min_rating')
         if min_rating:
-            companies = companies.filter(rating__gte=min_rating)
-        
-        # Build product catalog
-        products = []
+            companies = companies.filter(service_rating__gte=min_rating)
         
-        for ins_type in queryset:
-            # Get coverages for this type (no is_active field in CoverageType)
-            coverages = list(ins_type.coverage_types.all().values(
-                'id', 'coverage_name', 'description', 'base_premium_per_unit', 'is_mandatory'
-            ))
-            
-            # Calculate base premium range
-            premium_values = [c['base_premium_per_unit'] for c in coverages if c['base_premium_per_unit']]
-            min_base = min(premium_values) if premium_values else 0
-            max_base = max(premium_values) if premium_values else 0
-            
-            # Filter by premium range
-            min_premium = request.query_params.get('min_premium')
-            max_premium = request.query_params.get('max_premium')
-            
-            if min_premium and max_base < float(min_premium):
-                continue
-            if max_premium and min_base > float(max_premium):
-                continue
-            
-            # Determine badges based on rules
-            badges = []
-            
-            # Get the type code as category proxy
-            type_category = ins_type.type_code.upper()
-            
-            # Most Popular - based on policy count
-            if ins_type.policy_count >= 5:
-                badges.append({'type': 'popular', 'label': 'Most Popular'})
-            
-            # Best for Families - health with multiple coverages
-            if 'HEALTH' in type_category and len(coverages) >= 3:
-                badges.append({'type': 'family', 'label': 'Best for Families'})
-            
-            # Budget Friendly - lowest base premium
-            if min_base and min_base <= 5000:
-                badges.append({'type': 'budget', 'label': 'Budget Friendly'})
-            
-            # High Coverage - high sum insured options
-            if max_base and max_base >= 50000:
-                badges.append({'type': 'premium', 'label': 'Premium Protection'})
-            
-            # Get applicable companies
-            applicable_companies = []
-            for company in companies:
-                applicable_companies.append({
-                    'id': company.id,
-                    'name': company.company_name,
-                    'logo': company.logo_url if company.logo_url else None,
-                    'rating': float(company.service_rating) if company.service_rating else None,
-                    'claim_ratio': float(company.claim_settlement_ratio) if company.claim_settlement_ratio else None,
-                })
-            
-            # Map type_code to icon names
-            icon_map = {
-                'MOTOR': 'car-front',
-                'HEALTH': 'heart-pulse',
-                'TRAVEL': 'airplane',
-                'WC': 'briefcase',
-                'CPM': 'building',
+        # Ratings come back already cast to float by the database
+        return [
+            {
+                'id': company['id'],
+                'name': company['company_name'],
+                'logo': company['logo_url'] or None,
+                'rating': company['rating'] or None,
+                'claim_ratio': company['claim_ratio'] or None,
             }
-            
-            products.append({
-                'id': ins_type.id,
-                'name': ins_type.type_name,
-                'category': ins_type.type_code,  # Use type_code as category
-                'description': ins_type.description,
-                'icon': icon_map.get(ins_type.type_code, 'shield'),
-                'base_premium_range': {
-                    'min': float(min_base) if min_base else 0,
-                    'max': float(max_base) if max_base else 0,
-                },
-                'coverages': coverages[:5],  # Top 5 coverages
-                'total_coverages': len(coverages),
-                'badges': badges,
-                'companies': applicable_companies,
-                'policy_count': ins_type.policy_count,
-            })
-        
-        # Sorting
-        sort_by = request.query_params.get('sort', 'popular')
-        if sort_by == 'premium_asc':
-            products.sort(key=lambda x: x['base_premium_range']['min'])
-        elif sort_by == 'premium_desc':
-            products.sort(key=lambda x: x['base_premium_range']['max'], reverse=True)
-        elif sort_by == 'popular':
-            products.sort(key=lambda x: x['policy_count'], reverse=True)
-        
-        # Simple pagination
-        page = int(request.query_params.get('page', 1))
-        per_page = int(request.query_params.get('per_page', 10))
-        start = (page - 1) * per_page
-        end = start + per_page
-        
-        paginated_products = products[start:end]
-        
-        # Get available categories for filters (use type_code as category)
-        categories = list(InsuranceType.objects.filter(
-            is_active=True
-        ).values_list('type_code', flat=True).distinct())
-        
-        return Response({
-            'count': len(products),
-            'page': page,
-            'per_page': per_page,
-            'total_pages': (len(products) + per_page - 1) // per_page,
-            'filters': {
-                'categories': categories,
-                'companies': list(InsuranceCompany.objects.filter(
-                    is_active=True
-                ).values('id', 'company_name')),
-            },
-            'results': paginated_products
-        })
-
+            for company in companies.annotate(
+                rating=Cast('service_rating', FloatField()),
+                claim_ratio=Cast('claim_settlement_ratio', FloatField()),
+            ).values('id', 'company_name', 'logo_url', 'rating', 'claim_ratio')
+        ]
+    
+    def get_total_count(self):
+        """Short-lived cached count keyed by the params that shape the queryset."""
+        count_params = '|'.join(
+            f"{param}={self.request.query_params.get(param, '').strip()}"
+            for param in ('q', 'category', 'min_premium', 'max_premium')
+        )
+        count_key = 'policy_explore_count:{}:{}'.format(
+            explore_cache_version(), hashlib.md5(count_params.encode()).hexdigest()
+        )
+        return cache.get_or_set(count_key, self.get_queryset().count, EXPLORE_COUNT_TTL)
+    
+    def get_filters(self):
+        """Available categories (type codes) and companies for filters."""
+        # Rarely changes; catalog writes bump the version in the key
+        return cache.get_or_set(
+            f'policy_explore_filters:{explore_cache_version()}',
+            self.build_filters, EXPLORE_FILTERS_TTL
+        )
+    
+    def build_filters(self):
+        return {
+            # Ordered by code so (is_active, type_code) covers the query
+            'categories': list(InsuranceType.objects.filter(
+                is_active=True
+            ).order_by('type_code').values_list('type_code', flat=True).distinct()),
+            'companies': list(InsuranceCompany.objects.filter(
+                is_active=True
+            ).values('id', 'company_name')),
+        }
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:36
+
+from django.db import migrations, models
+
+
+def backfill_cached_fields(apps, schema_editor):
+    Claim = apps.get_model('claims', 'Claim')
+    claims = list(
+        Claim.objects.select_related('policy', 'customer__user')
+        .only('policy__policy_number', 'customer__user__first_name', 'customer__user__last_name')
+    )
+    for claim in claims:
+        user = claim.customer.user
+        claim.customer_name_cached = f"{user.first_name} {user.last_name}".strip()
+        claim.policy_number_cached = claim.policy.policy_number
+    Claim.objects.bulk_update(
+        claims, ['customer_name_cached', 'policy_number_cached'], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0002_claimassessment_claimsettlement_claimstatushistory'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='claim',
+            name='customer_name_cached',
+            field=models.CharField(blank=True, editable=False, max_length=301),
+        ),
+        migrations.AddField(
+            model_name='claim',
+            name='policy_number_cached',
+            field=models.CharField(blank=True, editable=False, max_length=100),
+        ),
+        migrations.RunPython(backfill_cached_fields, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:38
+
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_submitted_on(apps, schema_editor):
+    Claim = apps.get_model('claims', 'Claim')
+    claims = list(Claim.objects.only('submitted_at'))
+    for claim in claims:
+        claim.submitted_on = timezone.localdate(claim.submitted_at)
+    Claim.objects.bulk_update(claims, ['submitted_on'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0003_claim_denormalized_list_fields'),
+        ('customers', '0003_fleet_fleetriskscore_fleetvehicle_fleetclaimhistory'),
+        ('policies', '0002_remove_payment_payments_payment_aebcb7_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='claim',
+            name='submitted_on',
+            field=models.DateField(default=django.utils.timezone.localdate, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['submitted_on', 'status'], name='claims_submitt_31d7a6_idx'),
+        ),
+        migrations.RunPython(backfill_submitted_on, migrations.RunPython.noop),
+    ]
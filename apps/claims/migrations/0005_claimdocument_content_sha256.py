@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0004_claim_submitted_on'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='claimdocument',
+            name='content_sha256',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+    ]
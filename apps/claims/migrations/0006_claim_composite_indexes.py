@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0005_claimdocument_content_sha256'),
+        ('customers', '0003_fleet_fleetriskscore_fleetvehicle_fleetclaimhistory'),
+        ('policies', '0002_remove_payment_payments_payment_aebcb7_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # Add before removing: MySQL needs an index covering the customer FK
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['customer', '-submitted_at'], name='claims_custome_719666_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['status', '-submitted_at'], name='claims_status_17cad0_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='claim',
+            name='claims_custome_d90b87_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='claim',
+            name='claims_status_cb731f_idx',
+        ),
+    ]
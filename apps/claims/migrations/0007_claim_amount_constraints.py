@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:43
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Q, Subquery
+from django.db.models.functions import Greatest
+
+
+def backfill_sum_insured(apps, schema_editor):
+    Claim = apps.get_model('claims', 'Claim')
+    Policy = apps.get_model('policies', 'Policy')
+    # The sum insured at filing time is not recorded anywhere, so use the
+    # policy's current one, raised to the requested amount for claims
+    # filed before the sum insured was lowered
+    Claim.objects.update(policy_sum_insured_at_submit=Greatest(
+        Subquery(Policy.objects.filter(pk=OuterRef('policy_id')).values('sum_insured')[:1]),
+        F('amount_requested'),
+    ))
+
+
+def check_claim_amounts(apps, schema_editor):
+    """Name the legacy claims that would fail the amount CHECKs."""
+    Claim = apps.get_model('claims', 'Claim')
+    violators = Claim.objects.filter(
+        Q(amount_approved__gt=F('amount_requested'))
+        | Q(amount_settled__gt=F('amount_approved'))
+    ).values_list('claim_number', flat=True)
+    if violators:
+        raise RuntimeError(
+            "Claims with approved > requested or settled > approved amounts must be "
+            f"corrected before adding the amount constraints: {', '.join(violators)}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0006_claim_composite_indexes'),
+        ('customers', '0003_fleet_fleetriskscore_fleetvehicle_fleetclaimhistory'),
+        ('policies', '0002_remove_payment_payments_payment_aebcb7_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='claim',
+            name='policy_sum_insured_at_submit',
+            field=models.DecimalField(decimal_places=2, default=0, editable=False, help_text='Policy sum insured when the claim was filed', max_digits=15),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_sum_insured, migrations.RunPython.noop),
+        migrations.RunPython(check_claim_amounts, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='claim',
+            constraint=models.CheckConstraint(condition=models.Q(('amount_requested__lte', models.F('policy_sum_insured_at_submit'))), name='claim_amount_le_sum_insured'),
+        ),
+        migrations.AddConstraint(
+            model_name='claim',
+            constraint=models.CheckConstraint(condition=models.Q(('amount_approved__isnull', True), ('amount_approved__lte', models.F('amount_requested')), _connector='OR'), name='claim_approved_le_requested'),
+        ),
+        migrations.AddConstraint(
+            model_name='claim',
+            constraint=models.CheckConstraint(condition=models.Q(('amount_settled__isnull', True), ('amount_settled__lte', models.F('amount_approved')), _connector='OR'), name='claim_settled_le_approved'),
+        ),
+    ]
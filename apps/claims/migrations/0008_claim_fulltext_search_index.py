@@ -0,0 +1,36 @@
+from django.db import migrations
+
+
+# Columns searched together by ClaimViewSet through catalog.search.text_search
+FULLTEXT_COLUMNS = ('claim_number', 'policy_number_cached', 'customer_name_cached')
+INDEX_NAME = 'claims_search_ft'
+
+
+def add_fulltext_index(apps, schema_editor):
+    """FULLTEXT/ngram is MySQL-only; other backends keep icontains scans."""
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    quote = schema_editor.quote_name
+    # The default stopword list drops every ngram containing e.g. 'a'
+    schema_editor.execute('SET SESSION innodb_ft_enable_stopword = OFF')
+    schema_editor.execute('ALTER TABLE {} ADD FULLTEXT INDEX {} ({}) WITH PARSER ngram'.format(
+        quote('claims'), quote(INDEX_NAME), ', '.join(quote(column) for column in FULLTEXT_COLUMNS)
+    ))
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    quote = schema_editor.quote_name
+    schema_editor.execute('ALTER TABLE {} DROP INDEX {}'.format(quote('claims'), quote(INDEX_NAME)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0007_claim_amount_constraints'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_fulltext_index, drop_fulltext_index),
+    ]
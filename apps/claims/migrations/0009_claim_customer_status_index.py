@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0008_claim_fulltext_search_index'),
+        ('customers', '0003_fleet_fleetriskscore_fleetvehicle_fleetclaimhistory'),
+        ('policies', '0002_remove_payment_payments_payment_aebcb7_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='claim',
+            index=models.Index(fields=['customer', 'status', '-submitted_at'], name='claims_custome_ee16da_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def drop_duplicate_pending_assessments(apps, schema_editor):
+    """
+    Keep the most recently updated assessment per (claim, surveyor) and
+    drop extra copies that were never worked on. Duplicates with
+    findings are left alone (and will fail the constraint loudly).
+    """
+    ClaimAssessment = apps.get_model('claims', 'ClaimAssessment')
+    seen = set()
+    duplicate_ids = []
+    rows = ClaimAssessment.objects.order_by('claim_id', 'surveyor_id', '-updated_at').values_list(
+        'pk', 'claim_id', 'surveyor_id', 'assessment_status'
+    )
+    for assessment_id, claim_id, surveyor_id, status in rows.iterator():
+        key = (claim_id, surveyor_id)
+        if key not in seen:
+            seen.add(key)
+        elif status == 'PENDING':
+            duplicate_ids.append(assessment_id)
+    ClaimAssessment.objects.filter(pk__in=duplicate_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('claims', '0009_claim_customer_status_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_pending_assessments, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='claimassessment',
+            constraint=models.UniqueConstraint(fields=('claim', 'surveyor'), name='claim_assessment_one_per_surveyor'),
+        ),
+    ]
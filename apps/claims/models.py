@@ -17,14 +17,25 @@ Business Rules:
 
 from django.db import models
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
+from datetime import timedelta
 from decimal import Decimal
+import hashlib
+import time
 import uuid
 
 
 def generate_claim_number():
-    """Generate unique claim number."""
-    return f"CLM-{timezone.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:8].upper()}"
+    """
+    Generate unique claim number.
+    
+    48 random bits per day prefix, so collisions stay negligible far
+    beyond realistic daily claim volumes.
+    """
+    return f"CLM-{timezone.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:12].upper()}"
 
 
 class Claim(models.Model):
@@ -92,6 +103,10 @@ class Claim(models.Model):
         max_digits=15, decimal_places=2, null=True, blank=True,
         help_text="Amount actually settled"
     )
+    policy_sum_insured_at_submit = models.DecimalField(
+        max_digits=15, decimal_places=2, editable=False,
+        help_text="Policy sum insured when the claim was filed"
+    )
     
     # Status
     status = models.CharField(
@@ -101,6 +116,8 @@ class Claim(models.Model):
     
     # Workflow timestamps
     submitted_at = models.DateTimeField(auto_now_add=True)
+    # Local date of submitted_at, so SLA filters compare an indexed date
+    submitted_on = models.DateField(default=timezone.localdate, editable=False)
     review_started_at = models.DateTimeField(null=True, blank=True)
     approved_at = models.DateTimeField(null=True, blank=True)
     rejected_at = models.DateTimeField(null=True, blank=True)
@@ -121,6 +138,11 @@ class Claim(models.Model):
         null=True, blank=True, related_name='settled_claims'
     )
     
+    # Copies of customer name / policy number for list rows, kept in
+    # sync by the User and Policy post_save receivers below
+    customer_name_cached = models.CharField(max_length=301, blank=True, editable=False)
+    policy_number_cached = models.CharField(max_length=100, blank=True, editable=False)
+    
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -130,14 +152,99 @@ class Claim(models.Model):
         ordering = ['-submitted_at']
         indexes = [
             models.Index(fields=['policy']),
-            models.Index(fields=['customer']),
-            models.Index(fields=['status']),
+            models.Index(fields=['customer', '-submitted_at']),
+            models.Index(fields=['customer', 'status', '-submitted_at']),
+            models.Index(fields=['status', '-submitted_at']),
             models.Index(fields=['submitted_at']),
+            # Open-claim SLA scans (see overdue_q)
+            models.Index(fields=['submitted_on', 'status']),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(amount_requested__lte=models.F('policy_sum_insured_at_submit')),
+                name='claim_amount_le_sum_insured',
+            ),
+            models.CheckConstraint(
+                condition=models.Q(amount_approved__isnull=True)
+                | models.Q(amount_approved__lte=models.F('amount_requested')),
+                name='claim_approved_le_requested',
+            ),
+            models.CheckConstraint(
+                condition=models.Q(amount_settled__isnull=True)
+                | models.Q(amount_settled__lte=models.F('amount_approved')),
+                name='claim_settled_le_approved',
+            ),
         ]
     
+    # Statuses that no longer count against the SLA
+    SLA_COMPLETE_STATUSES = ['SETTLED', 'CLOSED', 'REJECTED']
+    
     def __str__(self):
         return f"{self.claim_number} - {self.status}"
     
+    def save(self, *args, **kwargs):
+        if self._state.adding:
+            self.customer_name_cached = self.customer.user.get_full_name()
+            self.policy_number_cached = self.policy.policy_number
+            self.policy_sum_insured_at_submit = self.policy.sum_insured
+        super().save(*args, **kwargs)
+    
+    @classmethod
+    def list_qs(cls):
+        """Claims with the policy and customer user joined for list rows."""
+        return cls.objects.select_related('policy', 'customer__user')
+    
+    @classmethod
+    def list_row_qs(cls):
+        """
+        Only the columns ClaimListSerializer renders, skipping the text
+        fields. Reading any other field on these rows costs a query each.
+        """
+        return cls.objects.only(
+            'id', 'claim_number', 'policy_number_cached', 'customer_name_cached',
+            'claim_type', 'amount_requested', 'status', 'submitted_at', 'created_at'
+        )
+    
+    @classmethod
+    def review_list_qs(cls):
+        """
+        list_row_qs plus the customer user's name and email, for the
+        backoffice list that falls back to the email for unnamed users.
+        """
+        return cls.objects.select_related('customer__user').only(
+            'id', 'claim_number', 'policy_number_cached', 'claim_type',
+            'amount_requested', 'status', 'created_at',
+            'customer__user__first_name', 'customer__user__last_name',
+            'customer__user__email'
+        )
+    
+    @classmethod
+    def detail_qs(cls):
+        """list_qs plus documents and their uploaders for detail pages."""
+        return cls.list_qs().prefetch_related(
+            models.Prefetch(
+                'documents',
+                queryset=ClaimDocument.objects.select_related('uploaded_by')
+            )
+        )
+    
+    @classmethod
+    def overdue_q(cls, sla_days=None):
+        """
+        Q matching open claims past the SLA (CLAIM_SLA_DAYS by default),
+        i.e. those get_sla_status reports with within_sla False.
+        """
+        if sla_days is None:
+            from apps.catalog.models import BusinessConfiguration
+            sla_days = BusinessConfiguration.get_int('CLAIM_SLA_DAYS', 15)
+        cutoff = timezone.localdate() - timedelta(days=sla_days)
+        return models.Q(submitted_on__lt=cutoff) & ~models.Q(status__in=cls.SLA_COMPLETE_STATUSES)
+    
+    @classmethod
+    def overdue(cls, sla_days=None):
+        """Open claims past the SLA, oldest first."""
+        return cls.objects.filter(cls.overdue_q(sla_days)).order_by('submitted_on')
+    
     def start_review(self, user):
         """Start reviewing the claim."""
         if self.status != 'SUBMITTED':
@@ -146,7 +253,7 @@ class Claim(models.Model):
         self.status = 'UNDER_REVIEW'
         self.review_started_at = timezone.now()
         self.reviewed_by = user
-        self.save()
+        self.save(update_fields=['status', 'review_started_at', 'reviewed_by', 'updated_at'])
     
     def approve(self, user, approved_amount):
         """
@@ -164,7 +271,9 @@ class Claim(models.Model):
         self.amount_approved = approved_amount
         self.approved_at = timezone.now()
         self.reviewed_by = user
-        self.save()
+        self.save(update_fields=[
+            'status', 'amount_approved', 'approved_at', 'reviewed_by', 'updated_at'
+        ])
     
     def reject(self, user, reason):
         """Reject the claim."""
@@ -178,7 +287,9 @@ class Claim(models.Model):
         self.rejection_reason = reason
         self.rejected_at = timezone.now()
         self.reviewed_by = user
-        self.save()
+        self.save(update_fields=[
+            'status', 'rejection_reason', 'rejected_at', 'reviewed_by', 'updated_at'
+        ])
     
     def settle(self, user, settled_amount=None):
         """
@@ -189,14 +300,34 @@ class Claim(models.Model):
         if self.status != 'APPROVED':
             raise ValueError("Only approved claims can be settled.")
         
-        if not self.amount_approved:
-            raise ValueError("Approved amount must be set before settlement.")
+        settled_amount = self.checked_settlement_amount(settled_amount)
         
         self.status = 'SETTLED'
-        self.amount_settled = settled_amount or self.amount_approved
+        self.amount_settled = settled_amount
         self.settled_at = timezone.now()
         self.settled_by = user
-        self.save()
+        self.save(update_fields=[
+            'status', 'amount_settled', 'settled_at', 'settled_by', 'updated_at'
+        ])
+    
+    def checked_settlement_amount(self, settled_amount=None):
+        """
+        Amount to settle this claim at; defaults to the approved amount.
+        
+        Business Rule: 0 < settled amount ≤ amount_approved
+        """
+        if not self.amount_approved:
+            raise ValueError(f"Claim {self.claim_number} must be approved before settlement.")
+        
+        if settled_amount is None:
+            return self.amount_approved
+        if settled_amount <= 0:
+            raise ValueError(f"Settled amount must be positive for {self.claim_number}.")
+        if settled_amount > self.amount_approved:
+            raise ValueError(
+                f"Settled amount cannot exceed approved amount for {self.claim_number}."
+            )
+        return settled_amount
     
     def close(self, user):
         """Close the claim."""
@@ -205,7 +336,7 @@ class Claim(models.Model):
         
         self.status = 'CLOSED'
         self.closed_at = timezone.now()
-        self.save()
+        self.save(update_fields=['status', 'closed_at', 'updated_at'])
 
 
 class ClaimDocument(models.Model):
@@ -248,6 +379,7 @@ class ClaimDocument(models.Model):
     document_name = models.CharField(max_length=255)
     document_file = models.FileField(upload_to='claim_documents/%Y/%m/')
     file_size = models.PositiveIntegerField(null=True, blank=True)
+    content_sha256 = models.CharField(max_length=64, blank=True, editable=False)
     
     # Verification
     verification_status = models.CharField(
@@ -272,8 +404,27 @@ class ClaimDocument(models.Model):
         db_table = 'claim_documents'
         ordering = ['-upload_date']
     
+    # Read size for digest_upload; bounds memory per upload
+    UPLOAD_CHUNK_SIZE = 64 * 1024
+    
     def __str__(self):
         return f"{self.document_type} - {self.claim.claim_number}"
+    
+    @classmethod
+    def digest_upload(cls, uploaded_file):
+        """
+        Stream an uploaded file once to get its size and SHA-256.
+        
+        Returns:
+            tuple: (size in bytes, hex digest)
+        """
+        digest = hashlib.sha256()
+        size = 0
+        for chunk in uploaded_file.chunks(cls.UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+        uploaded_file.seek(0)
+        return size, digest.hexdigest()
 
 
 class ClaimStatusHistory(models.Model):
@@ -372,17 +523,28 @@ class ClaimAssessment(models.Model):
     class Meta:
         db_table = 'claim_assessments'
         ordering = ['-assessment_date']
+        constraints = [
+            # One assessment per surveyor per claim, so assigning is an
+            # idempotent get_or_create even under concurrent requests
+            models.UniqueConstraint(
+                fields=['claim', 'surveyor'], name='claim_assessment_one_per_surveyor'
+            ),
+        ]
     
     def __str__(self):
         return f"Assessment: {self.claim.claim_number} by {self.surveyor.email}"
     
     def calculate_net_amount(self):
-        """Calculate net claim amount after deductible."""
+        """
+        Calculate net claim amount after deductible.
+        
+        Sets net_claim_amount without saving; the caller saves it along
+        with the rest of the assessment.
+        """
         if self.loss_amount_assessed:
             self.net_claim_amount = self.loss_amount_assessed - self.deductible_applicable
             if self.net_claim_amount < 0:
                 self.net_claim_amount = Decimal('0.00')
-            self.save(update_fields=['net_claim_amount'])
         return self.net_claim_amount
 
 
@@ -457,11 +619,56 @@ class ClaimSettlement(models.Model):
         self.settlement_reference_number = reference_number
         self.settlement_processed_at = timezone.now()
         self.settlement_date = timezone.now().date()
-        self.save()
+        self.save(update_fields=[
+            'settlement_status', 'settlement_reference_number',
+            'settlement_processed_at', 'settlement_date', 'updated_at'
+        ])
     
     def mark_failed(self, reason):
         """Mark settlement as failed."""
         self.settlement_status = 'FAILED'
         self.failure_reason = reason
-        self.save()
+        self.save(update_fields=['settlement_status', 'failure_reason', 'updated_at'])
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def sync_claim_customer_name(sender, instance, update_fields=None, **kwargs):
+    """Refresh customer_name_cached when a customer's name changes."""
+    if update_fields is not None and not {'first_name', 'last_name'} & set(update_fields):
+        return
+    full_name = instance.get_full_name()
+    if Claim.objects.filter(customer__user=instance).exclude(
+        customer_name_cached=full_name
+    ).update(customer_name_cached=full_name):
+        invalidate_claim_list_cache()
+
+
+@receiver(post_save, sender='policies.Policy')
+def sync_claim_policy_number(sender, instance, created, update_fields=None, **kwargs):
+    """Refresh policy_number_cached if a policy is renumbered."""
+    if created or (update_fields is not None and 'policy_number' not in update_fields):
+        return
+    if Claim.objects.filter(policy=instance).exclude(
+        policy_number_cached=instance.policy_number
+    ).update(policy_number_cached=instance.policy_number):
+        invalidate_claim_list_cache()
+
+
+# Backoffice claim list responses are cached under a version stamp that
+# any claim write replaces. Queryset update()/bulk_update() skip the
+# signals, so callers using them invalidate explicitly.
+CLAIM_LIST_CACHE_VERSION_KEY = 'claims_list:version'
+
+
+def claim_list_cache_version():
+    """Current claim list cache version."""
+    return cache.get_or_set(CLAIM_LIST_CACHE_VERSION_KEY, time.time_ns, None)
+
+
+def invalidate_claim_list_cache():
+    cache.set(CLAIM_LIST_CACHE_VERSION_KEY, time.time_ns(), None)
+
 
+@receiver([post_save, post_delete], sender=Claim)
+def _invalidate_claim_list_cache(sender, **kwargs):
+    invalidate_claim_list_cache()
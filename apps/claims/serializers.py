@@ -23,11 +23,10 @@ class ClaimDocumentSerializer(serializers.ModelSerializer):
 
 
 class ClaimSerializer(serializers.ModelSerializer):
-    """Serializer for Claim."""
-    customer_name = serializers.CharField(source='customer.user.get_full_name', read_only=True)
+    """Serializer for Claim, without its documents."""
+    customer_name = serializers.CharField(source='customer_name_cached', read_only=True)
     customer_email = serializers.CharField(source='customer.user.email', read_only=True)
-    policy_number = serializers.CharField(source='policy.policy_number', read_only=True)
-    documents = ClaimDocumentSerializer(many=True, read_only=True)
+    policy_number = serializers.CharField(source='policy_number_cached', read_only=True)
     
     class Meta:
         model = Claim
@@ -39,7 +38,7 @@ class ClaimSerializer(serializers.ModelSerializer):
             'status', 'rejection_reason',
             'submitted_at', 'review_started_at', 'approved_at',
             'rejected_at', 'settled_at', 'closed_at',
-            'documents', 'created_at', 'updated_at'
+            'created_at', 'updated_at'
         ]
         read_only_fields = [
             'claim_number', 'amount_approved', 'amount_settled', 'status',
@@ -49,6 +48,18 @@ class ClaimSerializer(serializers.ModelSerializer):
         ]
 
 
+class ClaimDetailSerializer(ClaimSerializer):
+    """
+    ClaimSerializer plus the claim's documents.
+    
+    Expects documents prefetched (Claim.detail_qs).
+    """
+    documents = ClaimDocumentSerializer(many=True, read_only=True)
+    
+    class Meta(ClaimSerializer.Meta):
+        fields = ClaimSerializer.Meta.fields + ['documents']
+
+
 class ClaimCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating claims."""
     
@@ -126,9 +137,14 @@ class ClaimStatusUpdateSerializer(serializers.Serializer):
 
 
 class ClaimListSerializer(serializers.ModelSerializer):
-    """Lightweight serializer for listing claims."""
-    customer_name = serializers.CharField(source='customer.user.get_full_name', read_only=True)
-    policy_number = serializers.CharField(source='policy.policy_number', read_only=True)
+    """
+    Lightweight serializer for listing claims.
+    
+    Reads the denormalized name/number columns so list queries don't
+    need to join policies or users.
+    """
+    customer_name = serializers.CharField(source='customer_name_cached', read_only=True)
+    policy_number = serializers.CharField(source='policy_number_cached', read_only=True)
     
     class Meta:
         model = Claim
@@ -137,3 +153,18 @@ class ClaimListSerializer(serializers.ModelSerializer):
             'claim_type', 'amount_requested', 'status',
             'submitted_at', 'created_at'
         ]
+
+
+class ClaimStatusResultSerializer(serializers.ModelSerializer):
+    """
+    Result of a status update: just the fields a transition changes.
+    Clients wanting the full record GET /claims/{id}/.
+    """
+    
+    class Meta:
+        model = Claim
+        fields = [
+            'id', 'claim_number', 'status',
+            'amount_approved', 'amount_settled', 'rejection_reason'
+        ]
+        read_only_fields = fields
@@ -13,9 +13,10 @@ from django.utils import timezone
 from django.db import transaction
 
 from apps.claims.models import (
-    Claim, ClaimStatusHistory, ClaimAssessment, ClaimSettlement
+    Claim, ClaimStatusHistory, ClaimAssessment, ClaimSettlement,
+    invalidate_claim_list_cache,
 )
-from apps.catalog.models import ClaimApprovalThreshold
+from apps.catalog.models import BusinessConfiguration, ClaimApprovalThreshold
 
 
 class ClaimsWorkflowService:
@@ -31,24 +32,27 @@ class ClaimsWorkflowService:
     
     # Valid status transitions
     VALID_TRANSITIONS = {
-        'SUBMITTED': ['UNDER_REVIEW'],
-        'UNDER_REVIEW': ['APPROVED', 'REJECTED', 'SURVEYOR_ASSIGNED'],
-        'SURVEYOR_ASSIGNED': ['UNDER_INVESTIGATION'],
-        'UNDER_INVESTIGATION': ['ASSESSED'],
-        'ASSESSED': ['APPROVED', 'REJECTED'],
-        'APPROVED': ['SETTLED'],
-        'SETTLED': ['CLOSED'],
-        'REJECTED': ['CLOSED'],
-        'CLOSED': [],
+        'SUBMITTED': frozenset({'UNDER_REVIEW'}),
+        'UNDER_REVIEW': frozenset({'APPROVED', 'REJECTED', 'SURVEYOR_ASSIGNED'}),
+        'SURVEYOR_ASSIGNED': frozenset({'UNDER_INVESTIGATION'}),
+        'UNDER_INVESTIGATION': frozenset({'ASSESSED'}),
+        'ASSESSED': frozenset({'APPROVED', 'REJECTED'}),
+        'APPROVED': frozenset({'SETTLED'}),
+        'SETTLED': frozenset({'CLOSED'}),
+        'REJECTED': frozenset({'CLOSED'}),
+        'CLOSED': frozenset(),
     }
     
+    # Transitions bulk_transition can apply without per-claim input
+    BULK_TRANSITIONS = ('UNDER_REVIEW', 'REJECTED', 'CLOSED')
+    
     def __init__(self, claim: Claim):
         self.claim = claim
     
     def can_transition_to(self, new_status: str) -> bool:
         """Check if transition to new status is valid."""
         current = self.claim.status
-        return new_status in self.VALID_TRANSITIONS.get(current, [])
+        return new_status in self.VALID_TRANSITIONS.get(current, ())
     
     def record_status_change(
         self,
@@ -59,16 +63,7 @@ class ClaimsWorkflowService:
         request=None
     ):
         """Record a status change in history."""
-        ip_address = None
-        user_agent = ''
-        
-        if request:
-            x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
-            if x_forwarded_for:
-                ip_address = x_forwarded_for.split(',')[0].strip()
-            else:
-                ip_address = request.META.get('REMOTE_ADDR')
-            user_agent = request.META.get('HTTP_USER_AGENT', '')[:500]
+        ip_address, user_agent = self._request_context(request)
         
         return ClaimStatusHistory.objects.create(
             claim=self.claim,
@@ -80,23 +75,208 @@ class ClaimsWorkflowService:
             user_agent=user_agent
         )
     
+    @staticmethod
+    def _request_context(request):
+        """Client IP and user agent recorded with history rows."""
+        if not request:
+            return None, ''
+        
+        # First hop of X-Forwarded-For, else the socket address
+        x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR', '')
+        ip_address = (
+            x_forwarded_for.partition(',')[0].strip()
+            or request.META.get('REMOTE_ADDR')
+        )
+        return ip_address, request.META.get('HTTP_USER_AGENT', '')[:500]
+    
+    @classmethod
+    @transaction.atomic
+    def bulk_transition(cls, claims, new_status: str, user, reason: str = '', request=None):
+        """
+        Move several claims to new_status with one UPDATE and one
+        batched history INSERT.
+        
+        Only transitions that need no per-claim input are supported;
+        approvals and settlements carry per-claim amounts and go through
+        bulk_approve and bulk_settle.
+        
+        Returns:
+            int: Number of claims transitioned
+        """
+        if new_status not in cls.BULK_TRANSITIONS:
+            raise ValueError(f"Bulk transition to {new_status} is not supported.")
+        if new_status == 'REJECTED' and not reason:
+            raise ValueError("Rejection reason is required.")
+        
+        claims = list(claims)
+        if not claims:
+            return 0
+        
+        cls._check_sources(claims, new_status)
+        
+        now = timezone.now()
+        values = {'status': new_status, 'updated_at': now}
+        if new_status == 'UNDER_REVIEW':
+            values.update(review_started_at=now, reviewed_by=user)
+        elif new_status == 'REJECTED':
+            values.update(rejection_reason=reason, rejected_at=now, reviewed_by=user)
+        elif new_status == 'CLOSED':
+            values['closed_at'] = now
+        
+        Claim.objects.filter(pk__in=[claim.pk for claim in claims]).update(**values)
+        invalidate_claim_list_cache()
+        cls._bulk_record_status_change(claims, new_status, user, reason, request)
+        
+        for claim in claims:
+            claim.status = new_status
+        
+        return len(claims)
+    
+    @classmethod
+    @transaction.atomic
+    def bulk_approve(cls, approvals, user, reason: str = '', request=None):
+        """
+        Approve several claims, each at its own amount.
+        
+        Approval authority is matched in Python against the cached
+        thresholds and the user's cached role ids, so besides one lookup
+        of the claims' insurance types the writes are a single
+        bulk_update and one batched history INSERT.
+        
+        Args:
+            approvals: Iterable of (claim, approved_amount) pairs
+        
+        Returns:
+            int: Number of claims approved
+        """
+        approvals = list(approvals)
+        if not approvals:
+            return 0
+        
+        claims = [claim for claim, _ in approvals]
+        cls._check_sources(claims, 'APPROVED')
+        
+        type_ids = dict(
+            Claim.objects.filter(pk__in=[claim.pk for claim in claims])
+            .values_list('pk', 'policy__insurance_type_id')
+        )
+        for claim, approved_amount in approvals:
+            if approved_amount is None:
+                raise ValueError(f"Approved amount is required for {claim.claim_number}.")
+            if approved_amount > claim.amount_requested:
+                raise ValueError(
+                    f"Approved amount cannot exceed requested amount for {claim.claim_number}."
+                )
+            threshold = ClaimApprovalThreshold.for_amount(type_ids[claim.pk], claim.amount_requested)
+            if not cls._has_approval_authority(user, threshold):
+                raise ValueError(
+                    f"You don't have authority to approve claim {claim.claim_number}."
+                )
+        
+        # History keeps the pre-approval status
+        cls._bulk_record_status_change(claims, 'APPROVED', user, reason, request)
+        
+        now = timezone.now()
+        for claim, approved_amount in approvals:
+            claim.status = 'APPROVED'
+            claim.amount_approved = approved_amount
+            claim.approved_at = now
+            claim.reviewed_by = user
+            claim.updated_at = now
+        Claim.objects.bulk_update(
+            claims,
+            ['status', 'amount_approved', 'approved_at', 'reviewed_by', 'updated_at'],
+            batch_size=500
+        )
+        invalidate_claim_list_cache()
+        
+        return len(claims)
+    
+    @classmethod
+    @transaction.atomic
+    def bulk_settle(cls, claims, user, settled_amounts=None, request=None):
+        """
+        Settle several approved claims with one multi-row UPDATE.
+        
+        Args:
+            settled_amounts: Optional {claim pk: amount}; claims not in
+                it settle at their approved amount, as in Claim.settle
+        
+        Returns:
+            int: Number of claims settled
+        """
+        claims = list(claims)
+        if not claims:
+            return 0
+        settled_amounts = settled_amounts or {}
+        
+        cls._check_sources(claims, 'SETTLED')
+        amounts = [
+            claim.checked_settlement_amount(settled_amounts.get(claim.pk))
+            for claim in claims
+        ]
+        
+        cls._bulk_record_status_change(claims, 'SETTLED', user, request=request)
+        
+        now = timezone.now()
+        for claim, amount in zip(claims, amounts):
+            claim.status = 'SETTLED'
+            claim.amount_settled = amount
+            claim.settled_at = now
+            claim.settled_by = user
+            claim.updated_at = now
+        Claim.objects.bulk_update(
+            claims,
+            ['status', 'amount_settled', 'settled_at', 'settled_by', 'updated_at'],
+            batch_size=500
+        )
+        invalidate_claim_list_cache()
+        
+        return len(claims)
+    
+    @classmethod
+    def _check_sources(cls, claims, new_status):
+        """Raise ValueError unless every claim may move to new_status."""
+        sources = {
+            status for status, targets in cls.VALID_TRANSITIONS.items()
+            if new_status in targets
+        }
+        invalid = [claim for claim in claims if claim.status not in sources]
+        if invalid:
+            raise ValueError(
+                f"Cannot transition {invalid[0].claim_number} from {invalid[0].status} to {new_status}"
+            )
+    
+    @classmethod
+    def _bulk_record_status_change(cls, claims, new_status, user, reason='', request=None):
+        """Batched record_status_change; reads old status from each claim."""
+        ip_address, user_agent = cls._request_context(request)
+        ClaimStatusHistory.objects.bulk_create([
+            ClaimStatusHistory(
+                claim=claim,
+                old_status=claim.status,
+                new_status=new_status,
+                status_change_reason=reason,
+                changed_by=user,
+                ip_address=ip_address,
+                user_agent=user_agent
+            )
+            for claim in claims
+        ], batch_size=500)
+    
     def get_approval_threshold(self) -> ClaimApprovalThreshold:
         """
         Get the approval threshold for this claim's amount.
         
         Returns the threshold that determines who can approve this claim.
+        Looked up once per service instance.
         """
-        amount = self.claim.amount_requested
-        insurance_type = self.claim.policy.quote.application.insurance_type
-        
-        threshold = ClaimApprovalThreshold.objects.filter(
-            insurance_type=insurance_type,
-            min_claim_amount__lte=amount,
-            max_claim_amount__gte=amount,
-            is_active=True
-        ).first()
-        
-        return threshold
+        if not hasattr(self, '_threshold'):
+            self._threshold = ClaimApprovalThreshold.for_amount(
+                self.claim.policy.insurance_type_id,
+                self.claim.amount_requested
+            )
+        return self._threshold
     
     def can_user_approve(self, user) -> bool:
         """
@@ -104,13 +284,62 @@ class ClaimsWorkflowService:
         
         Compares user's role against required approval level.
         """
-        threshold = self.get_approval_threshold()
+        return self._has_approval_authority(user, self.get_approval_threshold())
+    
+    @staticmethod
+    def _has_approval_authority(user, threshold) -> bool:
         if not threshold:
             # No threshold defined - default to needing ADMIN
-            return user.user_roles.filter(role__role_name='ADMIN').exists()
+            return user.is_admin_cached
         
-        required_role = threshold.required_approver_role
-        return user.user_roles.filter(role=required_role).exists()
+        return threshold.required_approver_role_id in user.role_ids_cached
+    
+    def _handle_review(self, user, **kwargs):
+        self.claim.review_started_at = timezone.now()
+        self.claim.reviewed_by = user
+        return ['review_started_at', 'reviewed_by']
+    
+    def _handle_approve(self, user, approved_amount=None, **kwargs):
+        if not self.can_user_approve(user):
+            raise ValueError("You don't have authority to approve this claim amount.")
+        
+        if approved_amount is None:
+            raise ValueError("Approved amount is required.")
+        if approved_amount > self.claim.amount_requested:
+            raise ValueError("Approved amount cannot exceed requested amount.")
+        
+        self.claim.amount_approved = approved_amount
+        self.claim.approved_at = timezone.now()
+        self.claim.reviewed_by = user
+        return ['amount_approved', 'approved_at', 'reviewed_by']
+    
+    def _handle_reject(self, user, reason='', **kwargs):
+        if not reason:
+            raise ValueError("Rejection reason is required.")
+        self.claim.rejection_reason = reason
+        self.claim.rejected_at = timezone.now()
+        self.claim.reviewed_by = user
+        return ['rejection_reason', 'rejected_at', 'reviewed_by']
+    
+    def _handle_settle(self, user, **kwargs):
+        if not self.claim.amount_approved:
+            raise ValueError("Claim must be approved before settlement.")
+        self.claim.amount_settled = self.claim.amount_approved
+        self.claim.settled_at = timezone.now()
+        self.claim.settled_by = user
+        return ['amount_settled', 'settled_at', 'settled_by']
+    
+    def _handle_close(self, user, **kwargs):
+        self.claim.closed_at = timezone.now()
+        return ['closed_at']
+    
+    _HANDLERS = {
+        'UNDER_REVIEW': _handle_review,
+        'APPROVED': _handle_approve,
+        'REJECTED': _handle_reject,
+        'SETTLED': _handle_settle,
+        'CLOSED': _handle_close,
+    }
     
     @transaction.atomic
     def transition_status(
@@ -133,43 +362,16 @@ class ClaimsWorkflowService:
         
         old_status = self.claim.status
         
-        # Status-specific logic
-        if new_status == 'UNDER_REVIEW':
-            self.claim.review_started_at = timezone.now()
-            self.claim.reviewed_by = user
-        
-        elif new_status == 'APPROVED':
-            if not self.can_user_approve(user):
-                raise ValueError("You don't have authority to approve this claim amount.")
-            
-            if approved_amount is None:
-                raise ValueError("Approved amount is required.")
-            if approved_amount > self.claim.amount_requested:
-                raise ValueError("Approved amount cannot exceed requested amount.")
-            
-            self.claim.amount_approved = approved_amount
-            self.claim.approved_at = timezone.now()
-            self.claim.reviewed_by = user
-        
-        elif new_status == 'REJECTED':
-            if not reason:
-                raise ValueError("Rejection reason is required.")
-            self.claim.rejection_reason = reason
-            self.claim.rejected_at = timezone.now()
-            self.claim.reviewed_by = user
-        
-        elif new_status == 'SETTLED':
-            if not self.claim.amount_approved:
-                raise ValueError("Claim must be approved before settlement.")
-            self.claim.amount_settled = self.claim.amount_approved
-            self.claim.settled_at = timezone.now()
-            self.claim.settled_by = user
-        
-        elif new_status == 'CLOSED':
-            self.claim.closed_at = timezone.now()
+        # Status-specific logic; each handler returns the fields it set
+        fields = ['status', 'updated_at']
+        handler = self._HANDLERS.get(new_status)
+        if handler:
+            fields += handler(
+                self, user, reason=reason, approved_amount=approved_amount
+            )
         
         self.claim.status = new_status
-        self.claim.save()
+        self.claim.save(update_fields=fields)
         
         # Record history
         self.record_status_change(old_status, new_status, user, reason, request)
@@ -188,19 +390,21 @@ class ClaimsWorkflowService:
         
         assessment_date = assessment_date or date.today()
         
-        # Create assessment record
-        assessment = ClaimAssessment.objects.create(
+        # Create assessment record (reused if this surveyor already has one)
+        assessment, _ = ClaimAssessment.objects.get_or_create(
             claim=self.claim,
             surveyor=surveyor_user,
-            assessment_date=assessment_date,
-            damage_assessment='',
-            assessment_status='PENDING'
+            defaults={
+                'assessment_date': assessment_date,
+                'damage_assessment': '',
+                'assessment_status': 'PENDING',
+            }
         )
         
         # Update claim status
         old_status = self.claim.status
         self.claim.status = 'SURVEYOR_ASSIGNED'
-        self.claim.save()
+        self.claim.save(update_fields=['status', 'updated_at'])
         
         self.record_status_change(
             old_status, 'SURVEYOR_ASSIGNED', surveyor_user,
@@ -230,12 +434,16 @@ class ClaimsWorkflowService:
         assessment.assessment_findings = findings
         assessment.assessment_status = 'COMPLETED'
         assessment.calculate_net_amount()
+        assessment.save(update_fields=[
+            'damage_assessment', 'loss_amount_assessed', 'deductible_applicable',
+            'assessment_findings', 'assessment_status', 'net_claim_amount', 'updated_at'
+        ])
         
         # Update claim status
         if self.claim.status == 'UNDER_INVESTIGATION':
             old_status = self.claim.status
             self.claim.status = 'ASSESSED'
-            self.claim.save()
+            self.claim.save(update_fields=['status', 'updated_at'])
             
             self.record_status_change(
                 old_status, 'ASSESSED', assessment.surveyor,
@@ -254,7 +462,9 @@ class ClaimsWorkflowService:
         """
         Create settlement record for approved claim.
         
-        Must be called after claim is approved.
+        Must be called after claim is approved. Idempotent: a repeated
+        call (e.g. a client retry) returns the claim's existing
+        settlement instead of failing on the one-to-one constraint.
         """
         if self.claim.status != 'APPROVED':
             raise ValueError("Settlement can only be created for approved claims.")
@@ -264,16 +474,18 @@ class ClaimsWorkflowService:
         
         bank_details = bank_details or {}
         
-        settlement = ClaimSettlement.objects.create(
+        settlement, _ = ClaimSettlement.objects.get_or_create(
             claim=self.claim,
-            settlement_amount=self.claim.amount_approved,
-            settlement_method=settlement_method,
-            bank_account_number=bank_details.get('account_number', ''),
-            bank_name=bank_details.get('bank_name', ''),
-            bank_ifsc_code=bank_details.get('ifsc_code', ''),
-            account_holder_name=bank_details.get('holder_name', ''),
-            settlement_approved_by=user,
-            settlement_status='PENDING'
+            defaults={
+                'settlement_amount': self.claim.amount_approved,
+                'settlement_method': settlement_method,
+                'bank_account_number': bank_details.get('account_number', ''),
+                'bank_name': bank_details.get('bank_name', ''),
+                'bank_ifsc_code': bank_details.get('ifsc_code', ''),
+                'account_holder_name': bank_details.get('holder_name', ''),
+                'settlement_approved_by': user,
+                'settlement_status': 'PENDING',
+            }
         )
         
         return settlement
@@ -282,13 +494,13 @@ class ClaimsWorkflowService:
         """
         Check if claim is within SLA.
         
-        Returns SLA status and days remaining/overdue.
+        Returns SLA status and days remaining/overdue. CLAIM_SLA_DAYS
+        comes from the in-process configuration cache, so this doesn't
+        query the database.
         """
-        from apps.catalog.models import BusinessConfiguration
-        
         sla_days = BusinessConfiguration.get_int('CLAIM_SLA_DAYS', 15)
         
-        if self.claim.status in ['SETTLED', 'CLOSED', 'REJECTED']:
+        if self.claim.status in Claim.SLA_COMPLETE_STATUSES:
             # Claim is complete
             if self.claim.settled_at:
                 processing_days = (self.claim.settled_at.date() - self.claim.submitted_at.date()).days
@@ -304,7 +516,7 @@ class ClaimsWorkflowService:
             }
         
         # Claim is still in progress
-        days_elapsed = (date.today() - self.claim.submitted_at.date()).days
+        days_elapsed = (timezone.localdate() - self.claim.submitted_on).days
         days_remaining = sla_days - days_elapsed
         
         return {
@@ -1,3 +1,271 @@
-from django.test import TestCase
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.accounts.models import Role, User, UserRole
+from apps.applications.models import InsuranceApplication
+from apps.catalog.config_models import ClaimApprovalThreshold, _thresholds_for_type
+from apps.catalog.models import BusinessConfiguration, InsuranceCompany, InsuranceType
+from apps.customers.models import CustomerProfile
+from apps.policies.models import Policy
+from apps.quotes.models import Quote
+
+from .models import Claim, ClaimDocument, ClaimStatusHistory, claim_list_cache_version
+from .services import ClaimsWorkflowService
+
+
+def make_user(email, role_name, **extra):
+    user = User.objects.create_user(
+        username=email, email=email, password='Str0ngPass!x', **extra
+    )
+    role, _ = Role.objects.get_or_create(role_name=role_name)
+    UserRole.objects.create(user=user, role=role)
+    # role_flags is synced on the row by a receiver
+    return User.objects.get(pk=user.pk)
+
+
+class ClaimTestCase(TestCase):
+    """Customer with one active policy; claims are created per test."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = make_user('officer@example.com', Role.ROLE_BACKOFFICE)
+        cls.customer_user = make_user(
+            'holder@example.com', Role.ROLE_CUSTOMER, first_name='Asha', last_name='Rao'
+        )
+        cls.customer = CustomerProfile.objects.create(user=cls.customer_user)
+    
+        insurance_type = InsuranceType.objects.create(type_name='Motor', type_code='MOTOR')
+        company = InsuranceCompany.objects.create(company_name='Acme', company_code='ACME')
+        application = InsuranceApplication.objects.create(
+            customer=cls.customer, insurance_type=insurance_type,
+        )
+        quote = Quote.objects.create(
+            application=application, customer=cls.customer,
+            insurance_type=insurance_type, insurance_company=company,
+            status='ACCEPTED', base_premium=Decimal('10000'),
+            adjusted_premium=Decimal('10000'), final_premium=Decimal('10000'),
+            gst_amount=Decimal('1800'), total_premium_with_gst=Decimal('11800'),
+            sum_insured=Decimal('500000'),
+            expiry_at=timezone.now() + timedelta(days=30),
+        )
+        cls.policy = Policy.objects.create(
+            quote=quote, customer=cls.customer,
+            insurance_type=insurance_type, insurance_company=company,
+            policy_start_date=date.today(),
+            policy_end_date=date.today() + timedelta(days=365),
+            policy_tenure_months=12, premium_amount=Decimal('10000'),
+            gst_amount=Decimal('1800'), total_premium_with_gst=Decimal('11800'),
+            sum_insured=Decimal('500000'),
+        )
+    
+    def make_claim(self, **extra):
+        values = {
+            'policy': self.policy,
+            'customer': self.customer,
+            'claim_type': 'ACCIDENT',
+            'claim_description': 'Rear-ended at a signal',
+            'incident_date': date.today(),
+            'amount_requested': Decimal('40000'),
+            'submitted_by': self.customer_user,
+            **extra,
+        }
+        return Claim.objects.create(**values)
+
+
+class ClaimQueryCountTests(ClaimTestCase):
+    
+    def setUp(self):
+        self.client = APIClient()
+    
+    def get(self, user, url):
+        self.client.force_authenticate(user)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
+    
+    def test_list_query_count_does_not_grow_with_rows(self):
+        self.make_claim()
+        with self.assertNumQueries(1):
+            self.get(self.customer_user, '/api/v1/claims/')
+    
+        for _ in range(4):
+            self.make_claim()
+        with self.assertNumQueries(1):
+            response = self.get(self.customer_user, '/api/v1/claims/')
+        self.assertEqual(len(response.data['results']), 5)
+    
+    def test_customer_list_excludes_other_customers(self):
+        other = CustomerProfile.objects.create(
+            user=make_user('other@example.com', Role.ROLE_CUSTOMER)
+        )
+        self.make_claim()
+        response = self.get(other.user, '/api/v1/claims/')
+        self.assertEqual(response.data['results'], [])
+    
+    def test_backoffice_list_is_served_from_cache(self):
+        for _ in range(3):
+            self.make_claim()
+        with self.assertNumQueries(1):
+            response = self.get(self.staff, '/api/v1/claims/all/')
+        self.assertEqual(len(response.data['results']), 3)
+        with self.assertNumQueries(0):
+            self.get(self.staff, '/api/v1/claims/all/')
+    
+    @override_settings(MEDIA_ROOT='/tmp/claim-test-media')
+    def test_detail_query_count_does_not_grow_with_documents(self):
+        claim = self.make_claim()
+        for name in ('fir.pdf', 'photo.jpg', 'estimate.pdf'):
+            ClaimDocument.objects.create(
+                claim=claim, document_type='OTHER', document_name=name,
+                document_file=SimpleUploadedFile(name, b'data'),
+                uploaded_by=self.customer_user,
+            )
+        with self.assertNumQueries(2):
+            response = self.get(self.customer_user, f'/api/v1/claims/{claim.pk}/')
+        self.assertEqual(response.data['claim_number'], claim.claim_number)
+
+
+class ClaimsWorkflowServiceBulkTests(ClaimTestCase):
+    
+    def setUp(self):
+        # Test rollbacks don't fire the receiver that clears this cache
+        _thresholds_for_type.cache_clear()
+    
+    def test_bulk_transition_to_review(self):
+        claims = [self.make_claim(), self.make_claim()]
+        version = claim_list_cache_version()
+    
+        count = ClaimsWorkflowService.bulk_transition(claims, 'UNDER_REVIEW', self.staff)
+    
+        self.assertEqual(count, 2)
+        for claim in Claim.objects.filter(pk__in=[c.pk for c in claims]):
+            self.assertEqual(claim.status, 'UNDER_REVIEW')
+            self.assertEqual(claim.reviewed_by_id, self.staff.pk)
+            self.assertIsNotNone(claim.review_started_at)
+        history = ClaimStatusHistory.objects.filter(claim__in=claims)
+        self.assertEqual(
+            sorted(history.values_list('old_status', 'new_status')),
+            [('SUBMITTED', 'UNDER_REVIEW')] * 2
+        )
+        self.assertNotEqual(claim_list_cache_version(), version)
+    
+    def test_bulk_transition_rejects_invalid_requests(self):
+        claim = self.make_claim()
+        with self.assertRaises(ValueError):
+            ClaimsWorkflowService.bulk_transition([claim], 'APPROVED', self.staff)
+        with self.assertRaises(ValueError):
+            ClaimsWorkflowService.bulk_transition([claim], 'CLOSED', self.staff)
+    
+        claim = self.make_claim(status='UNDER_REVIEW')
+        with self.assertRaises(ValueError):
+            ClaimsWorkflowService.bulk_transition([claim], 'REJECTED', self.staff)
+    
+        self.assertFalse(ClaimStatusHistory.objects.exists())
+    
+    def test_bulk_transition_rejects_with_reason(self):
+        claim = self.make_claim(status='UNDER_REVIEW')
+        ClaimsWorkflowService.bulk_transition([claim], 'REJECTED', self.staff, reason='Lapsed')
+    
+        claim.refresh_from_db()
+        self.assertEqual(claim.status, 'REJECTED')
+        self.assertEqual(claim.rejection_reason, 'Lapsed')
+        self.assertIsNotNone(claim.rejected_at)
+    
+    def test_bulk_approve(self):
+        ClaimApprovalThreshold.objects.create(
+            insurance_type=self.policy.insurance_type, approval_level='OFFICER_APPROVAL',
+            required_approver_role=Role.objects.get(role_name=Role.ROLE_BACKOFFICE),
+        )
+        first = self.make_claim(status='UNDER_REVIEW')
+        second = self.make_claim(status='UNDER_REVIEW')
+    
+        count = ClaimsWorkflowService.bulk_approve(
+            [(first, Decimal('40000')), (second, Decimal('25000'))], self.staff
+        )
+    
+        self.assertEqual(count, 2)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual((first.status, first.amount_approved), ('APPROVED', Decimal('40000')))
+        self.assertEqual((second.status, second.amount_approved), ('APPROVED', Decimal('25000')))
+        self.assertEqual(
+            set(ClaimStatusHistory.objects.values_list('old_status', flat=True)),
+            {'UNDER_REVIEW'}
+        )
+    
+    def test_bulk_approve_requires_authority_and_valid_amount(self):
+        claim = self.make_claim(status='UNDER_REVIEW')
+        # No threshold configured: only admins may approve
+        with self.assertRaises(ValueError):
+            ClaimsWorkflowService.bulk_approve([(claim, Decimal('100'))], self.staff)
+    
+        admin = make_user('admin@example.com', Role.ROLE_ADMIN)
+        with self.assertRaises(ValueError):
+            ClaimsWorkflowService.bulk_approve([(claim, Decimal('40000.01'))], admin)
+    
+        claim.refresh_from_db()
+        self.assertEqual(claim.status, 'UNDER_REVIEW')
+        self.assertFalse(ClaimStatusHistory.objects.exists())
+    
+    def test_bulk_settle(self):
+        first = self.make_claim(status='APPROVED', amount_approved=Decimal('30000'))
+        second = self.make_claim(status='APPROVED', amount_approved=Decimal('20000'))
+    
+        count = ClaimsWorkflowService.bulk_settle(
+            [first, second], self.staff, settled_amounts={second.pk: Decimal('15000')}
+        )
+    
+        self.assertEqual(count, 2)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual((first.status, first.amount_settled), ('SETTLED', Decimal('30000')))
+        self.assertEqual((second.status, second.amount_settled), ('SETTLED', Decimal('15000')))
+        self.assertEqual(first.settled_by_id, self.staff.pk)
+    
+    def test_bulk_settle_rejects_amount_above_approval(self):
+        claim = self.make_claim(status='APPROVED', amount_approved=Decimal('30000'))
+        with self.assertRaises(ValueError):
+            ClaimsWorkflowService.bulk_settle(
+                [claim], self.staff, settled_amounts={claim.pk: Decimal('30000.01')}
+            )
+        with self.assertRaises(ValueError):
+            claim.settle(self.staff, Decimal('30000.01'))
+        with self.assertRaises(ValueError):
+            claim.settle(self.staff, Decimal('0'))
+    
+        claim.refresh_from_db()
+        self.assertEqual(claim.status, 'APPROVED')
+        self.assertFalse(ClaimStatusHistory.objects.exists())
+    
+    def test_bulk_settle_requires_approved_claims(self):
+        claim = self.make_claim(status='UNDER_REVIEW')
+        with self.assertRaises(ValueError):
+            ClaimsWorkflowService.bulk_settle([claim], self.staff)
+        self.assertFalse(ClaimStatusHistory.objects.exists())
+
+
+class ClaimSlaTests(ClaimTestCase):
+    
+    @override_settings(TIME_ZONE='Asia/Kolkata')
+    def test_overdue_agrees_with_sla_status_across_utc_midnight(self):
+        # 20:00 UTC is already the next day (01:30) in IST
+        now = datetime(2026, 1, 10, 20, 0, tzinfo=dt_timezone.utc)
+        today = date(2026, 1, 11)
+        sla_days = BusinessConfiguration.get_int('CLAIM_SLA_DAYS', 15)
+        claims = [
+            self.make_claim(submitted_on=today - timedelta(days=sla_days + offset))
+            for offset in (-1, 0, 1, 2)
+        ]
+        
+        with mock.patch('django.utils.timezone.now', return_value=now):
+            overdue = set(Claim.overdue().values_list('pk', flat=True))
+            for claim in claims:
+                status = ClaimsWorkflowService(claim).get_sla_status()
+                self.assertEqual(claim.pk in overdue, not status['within_sla'])
+        self.assertEqual(overdue, {claims[2].pk, claims[3].pk})
@@ -7,24 +7,55 @@ Provides API endpoints for:
 - Document upload (Customer)
 """
 
-from rest_framework import viewsets, status, generics
+import hashlib
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.pagination import CursorPagination
 
-from apps.accounts.permissions import IsAdminOrBackoffice
+from apps.accounts.permissions import IsAdminOrBackoffice, is_request_backoffice
+from apps.catalog.search import text_search
+from apps.notifications.email_service import queue_claim_status_email
 
-from .models import Claim, ClaimDocument
+from .models import Claim, ClaimAssessment, ClaimDocument, claim_list_cache_version
 from .serializers import (
     ClaimSerializer,
+    ClaimDetailSerializer,
     ClaimCreateSerializer,
     ClaimListSerializer,
     ClaimStatusUpdateSerializer,
+    ClaimStatusResultSerializer,
     ClaimDocumentSerializer,
 )
 
 
+User = get_user_model()
+
+# Seconds a backoffice claim list page is reused (claim writes
+# invalidate earlier, see claims.models.claim_list_cache_version)
+CLAIM_LIST_RESPONSE_TTL = 30
+
+
+class ClaimCursorPagination(CursorPagination):
+    """
+    Newest-first keyset pagination for claim lists, so deep pages in
+    the backoffice queue don't pay for a large OFFSET scan.
+    """
+    page_size = 20
+    page_size_query_param = 'per_page'
+    max_page_size = 100
+    # id breaks ties between claims submitted in the same instant; InnoDB
+    # secondary indexes carry the primary key, so the submitted_at
+    # indexes still serve this order without a filesort
+    ordering = ('-submitted_at', '-id')
+
+
 class ClaimViewSet(viewsets.ModelViewSet):
     """
     API endpoint for claims.
@@ -40,59 +71,63 @@ class ClaimViewSet(viewsets.ModelViewSet):
     - Update status (POST /api/v1/claims/{id}/update-status/)
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = ClaimCursorPagination
     
     def get_queryset(self):
         user = self.request.user
         
-        # Backoffice sees all
-        if user.user_roles.filter(role__role_name__in=['ADMIN', 'BACKOFFICE']).exists():
-            queryset = Claim.objects.select_related(
-                'customer__user', 'policy'
-            ).prefetch_related('documents').all()
+        # Only retrieve and documents render documents
+        if self.action == 'list':
+            queryset = Claim.list_row_qs()
+        elif self.action in ('retrieve', 'documents'):
+            queryset = Claim.detail_qs()
         else:
-            # Customers see only their own
-            queryset = Claim.objects.select_related(
-                'customer__user', 'policy'
-            ).prefetch_related('documents').filter(customer__user=user)
+            queryset = Claim.list_qs()
+        
+        # Backoffice sees all; customers see only their own
+        if not is_request_backoffice(self.request):
+            queryset = queryset.filter(customer__user=user)
         
-        # Search functionality
-        from django.db.models import Q
+        # Search: claim number and the denormalized policy number and
+        # customer name share a FULLTEXT index; email is a subquery
         search_query = self.request.query_params.get('q', '').strip()
         if search_query:
-            queryset = queryset.filter(
-                Q(claim_number__icontains=search_query) |
-                Q(policy__policy_number__icontains=search_query) |
-                Q(customer__user__email__icontains=search_query) |
-                Q(customer__user__first_name__icontains=search_query) |
-                Q(customer__user__last_name__icontains=search_query)
+            queryset = text_search(
+                queryset, search_query,
+                fields=('claim_number', 'policy_number_cached', 'customer_name_cached'),
+                related_fields=('customer__user__email',),
             )
         
-        # Filter by status
+        # Filter by status (stored upper-case; exact matches use the indexes)
         status_filter = self.request.query_params.get('status')
         if status_filter:
-            queryset = queryset.filter(status__iexact=status_filter)
+            queryset = queryset.filter(status=status_filter.upper())
         
         # Filter by claim type
         claim_type = self.request.query_params.get('claim_type')
         if claim_type:
-            queryset = queryset.filter(claim_type__iexact=claim_type)
+            queryset = queryset.filter(claim_type=claim_type.upper())
         
-        return queryset.distinct()
+        # Open claims past the SLA
+        if self.request.query_params.get('overdue') == 'true':
+            queryset = queryset.filter(Claim.overdue_q())
+        
+        return queryset
     
     def get_serializer_class(self):
         if self.action == 'create':
             return ClaimCreateSerializer
         if self.action == 'list':
             return ClaimListSerializer
+        if self.action == 'retrieve':
+            return ClaimDetailSerializer
         return ClaimSerializer
     
     @action(detail=True, methods=['post'], url_path='update-status')
     def update_status(self, request, pk=None):
         """Update claim status (Backoffice only)."""
         # Check permission
-        if not request.user.user_roles.filter(
-            role__role_name__in=['ADMIN', 'BACKOFFICE']
-        ).exists():
+        if not is_request_backoffice(request):
             return Response(
                 {'error': 'Backoffice access required.'},
                 status=status.HTTP_403_FORBIDDEN
@@ -125,12 +160,11 @@ class ClaimViewSet(viewsets.ModelViewSet):
             
             # Send email notification if status changed
             if claim.status != old_status:
-                from apps.notifications.email_service import send_claim_status_email
-                send_claim_status_email(claim, old_status)
+                queue_claim_status_email(claim.pk, old_status)
             
             return Response({
                 'message': f'Claim {action_name} successful.',
-                'claim': ClaimSerializer(claim).data
+                'claim': ClaimStatusResultSerializer(claim).data
             })
         except ValueError as e:
             return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -139,9 +173,7 @@ class ClaimViewSet(viewsets.ModelViewSet):
     def assign_surveyor(self, request, pk=None):
         """Assign a surveyor to a claim (Backoffice only)."""
         # Check permission
-        if not request.user.user_roles.filter(
-            role__role_name__in=['ADMIN', 'BACKOFFICE']
-        ).exists():
+        if not is_request_backoffice(request):
             return Response(
                 {'error': 'Backoffice access required.'},
                 status=status.HTTP_403_FORBIDDEN
@@ -156,9 +188,6 @@ class ClaimViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        from django.contrib.auth import get_user_model
-        User = get_user_model()
-        
         try:
             surveyor = User.objects.get(id=surveyor_id, is_active=True)
         except User.DoesNotExist:
@@ -167,12 +196,15 @@ class ClaimViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        # Create assessment record
-        from .models import ClaimAssessment
+        # Create assessment record (unique per claim and surveyor)
         assessment, created = ClaimAssessment.objects.get_or_create(
             claim=claim,
             surveyor=surveyor,
-            defaults={'assessment_status': 'PENDING'}
+            defaults={
+                'assessment_date': timezone.localdate(),
+                'damage_assessment': '',
+                'assessment_status': 'PENDING',
+            }
         )
         
         if not created:
@@ -191,8 +223,9 @@ class ClaimViewSet(viewsets.ModelViewSet):
         """Upload a document for a claim."""
         claim = self.get_object()
         
-        # Check ownership
-        if claim.customer.user != request.user:
+        # get_queryset already limits customers to their own claims; only
+        # backoffice users can reach someone else's
+        if is_request_backoffice(request) and claim.customer.user_id != request.user.pk:
             return Response(
                 {'error': 'You can only upload documents to your own claims.'},
                 status=status.HTTP_403_FORBIDDEN
@@ -215,12 +248,14 @@ class ClaimViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        file_size, content_sha256 = ClaimDocument.digest_upload(document_file)
         document = ClaimDocument.objects.create(
             claim=claim,
             document_type=document_type,
             document_name=document_name,
             document_file=document_file,
-            file_size=document_file.size,
+            file_size=file_size,
+            content_sha256=content_sha256,
             uploaded_by=request.user
         )
         
@@ -233,24 +268,31 @@ class ClaimViewSet(viewsets.ModelViewSet):
     def documents(self, request, pk=None):
         """List documents for a claim."""
         claim = self.get_object()
-        documents = claim.documents.all()
+        documents = claim.documents.all()  # prefetched by detail_qs
         serializer = ClaimDocumentSerializer(documents, many=True)
         return Response(serializer.data)
     
     @action(detail=False, methods=['get'], permission_classes=[IsAuthenticated, IsAdminOrBackoffice])
     def all(self, request):
         """List all claims (Admin/Backoffice only)."""
-        claims = Claim.objects.select_related('customer__user', 'policy').all()
-        
-        # Filter by status
-        claim_status = request.query_params.get('status')
-        if claim_status:
-            claims = claims.filter(status=claim_status)
-        
-        page = self.paginate_queryset(claims)
-        if page is not None:
+        # Every backoffice user sees the same page for the same params
+        params = '&'.join(
+            f'{key}={value}' for key, value in sorted(request.query_params.items())
+        )
+        cache_key = 'claims_list:{}:{}'.format(
+            claim_list_cache_version(), hashlib.md5(params.encode()).hexdigest()
+        )
+        data = cache.get(cache_key)
+        if data is None:
+            claims = Claim.list_row_qs()
+            
+            # Filter by status
+            claim_status = request.query_params.get('status')
+            if claim_status:
+                claims = claims.filter(status=claim_status.upper())
+            
+            page = self.paginate_queryset(claims)
             serializer = ClaimListSerializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = ClaimListSerializer(claims, many=True)
-        return Response(serializer.data)
+            data = self.get_paginated_response(serializer.data).data
+            cache.set(cache_key, data, CLAIM_LIST_RESPONSE_TTL)
+        return Response(data)
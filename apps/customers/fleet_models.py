@@ -11,8 +11,12 @@ Note: Advanced fleet analytics are out of scope for this academic project.
 Designed for extensibility.
 """
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.conf import settings
+from django.utils import timezone
 from decimal import Decimal
 
 
@@ -58,9 +62,45 @@ class Fleet(models.Model):
         return f"{self.fleet_name} ({self.total_vehicles} vehicles)"
     
     def update_vehicle_count(self):
-        """Update total vehicle count from related vehicles."""
+        """
+        Recount active vehicles from scratch.
+        
+        total_vehicles is kept current by the FleetVehicle signals below;
+        this is only needed to reconcile after bulk writes that skip them.
+        """
         self.total_vehicles = self.vehicles.filter(vehicle_status='ACTIVE').count()
         self.save(update_fields=['total_vehicles'])
+    
+    @transaction.atomic
+    def add_vehicles(self, vehicle_dicts, batch_size=500):
+        """
+        Import vehicles into this fleet with multi-row INSERTs.
+        
+        Registrations already on file are skipped. bulk_create bypasses
+        the FleetVehicle signals, so total_vehicles is bumped here in one
+        UPDATE.
+        
+        Returns:
+            list: The FleetVehicle rows created
+        """
+        registrations = [d['vehicle_registration_number'] for d in vehicle_dicts]
+        existing = set(FleetVehicle.objects.filter(
+            vehicle_registration_number__in=registrations
+        ).values_list('vehicle_registration_number', flat=True))
+        
+        vehicles = []
+        for data in vehicle_dicts:
+            registration = data['vehicle_registration_number']
+            if registration not in existing:
+                existing.add(registration)
+                vehicles.append(FleetVehicle(fleet=self, **data))
+        FleetVehicle.objects.bulk_create(vehicles, batch_size=batch_size)
+        
+        active = sum(1 for vehicle in vehicles if vehicle.vehicle_status == 'ACTIVE')
+        if active:
+            Fleet.objects.filter(pk=self.pk).update(total_vehicles=F('total_vehicles') + active)
+            self.refresh_from_db(fields=['total_vehicles'])
+        return vehicles
 
 
 class FleetVehicle(models.Model):
@@ -121,12 +161,52 @@ class FleetVehicle(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # (fleet_id, vehicle_status) as last read from or written to the
+    # database; (None, None) until then
+    _stored_state = (None, None)
+    
     class Meta:
         db_table = 'fleet_vehicles'
         ordering = ['-added_at']
     
     def __str__(self):
         return f"{self.vehicle_registration_number} ({self.vehicle_make} {self.vehicle_model})"
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._stored_state = (
+            instance.__dict__.get('fleet_id'), instance.__dict__.get('vehicle_status')
+        )
+        return instance
+
+
+def _adjust_active_count(fleet_id, delta):
+    """Shift a fleet's total_vehicles by delta in a single UPDATE."""
+    fleets = Fleet.objects.filter(pk=fleet_id)
+    if delta < 0:
+        fleets = fleets.filter(total_vehicles__gt=0)
+    fleets.update(total_vehicles=F('total_vehicles') + delta)
+
+
+@receiver(post_save, sender=FleetVehicle)
+def _track_active_vehicles_on_save(sender, instance, created, **kwargs):
+    old_fleet_id, old_status = (None, None) if created else instance._stored_state
+    was_active = old_status == 'ACTIVE'
+    is_active = instance.vehicle_status == 'ACTIVE'
+    if (old_fleet_id, was_active) != (instance.fleet_id, is_active):
+        if was_active:
+            _adjust_active_count(old_fleet_id, -1)
+        if is_active:
+            _adjust_active_count(instance.fleet_id, 1)
+    instance._stored_state = (instance.fleet_id, instance.vehicle_status)
+
+
+@receiver(post_delete, sender=FleetVehicle)
+def _track_active_vehicles_on_delete(sender, instance, **kwargs):
+    fleet_id, status = instance._stored_state
+    if status == 'ACTIVE':
+        _adjust_active_count(fleet_id, -1)
 
 
 class FleetClaimHistory(models.Model):
@@ -205,6 +285,15 @@ class FleetRiskScore(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # (minimum active vehicles, discount %), largest fleets first
+    DISCOUNT_TIERS = (
+        (20, Decimal('15.00')),
+        (10, Decimal('10.00')),
+        (5, Decimal('5.00')),
+    )
+    # Latest-year claim ratio above which the discount is halved
+    HIGH_CLAIM_RATIO = Decimal('0.20')
+    
     class Meta:
         db_table = 'fleet_risk_scores'
     
@@ -222,21 +311,61 @@ class FleetRiskScore(models.Model):
         
         Adjusted by claim ratio.
         """
-        vehicle_count = self.fleet.total_vehicles
+        latest_claim_history = self.fleet.claim_histories.first()
+        self.apply_discount(
+            self.fleet.total_vehicles,
+            latest_claim_history.claim_ratio if latest_claim_history else None
+        )
+        self.save()
+        return self.discount_percentage
+    
+    @classmethod
+    def recalculate_all(cls):
+        """
+        Recalculate every active fleet's score in a fixed number of queries.
         
+        The latest claim ratio comes from a subquery instead of one
+        claim_histories lookup per fleet, and scores are written with
+        bulk_create/bulk_update instead of a save each.
+        """
+        latest_ratio = FleetClaimHistory.objects.filter(
+            fleet=OuterRef('pk')
+        ).order_by('-claim_year').values('claim_ratio')[:1]
+        fleets = Fleet.objects.filter(is_active=True).annotate(
+            latest_claim_ratio=Subquery(latest_ratio)
+        ).only('id', 'total_vehicles')
+        scores = {score.fleet_id: score for score in cls.objects.filter(fleet__is_active=True)}
+        
+        now = timezone.now()
+        created, updated = [], []
+        for fleet in fleets:
+            score = scores.get(fleet.pk)
+            if score is None:
+                score = cls(fleet=fleet)
+                created.append(score)
+            else:
+                updated.append(score)
+            score.apply_discount(fleet.total_vehicles, fleet.latest_claim_ratio)
+            score.calculated_at = score.updated_at = now
+        
+        cls.objects.bulk_create(created, batch_size=500)
+        cls.objects.bulk_update(
+            updated,
+            ['discount_percentage', 'fleet_risk_category', 'calculated_at', 'updated_at'],
+            batch_size=500
+        )
+        return len(created) + len(updated)
+    
+    def apply_discount(self, vehicle_count, latest_claim_ratio=None):
+        """Set discount and risk category from fleet size and claim ratio."""
         # Base discount by fleet size
-        if vehicle_count >= 20:
-            base_discount = Decimal('15.00')
-        elif vehicle_count >= 10:
-            base_discount = Decimal('10.00')
-        elif vehicle_count >= 5:
-            base_discount = Decimal('5.00')
-        else:
-            base_discount = Decimal('0.00')
+        base_discount = next(
+            (discount for minimum, discount in self.DISCOUNT_TIERS if vehicle_count >= minimum),
+            Decimal('0.00')
+        )
         
         # Adjust by claim ratio (reduce discount if high claims)
-        latest_claim_history = self.fleet.claim_histories.first()
-        if latest_claim_history and latest_claim_history.claim_ratio > Decimal('0.20'):
+        if latest_claim_ratio is not None and latest_claim_ratio > self.HIGH_CLAIM_RATIO:
             base_discount *= Decimal('0.5')  # Halve discount for high claim ratio
         
         self.discount_percentage = base_discount
@@ -248,6 +377,3 @@ class FleetRiskScore(models.Model):
             self.fleet_risk_category = 'MEDIUM'
         else:
             self.fleet_risk_category = 'HIGH'
-        
-        self.save()
-        return self.discount_percentage
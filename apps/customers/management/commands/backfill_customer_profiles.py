@@ -0,0 +1,36 @@
+"""
+Management command to create missing customer profiles.
+
+Usage:
+    python manage.py backfill_customer_profiles [--batch-size N]
+
+Customers now get a profile at sign-up. Accounts created before that
+(or through the admin) are given an empty profile here in bulk rather
+than one INSERT on their first profile request.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.accounts.models import Role, User
+from apps.customers.models import CustomerProfile
+
+
+class Command(BaseCommand):
+    help = 'Create empty profiles for customers that have none'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        user_ids = User.objects.filter(
+            user_roles__role__role_name=Role.ROLE_CUSTOMER,
+            customer_profile__isnull=True,
+        ).values_list('pk', flat=True)
+        
+        profiles = [CustomerProfile(user_id=user_id) for user_id in user_ids]
+        # ignore_conflicts: a profile created concurrently just gets skipped
+        CustomerProfile.objects.bulk_create(
+            profiles, batch_size=options['batch_size'], ignore_conflicts=True
+        )
+        
+        self.stdout.write(self.style.SUCCESS(f'Created {len(profiles)} customer profiles.'))
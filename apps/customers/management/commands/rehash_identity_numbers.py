@@ -0,0 +1,38 @@
+"""
+Management command to recompute PAN/Aadhaar lookup hashes.
+
+Usage:
+    python manage.py rehash_identity_numbers [--batch-size N]
+
+Run after changing PII_HMAC_KEY; until then duplicate detection
+compares new numbers against hashes made with the old key.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.customers.models import CustomerProfile
+
+
+class Command(BaseCommand):
+    help = 'Recompute PAN/Aadhaar hashes with the current PII_HMAC_KEY'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+    
+    def handle(self, *args, **options):
+        profiles = list(
+            CustomerProfile.objects.exclude(pan_number__isnull=True, aadhar_number__isnull=True)
+            .only('pan_number', 'aadhar_number')
+        )
+        for profile in profiles:
+            profile.pan_hash = CustomerProfile.hash_pan(profile.pan_number)
+            profile.aadhar_hash = CustomerProfile.hash_aadhar(profile.aadhar_number)
+        
+        # Swapping every hash at once keeps the unique indexes consistent
+        with transaction.atomic():
+            CustomerProfile.objects.bulk_update(
+                profiles, ['pan_hash', 'aadhar_hash'], batch_size=options['batch_size']
+            )
+        
+        self.stdout.write(self.style.SUCCESS(f'Rehashed {len(profiles)} customer profiles.'))
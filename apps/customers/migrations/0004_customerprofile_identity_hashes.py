@@ -0,0 +1,74 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:52
+
+import hashlib
+import hmac
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def _digest(value):
+    return hmac.new(settings.PII_HMAC_KEY.encode(), value.encode(), hashlib.sha256).hexdigest()
+
+
+def backfill_identity_hashes(apps, schema_editor):
+    # Same normalization as CustomerProfile.hash_pan / hash_aadhar
+    CustomerProfile = apps.get_model('customers', 'CustomerProfile')
+    profiles = list(
+        CustomerProfile.objects.exclude(pan_number__isnull=True, aadhar_number__isnull=True)
+        .only('pan_number', 'aadhar_number')
+    )
+    for profile in profiles:
+        profile.pan_hash = _digest(profile.pan_number.strip().upper()) if profile.pan_number else None
+        profile.aadhar_hash = (
+            _digest(''.join(profile.aadhar_number.split())) if profile.aadhar_number else None
+        )
+    
+    # Legacy rows may differ only in case or whitespace; name them rather
+    # than failing on the unique index halfway through the update
+    for field in ('pan_hash', 'aadhar_hash'):
+        owners = {}
+        for profile in profiles:
+            digest = getattr(profile, field)
+            if digest is not None:
+                owners.setdefault(digest, []).append(profile.pk)
+        duplicates = [pks for pks in owners.values() if len(pks) > 1]
+        if duplicates:
+            groups = '; '.join(', '.join(map(str, pks)) for pks in duplicates)
+            raise RuntimeError(
+                f"Customer profiles share a normalized {field.split('_')[0]} number and "
+                f"must be merged or corrected before migrating (profile ids: {groups})"
+            )
+    
+    CustomerProfile.objects.bulk_update(profiles, ['pan_hash', 'aadhar_hash'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0003_fleet_fleetriskscore_fleetvehicle_fleetclaimhistory'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customerprofile',
+            name='aadhar_hash',
+            field=models.CharField(editable=False, max_length=64, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='customerprofile',
+            name='pan_hash',
+            field=models.CharField(editable=False, max_length=64, null=True, unique=True),
+        ),
+        migrations.RunPython(backfill_identity_hashes, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='customerprofile',
+            name='aadhar_number',
+            field=models.CharField(blank=True, max_length=50, null=True),
+        ),
+        migrations.AlterField(
+            model_name='customerprofile',
+            name='pan_number',
+            field=models.CharField(blank=True, max_length=50, null=True),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0004_customerprofile_identity_hashes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customerprofile',
+            index=models.Index(fields=['occupation_type'], name='customers_occupat_148699_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customerprofile',
+            index=models.Index(fields=['residential_state', 'residential_city'], name='customers_residen_62be1f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customerprofile',
+            index=models.Index(fields=['residential_city'], name='customers_residen_866651_idx'),
+        ),
+    ]
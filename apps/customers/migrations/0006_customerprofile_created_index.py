@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:59
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0005_customerprofile_filter_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customerprofile',
+            index=models.Index(fields=['-created_at', '-id'], name='customers_created_2f222d_idx'),
+        ),
+    ]
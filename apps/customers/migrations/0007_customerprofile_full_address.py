@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-16 04:05
+
+from django.db import migrations, models
+
+
+ADDRESS_FIELDS = (
+    'residential_address', 'residential_city', 'residential_state',
+    'residential_country', 'residential_pincode',
+)
+
+
+def backfill_full_address(apps, schema_editor):
+    # Same join as CustomerProfile.save
+    CustomerProfile = apps.get_model('customers', 'CustomerProfile')
+    profiles = list(CustomerProfile.objects.only(*ADDRESS_FIELDS))
+    for profile in profiles:
+        profile.full_address = ', '.join(
+            part for part in (getattr(profile, name) for name in ADDRESS_FIELDS) if part
+        )
+    CustomerProfile.objects.bulk_update(profiles, ['full_address'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0006_customerprofile_created_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customerprofile',
+            name='full_address',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.RunPython(backfill_full_address, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 04:03
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('customers', '0007_customerprofile_full_address'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='customerdrivinghistory',
+            name='last_updated',
+        ),
+    ]
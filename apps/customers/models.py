@@ -8,8 +8,25 @@ Note: PAN/Aadhaar fields are stored for academic simulation only.
 Production systems require field-level encryption and compliance.
 """
 
+from datetime import date
+from decimal import Decimal
+from functools import cached_property
+import hashlib
+import hmac
+
 from django.db import models
+from django.db.models import Case, CharField, F, Q, Sum, Value, When
+from django.db.models.functions import Concat, ExtractYear, Length, Right
+from django.db.models.lookups import GreaterThanOrEqual, LessThanOrEqual
 from django.conf import settings
+from django.utils import timezone
+
+
+def pii_digest(value):
+    """Hex HMAC-SHA256 of an identity number, keyed by PII_HMAC_KEY."""
+    return hmac.new(
+        settings.PII_HMAC_KEY.encode(), value.encode(), hashlib.sha256
+    ).hexdigest()
 
 
 class CustomerProfile(models.Model):
@@ -59,8 +76,12 @@ class CustomerProfile(models.Model):
     nationality = models.CharField(max_length=100, default='Indian')
     
     # Identity Documents (Academic simulation only - requires encryption in production)
-    pan_number = models.CharField(max_length=50, unique=True, null=True, blank=True)
-    aadhar_number = models.CharField(max_length=50, unique=True, null=True, blank=True)
+    pan_number = models.CharField(max_length=50, null=True, blank=True)
+    aadhar_number = models.CharField(max_length=50, null=True, blank=True)
+    # Uniqueness and lookups go through these keyed hashes (set in save),
+    # so the raw numbers can later be encrypted or dropped
+    pan_hash = models.CharField(max_length=64, unique=True, null=True, editable=False)
+    aadhar_hash = models.CharField(max_length=64, unique=True, null=True, editable=False)
     
     # Residential Address
     residential_address = models.TextField(blank=True)
@@ -68,6 +89,8 @@ class CustomerProfile(models.Model):
     residential_state = models.CharField(max_length=100, blank=True)
     residential_country = models.CharField(max_length=100, default='India')
     residential_pincode = models.CharField(max_length=10, blank=True)
+    # ADDRESS_FIELDS joined for display (set in save)
+    full_address = models.TextField(blank=True, editable=False)
     
     # Professional Details
     occupation_type = models.CharField(max_length=50, choices=OCCUPATION_CHOICES, blank=True)
@@ -90,41 +113,131 @@ class CustomerProfile(models.Model):
         db_table = 'customers'
         verbose_name = 'Customer Profile'
         verbose_name_plural = 'Customer Profiles'
+        indexes = [
+            # CustomerListView filters
+            models.Index(fields=['occupation_type']),
+            models.Index(fields=['residential_state', 'residential_city']),
+            models.Index(fields=['residential_city']),
+            # CustomerListView keyset pagination
+            models.Index(fields=['-created_at', '-id']),
+        ]
     
     def __str__(self):
         return f"Profile: {self.user.email}"
     
-    @property
-    def full_address(self):
-        """Return formatted full address."""
-        parts = [
-            self.residential_address,
-            self.residential_city,
-            self.residential_state,
-            self.residential_country,
-            self.residential_pincode
-        ]
-        return ', '.join(filter(None, parts))
+    # Derived values computed once per instance (see save)
+    CACHED_PROPERTIES = ('masked_pan', 'masked_aadhar', 'age')
     
-    @property
+    ADDRESS_FIELDS = (
+        'residential_address', 'residential_city', 'residential_state',
+        'residential_country', 'residential_pincode',
+    )
+    
+    def save(self, *args, **kwargs):
+        # Fields may have been edited since a derived value was cached
+        for name in self.CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
+        
+        self.pan_hash = self.hash_pan(self.pan_number)
+        self.aadhar_hash = self.hash_aadhar(self.aadhar_number)
+        self.full_address = ', '.join(
+            part for part in (getattr(self, name) for name in self.ADDRESS_FIELDS) if part
+        )
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if 'pan_number' in update_fields:
+                update_fields.add('pan_hash')
+            if 'aadhar_number' in update_fields:
+                update_fields.add('aadhar_hash')
+            if not update_fields.isdisjoint(self.ADDRESS_FIELDS):
+                update_fields.add('full_address')
+            kwargs['update_fields'] = update_fields
+        super().save(*args, **kwargs)
+    
+    @classmethod
+    def age_expression(cls):
+        """
+        SQL equivalent of the age property: whole years since
+        date_of_birth as of today, minus one before this year's birthday.
+        """
+        today = timezone.localdate()
+        birthday_ahead = Q(date_of_birth__month__gt=today.month) | Q(
+            date_of_birth__month=today.month, date_of_birth__day__gt=today.day
+        )
+        return Value(today.year) - ExtractYear('date_of_birth') - Case(
+            When(birthday_ahead, then=Value(1)), default=Value(0)
+        )
+    
+    @classmethod
+    def list_qs(cls):
+        """
+        Customer list rows as plain dicts (no model instances): the
+        columns the list renders, the user's name and email, and age
+        computed in the query.
+        """
+        return cls.objects.annotate(age=cls.age_expression()).values(
+            'id', 'date_of_birth', 'age', 'gender', 'residential_city',
+            'residential_state', 'occupation_type', 'created_at',
+            'user__email', 'user__first_name', 'user__last_name',
+        )
+    
+    @staticmethod
+    def mask_expression(field_name):
+        """SQL equivalent of masked_pan/masked_aadhar for the given column."""
+        return Case(
+            When(
+                GreaterThanOrEqual(Length(field_name), 4),
+                then=Concat(Value('XXXX-XXXX-'), Right(field_name, 4)),
+            ),
+            default=Value(None),
+            output_field=CharField(),
+        )
+    
+    @classmethod
+    def detail_qs(cls):
+        """Profiles with the user joined and identity numbers masked in the query."""
+        return cls.objects.select_related('user').annotate(
+            masked_pan=cls.mask_expression('pan_number'),
+            masked_aadhar=cls.mask_expression('aadhar_number'),
+        )
+    
+    @staticmethod
+    def hash_pan(pan_number):
+        """Lookup hash for a PAN (case and padding insensitive)."""
+        if not pan_number:
+            return None
+        return pii_digest(pan_number.strip().upper())
+    
+    @staticmethod
+    def hash_aadhar(aadhar_number):
+        """Lookup hash for an Aadhaar number (spacing insensitive)."""
+        if not aadhar_number:
+            return None
+        return pii_digest(''.join(aadhar_number.split()))
+    
+    @cached_property
     def masked_pan(self):
-        """Return masked PAN number (show only last 4 digits)."""
+        """
+        Return masked PAN number (show only last 4 digits).
+        
+        Annotated by detail_qs; computed here for other querysets.
+        """
         if self.pan_number and len(self.pan_number) >= 4:
             return f"XXXX-XXXX-{self.pan_number[-4:]}"
         return None
     
-    @property
+    @cached_property
     def masked_aadhar(self):
         """Return masked Aadhaar number (show only last 4 digits)."""
         if self.aadhar_number and len(self.aadhar_number) >= 4:
             return f"XXXX-XXXX-{self.aadhar_number[-4:]}"
         return None
     
-    @property
+    @cached_property
     def age(self):
         """Calculate age from date of birth."""
         if self.date_of_birth:
-            from datetime import date
             today = date.today()
             return today.year - self.date_of_birth.year - (
                 (today.month, today.day) < (self.date_of_birth.month, self.date_of_birth.day)
@@ -225,7 +338,6 @@ class CustomerDrivingHistory(models.Model):
     # Suspension history
     suspension_count = models.PositiveIntegerField(default=0)
     
-    last_updated = models.DateField(auto_now=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -235,6 +347,11 @@ class CustomerDrivingHistory(models.Model):
     def __str__(self):
         return f"Driving History: {self.customer.user.email}"
     
+    @property
+    def last_updated(self):
+        """Local date of the last update (formerly its own column)."""
+        return timezone.localdate(self.updated_at) if self.updated_at else None
+    
     @property
     def is_clean_record(self):
         """Check if customer has a clean driving record."""
@@ -273,6 +390,22 @@ class ClaimHistory(models.Model):
     def __str__(self):
         return f"Claim History: {self.customer.user.email} ({self.claim_year})"
     
+    @classmethod
+    def summary_for_customer(cls, customer_id, since_year=None):
+        """
+        Claim totals across a customer's yearly rows (from since_year
+        on, if given), summed in one aggregate query.
+        """
+        histories = cls.objects.filter(customer_id=customer_id)
+        if since_year is not None:
+            histories = histories.filter(claim_year__gte=since_year)
+        return histories.aggregate(
+            total_claims=Sum('claim_count', default=0),
+            total_amount=Sum('claim_amount_total', default=Decimal('0')),
+            total_approved=Sum('claim_approved_amount', default=Decimal('0')),
+            total_rejections=Sum('claim_rejection_count', default=0),
+        )
+    
     @property
     def claim_rejection_rate(self):
         """Calculate claim rejection rate."""
@@ -345,43 +478,79 @@ class CustomerRiskProfile(models.Model):
     def __str__(self):
         return f"Risk Profile: {self.customer.user.email} ({self.risk_category})"
     
+    # Weights of the individual factors in risk_score
+    RISK_WEIGHTS = {
+        'age_risk_factor': Decimal('0.15'),
+        'medical_risk_factor': Decimal('0.25'),
+        'driving_risk_factor': Decimal('0.25'),
+        'claim_history_risk_factor': Decimal('0.25'),
+        'employment_risk_factor': Decimal('0.10'),
+    }
+    
+    # (highest score, category, premium adjustment %), checked in order;
+    # scores above the last bound are CRITICAL
+    RISK_BANDS = [
+        (25, 'LOW', Decimal('-10')),  # Discount
+        (50, 'MEDIUM', Decimal('0')),
+        (75, 'HIGH', Decimal('15')),  # Surcharge
+    ]
+    CRITICAL_BAND = ('CRITICAL', Decimal('30'))  # High surcharge
+    
     def calculate_overall_risk(self):
         """Calculate overall risk score from individual factors."""
-        from decimal import Decimal
-        
         # Weighted average of factors
-        weights = {
-            'age': Decimal('0.15'),
-            'medical': Decimal('0.25'),
-            'driving': Decimal('0.25'),
-            'claim_history': Decimal('0.25'),
-            'employment': Decimal('0.10'),
-        }
-        
-        self.risk_score = (
-            self.age_risk_factor * weights['age'] +
-            self.medical_risk_factor * weights['medical'] +
-            self.driving_risk_factor * weights['driving'] +
-            self.claim_history_risk_factor * weights['claim_history'] +
-            self.employment_risk_factor * weights['employment']
+        self.risk_score = sum(
+            getattr(self, field) * weight for field, weight in self.RISK_WEIGHTS.items()
         )
         
         # Determine category
-        if self.risk_score <= 25:
-            self.risk_category = 'LOW'
-            self.overall_risk_percentage = Decimal('-10')  # Discount
-        elif self.risk_score <= 50:
-            self.risk_category = 'MEDIUM'
-            self.overall_risk_percentage = Decimal('0')
-        elif self.risk_score <= 75:
-            self.risk_category = 'HIGH'
-            self.overall_risk_percentage = Decimal('15')  # Surcharge
-        else:
-            self.risk_category = 'CRITICAL'
-            self.overall_risk_percentage = Decimal('30')  # High surcharge
+        self.risk_category, self.overall_risk_percentage = self.CRITICAL_BAND
+        for bound, category, percentage in self.RISK_BANDS:
+            if self.risk_score <= bound:
+                self.risk_category = category
+                self.overall_risk_percentage = percentage
+                break
         
-        self.save()
+        # Only the factors (callers often set one just before calling)
+        # and what is derived from them
+        if self.pk is None:
+            self.save()
+        else:
+            self.save(update_fields=[
+                *self.RISK_WEIGHTS, 'risk_score', 'risk_category',
+                'overall_risk_percentage', 'calculated_at', 'updated_at',
+            ])
         return self.risk_score
+    
+    @classmethod
+    def recompute_all(cls, queryset=None):
+        """
+        calculate_overall_risk for every profile in queryset (default
+        all) as a single UPDATE. Returns the number of rows updated.
+        """
+        if queryset is None:
+            queryset = cls.objects.all()
+        
+        score = sum(
+            (F(field) * Value(weight) for field, weight in cls.RISK_WEIGHTS.items()),
+            Value(Decimal('0')),
+        )
+        
+        def banded(index, default):
+            return Case(
+                *[When(LessThanOrEqual(score, Value(band[0])), then=Value(band[index]))
+                  for band in cls.RISK_BANDS],
+                default=Value(default),
+            )
+        
+        now = timezone.now()
+        return queryset.update(
+            risk_score=score,
+            risk_category=banded(1, cls.CRITICAL_BAND[0]),
+            overall_risk_percentage=banded(2, cls.CRITICAL_BAND[1]),
+            calculated_at=now,
+            updated_at=now,
+        )
 
 
 # Import fleet models for convenience
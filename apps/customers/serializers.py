@@ -4,12 +4,21 @@ Serializers for Customer Profiling module.
 Note: PAN/Aadhaar are masked in responses for security.
 """
 
+import re
+
+from django.db.models import Q
 from rest_framework import serializers
 from datetime import date
 
 from .models import CustomerProfile
 
 
+PAN_RE = re.compile(r'[A-Z]{5}[0-9]{4}[A-Z]')
+AADHAR_RE = re.compile(r'[0-9]{12}')
+# Deletes whitespace in one str.translate pass
+WHITESPACE_TABLE = str.maketrans('', '', ' \t\n\r')
+
+
 class CustomerProfileSerializer(serializers.ModelSerializer):
     """
     Serializer for CustomerProfile with masked sensitive fields.
@@ -68,19 +77,51 @@ class CustomerProfileCreateUpdateSerializer(serializers.ModelSerializer):
     def validate_pan_number(self, value):
         """Validate PAN format (basic check)."""
         if value:
-            value = value.upper().strip()
-            if len(value) != 10:
-                raise serializers.ValidationError("PAN must be 10 characters.")
+            value = value.translate(WHITESPACE_TABLE).upper()
+            if not PAN_RE.fullmatch(value):
+                raise serializers.ValidationError(
+                    "PAN must be 10 characters: 5 letters, 4 digits, 1 letter."
+                )
         return value
     
     def validate_aadhar_number(self, value):
         """Validate Aadhaar format (basic check)."""
         if value:
-            value = value.strip().replace(' ', '')
-            if len(value) != 12 or not value.isdigit():
+            value = value.translate(WHITESPACE_TABLE)
+            if not AADHAR_RE.fullmatch(value):
                 raise serializers.ValidationError("Aadhaar must be 12 digits.")
         return value
     
+    def validate(self, attrs):
+        """Reject a PAN or Aadhaar already on another profile, in one query."""
+        digests = {
+            'pan_hash': CustomerProfile.hash_pan(attrs.get('pan_number')),
+            'aadhar_hash': CustomerProfile.hash_aadhar(attrs.get('aadhar_number')),
+        }
+        lookup = Q()
+        for hash_field, digest in digests.items():
+            if digest:
+                lookup |= Q(**{hash_field: digest})
+        if not lookup:
+            return attrs
+        
+        others = CustomerProfile.objects.filter(lookup)
+        if self.instance is not None:
+            others = others.exclude(pk=self.instance.pk)
+        taken = set()
+        for pan_hash, aadhar_hash in others.values_list('pan_hash', 'aadhar_hash'):
+            taken.update((pan_hash, aadhar_hash))
+        taken.discard(None)
+        
+        errors = {}
+        if digests['pan_hash'] in taken:
+            errors['pan_number'] = "A profile with this PAN already exists."
+        if digests['aadhar_hash'] in taken:
+            errors['aadhar_number'] = "A profile with this Aadhaar already exists."
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
+    
     def update(self, instance, validated_data):
         """Prevent updating PAN/Aadhaar once set."""
         if instance.pan_number and 'pan_number' in validated_data:
@@ -90,16 +131,41 @@ class CustomerProfileCreateUpdateSerializer(serializers.ModelSerializer):
         return super().update(instance, validated_data)
 
 
-class CustomerProfileListSerializer(serializers.ModelSerializer):
-    """Lightweight serializer for listing customers (Admin/Backoffice view)."""
-    user_email = serializers.CharField(source='user.email', read_only=True)
-    user_name = serializers.CharField(source='user.get_full_name', read_only=True)
-    age = serializers.IntegerField(read_only=True)
+class CustomerProfileListSerializer(serializers.Serializer):
+    """
+    Lightweight serializer for listing customers (Admin/Backoffice view).
     
-    class Meta:
-        model = CustomerProfile
-        fields = [
-            'id', 'user_email', 'user_name', 'date_of_birth', 'age',
-            'gender', 'residential_city', 'residential_state',
-            'occupation_type', 'created_at'
-        ]
+    Reads the dict rows of CustomerProfile.list_qs().
+    """
+    id = serializers.IntegerField()
+    user_email = serializers.CharField(source='user__email')
+    user_name = serializers.SerializerMethodField()
+    date_of_birth = serializers.DateField()
+    age = serializers.IntegerField()
+    gender = serializers.CharField()
+    residential_city = serializers.CharField()
+    residential_state = serializers.CharField()
+    occupation_type = serializers.CharField()
+    created_at = serializers.DateTimeField()
+    
+    def get_user_name(self, row):
+        # Same as User.get_full_name()
+        return f"{row['user__first_name']} {row['user__last_name']}".strip()
+    
+    def to_representation(self, row):
+        # Hand-written equivalent of the declared fields: one dict per row
+        # instead of a get_attribute/to_representation call per field
+        date_of_birth = row['date_of_birth']
+        created_at = row['created_at']
+        return {
+            'id': row['id'],
+            'user_email': row['user__email'],
+            'user_name': self.get_user_name(row),
+            'date_of_birth': date_of_birth.isoformat() if date_of_birth else None,
+            'age': row['age'],
+            'gender': row['gender'],
+            'residential_city': row['residential_city'],
+            'residential_state': row['residential_state'],
+            'occupation_type': row['occupation_type'],
+            'created_at': self.fields['created_at'].to_representation(created_at),
+        }
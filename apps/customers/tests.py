@@ -1,3 +1,187 @@
-from django.test import TestCase
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.accounts.models import Role, User, UserRole
+
+from . import views
+from .models import CustomerProfile, CustomerRiskProfile, Fleet, FleetVehicle
+
+
+def make_user(email, role_name, **extra):
+    user = User.objects.create_user(
+        username=email, email=email, password='Str0ngPass!x', **extra
+    )
+    role, _ = Role.objects.get_or_create(role_name=role_name)
+    UserRole.objects.create(user=user, role=role)
+    return user
+
+
+class CustomerExportViewTests(TestCase):
+    url = '/api/v1/customers/export/'
+    
+    def setUp(self):
+        self.client = APIClient()
+        self.staff = make_user('staff@example.com', Role.ROLE_BACKOFFICE)
+        customer = make_user(
+            'mallory@example.com', Role.ROLE_CUSTOMER,
+            first_name='=HYPERLINK("http://evil")', last_name='Doe',
+        )
+        CustomerProfile.objects.create(user=customer, residential_city='@SUM(1)')
+    
+    def export(self, **headers):
+        response = self.client.get(self.url, **headers)
+        return response, b''.join(response.streaming_content).decode()
+    
+    def test_accepts_text_csv(self):
+        self.client.force_authenticate(self.staff)
+        response, body = self.export(HTTP_ACCEPT='text/csv')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        self.assertTrue(body.startswith('id,user_email,user_name,'))
+    
+    def test_escapes_formula_cells(self):
+        self.client.force_authenticate(self.staff)
+        _, body = self.export()
+        self.assertIn('"\'=HYPERLINK(""http://evil"") Doe"', body)
+        self.assertIn(",'@SUM(1),", body)
+    
+    def test_pages_through_all_rows(self):
+        for i in range(3):
+            user = make_user(f'c{i}@example.com', Role.ROLE_CUSTOMER)
+            CustomerProfile.objects.create(user=user)
+        self.client.force_authenticate(self.staff)
+        with mock.patch.object(views, 'CUSTOMER_EXPORT_CHUNK_SIZE', 2):
+            _, body = self.export()
+        self.assertEqual(len(body.splitlines()), 5)  # header + 4 customers
+    
+    def test_customers_are_forbidden(self):
+        self.client.force_authenticate(User.objects.get(email='mallory@example.com'))
+        response = self.client.get(self.url, HTTP_ACCEPT='text/csv')
+        self.assertEqual(response.status_code, 403)
+
+
+class CustomerRiskProfileTests(TestCase):
+    
+    def setUp(self):
+        user = make_user('risk@example.com', Role.ROLE_CUSTOMER)
+        self.profile = CustomerRiskProfile.objects.create(
+            customer=CustomerProfile.objects.create(user=user)
+        )
+    
+    def test_calculate_overall_risk_saves_changed_factor(self):
+        self.profile.age_risk_factor = Decimal('100')
+        self.profile.calculate_overall_risk()
+        
+        stored = CustomerRiskProfile.objects.get(pk=self.profile.pk)
+        self.assertEqual(stored.age_risk_factor, Decimal('100'))
+        self.assertEqual(stored.risk_score, Decimal('15'))
+        self.assertEqual(stored.risk_category, 'LOW')
+    
+    def test_recompute_all_matches_calculate_overall_risk(self):
+        CustomerRiskProfile.objects.filter(pk=self.profile.pk).update(
+            medical_risk_factor=Decimal('80'), driving_risk_factor=Decimal('80'),
+            claim_history_risk_factor=Decimal('80'),
+        )
+        self.assertEqual(CustomerRiskProfile.recompute_all(), 1)
+        
+        stored = CustomerRiskProfile.objects.get(pk=self.profile.pk)
+        self.assertEqual(stored.risk_score, Decimal('60'))
+        self.assertEqual(stored.risk_category, 'HIGH')
+        self.assertEqual(stored.overall_risk_percentage, Decimal('15'))
+
+
+class FleetVehicleCountTests(TestCase):
+    
+    def setUp(self):
+        customer = CustomerProfile.objects.create(
+            user=make_user('fleet@example.com', Role.ROLE_CUSTOMER)
+        )
+        self.fleet = Fleet.objects.create(customer=customer, fleet_name='North')
+        self.other = Fleet.objects.create(customer=customer, fleet_name='South')
+    
+    def add_vehicle(self, registration, fleet=None, status='ACTIVE'):
+        return FleetVehicle.objects.create(
+            fleet=fleet or self.fleet, vehicle_registration_number=registration,
+            vehicle_status=status,
+        )
+    
+    def assertCounts(self, fleet_count, other_count):
+        self.assertEqual(
+            (Fleet.objects.get(pk=self.fleet.pk).total_vehicles,
+             Fleet.objects.get(pk=self.other.pk).total_vehicles),
+            (fleet_count, other_count),
+        )
+    
+    def test_create_counts_only_active_vehicles(self):
+        self.add_vehicle('KA01A1')
+        self.add_vehicle('KA01A2', status='SOLD')
+        self.assertCounts(1, 0)
+    
+    def test_status_changes_adjust_count(self):
+        vehicle = self.add_vehicle('KA01A1')
+        vehicle.vehicle_status = 'SOLD'
+        vehicle.save()
+        self.assertCounts(0, 0)
+        
+        vehicle = FleetVehicle.objects.get(pk=vehicle.pk)
+        vehicle.vehicle_status = 'ACTIVE'
+        vehicle.save()
+        vehicle.vehicle_make = 'Tata'
+        vehicle.save()
+        self.assertCounts(1, 0)
+    
+    def test_move_between_fleets_shifts_count(self):
+        vehicle = self.add_vehicle('KA01A1')
+        vehicle = FleetVehicle.objects.get(pk=vehicle.pk)
+        vehicle.fleet = self.other
+        vehicle.save()
+        self.assertCounts(0, 1)
+        
+        inactive = self.add_vehicle('KA01A2', status='INACTIVE')
+        inactive.fleet = self.other
+        inactive.save()
+        self.assertCounts(0, 1)
+    
+    def test_delete_decrements_only_active_vehicles(self):
+        active = self.add_vehicle('KA01A1')
+        self.add_vehicle('KA01A2')
+        sold = self.add_vehicle('KA01A3', status='SOLD')
+        FleetVehicle.objects.get(pk=active.pk).delete()
+        sold.delete()
+        self.assertCounts(1, 0)
+    
+    def test_add_vehicles_counts_bulk_created_active_rows(self):
+        self.add_vehicle('KA01A1')
+        created = self.fleet.add_vehicles([
+            {'vehicle_registration_number': 'KA01A1'},
+            {'vehicle_registration_number': 'KA01A2'},
+            {'vehicle_registration_number': 'KA01A2'},
+            {'vehicle_registration_number': 'KA01A3', 'vehicle_status': 'SCRAPPED'},
+            {'vehicle_registration_number': 'KA01A4'},
+        ])
+        self.assertEqual(len(created), 3)
+        self.assertEqual(self.fleet.total_vehicles, 3)
+        self.assertCounts(3, 0)
+        
+        self.fleet.update_vehicle_count()
+        self.assertCounts(3, 0)
+
+
+class RehashIdentityNumbersTests(TestCase):
+    
+    def test_rehashes_with_current_key(self):
+        user = make_user('pan@example.com', Role.ROLE_CUSTOMER)
+        profile = CustomerProfile.objects.create(user=user, pan_number='ABCDE1234F')
+        
+        with override_settings(PII_HMAC_KEY='rotated-key'):
+            call_command('rehash_identity_numbers', stdout=StringIO())
+            expected = CustomerProfile.hash_pan('ABCDE1234F')
+        
+        profile.refresh_from_db()
+        self.assertEqual(profile.pan_hash, expected)
+        self.assertIsNone(profile.aadhar_hash)
@@ -3,17 +3,26 @@ Views for Customer Profiling module.
 
 Provides API endpoints for:
 - Customer profile management (own profile for customers)
-- Customer listing (Admin/Backoffice only)
+- Customer listing and CSV export (Admin/Backoffice only)
 """
 
+import csv
+
+from django.core.cache import cache
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 from rest_framework import generics, viewsets, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.pagination import CursorPagination
+from rest_framework.renderers import BrowsableAPIRenderer
 
 from apps.accounts.permissions import IsAdminOrBackoffice, IsOwnerOrAdmin
 from apps.accounts.models import Role
+from apps.catalog.renderers import ORJSONRenderer
 
 from .models import CustomerProfile
+from .renderers import CSVRenderer
 from .serializers import (
     CustomerProfileSerializer,
     CustomerProfileCreateUpdateSerializer,
@@ -21,6 +30,26 @@ from .serializers import (
 )
 
 
+# Seconds a customer detail response is reused (a save to the profile
+# or its user changes the cache key earlier)
+CUSTOMER_DETAIL_TTL = 300
+
+# Rows fetched and serialized at a time by the customer export
+CUSTOMER_EXPORT_CHUNK_SIZE = 500
+
+
+class CustomerCursorPagination(CursorPagination):
+    """
+    Newest-first keyset pagination for the customer list, which avoids
+    the COUNT(*) and OFFSET scan of page-number pagination.
+    """
+    page_size = 50
+    page_size_query_param = 'per_page'
+    max_page_size = 100
+    # id breaks ties between profiles created in the same instant
+    ordering = ('-created_at', '-id')
+
+
 class CustomerProfileView(generics.RetrieveUpdateAPIView):
     """
     API endpoint for current customer's profile.
@@ -35,6 +64,9 @@ class CustomerProfileView(generics.RetrieveUpdateAPIView):
         profile, created = CustomerProfile.objects.get_or_create(
             user=self.request.user
         )
+        # The serializers read user fields; reuse the already-loaded
+        # request.user instead of fetching it again
+        profile.user = self.request.user
         return profile
     
     def get_serializer_class(self):
@@ -63,9 +95,11 @@ class CustomerListView(generics.ListAPIView):
     
     GET /api/v1/customers/   - List all customers (Admin/Backoffice only)
     """
-    queryset = CustomerProfile.objects.select_related('user').all()
+    queryset = CustomerProfile.list_qs()
     serializer_class = CustomerProfileListSerializer
     permission_classes = [IsAuthenticated, IsAdminOrBackoffice]
+    pagination_class = CustomerCursorPagination
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
     
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -75,22 +109,94 @@ class CustomerListView(generics.ListAPIView):
         state = self.request.query_params.get('state')
         occupation = self.request.query_params.get('occupation')
         
+        # Prefix matches (LIKE 'x%') so the city/state indexes apply
         if city:
-            queryset = queryset.filter(residential_city__icontains=city)
+            queryset = queryset.filter(residential_city__istartswith=city)
         if state:
-            queryset = queryset.filter(residential_state__icontains=state)
+            queryset = queryset.filter(residential_state__istartswith=state)
         if occupation:
             queryset = queryset.filter(occupation_type=occupation)
         
         return queryset
 
 
+class _Echo:
+    """File-like object whose write returns the line for csv.writer."""
+    
+    def write(self, value):
+        return value
+
+
+# Leading characters that make spreadsheet apps treat a cell as a formula
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _csv_safe(value):
+    """Quote customer-entered text that would otherwise run as a formula."""
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+class CustomerExportView(CustomerListView):
+    """
+    API endpoint for exporting customers as CSV.
+    
+    GET /api/v1/customers/export/ - All customers matching the list
+                                    filters (Admin/Backoffice only)
+    
+    Rows are read in id-keyset pages of CUSTOMER_EXPORT_CHUNK_SIZE and
+    streamed as they are serialized. (iterator() would not bound memory
+    on MySQL, which buffers the whole result set client-side.)
+    """
+    pagination_class = None
+    renderer_classes = [ORJSONRenderer, CSVRenderer]
+    
+    def list(self, request, *args, **kwargs):
+        queryset = self.get_queryset().order_by('id')
+        fields = list(self.get_serializer().fields)
+        
+        def stream():
+            writer = csv.writer(_Echo())
+            yield writer.writerow(fields)
+            last_id = 0
+            while True:
+                chunk = list(queryset.filter(id__gt=last_id)[:CUSTOMER_EXPORT_CHUNK_SIZE])
+                if not chunk:
+                    break
+                last_id = chunk[-1]['id']
+                for item in self.get_serializer(chunk, many=True).data:
+                    yield writer.writerow([_csv_safe(item[field]) for field in fields])
+        
+        response = StreamingHttpResponse(stream(), content_type='text/csv')
+        response['Content-Disposition'] = 'attachment; filename="customers.csv"'
+        return response
+
+
 class CustomerDetailView(generics.RetrieveAPIView):
     """
     API endpoint for viewing customer details.
     
     GET /api/v1/customers/{id}/ - Get customer details (Admin/Backoffice only)
     """
-    queryset = CustomerProfile.objects.select_related('user').all()
+    queryset = CustomerProfile.detail_qs()
     serializer_class = CustomerProfileSerializer
     permission_classes = [IsAuthenticated, IsAdminOrBackoffice]
+    
+    def retrieve(self, request, *args, **kwargs):
+        stamps = CustomerProfile.objects.filter(
+            pk=self.kwargs[self.lookup_field]
+        ).values_list('updated_at', 'user__updated_at').first()
+        if stamps is None:
+            return super().retrieve(request, *args, **kwargs)  # 404
+        
+        # Keyed on both updated_at stamps, and today's date for the age
+        cache_key = 'customer_detail:{}:{}:{}:{}'.format(
+            self.kwargs[self.lookup_field],
+            stamps[0].timestamp(), stamps[1].timestamp(), timezone.localdate(),
+        )
+        data = cache.get(cache_key)
+        if data is None:
+            data = super().retrieve(request, *args, **kwargs).data
+            cache.set(cache_key, data, CUSTOMER_DETAIL_TTL)
+        return Response(data)
@@ -265,7 +265,7 @@ class CustomerClaimListView(CustomerRequiredMixin, ListView):
     
     def get_queryset(self):
         customer = CustomerProfile.objects.get(user=self.request.user)
-        return Claim.objects.filter(customer=customer).order_by('-created_at')
+        return Claim.list_row_qs().filter(customer=customer).order_by('-created_at')
 
 
 class CustomerClaimCreateView(CustomerRequiredMixin, TemplateView):
@@ -319,7 +319,10 @@ class CustomerProfileView(CustomerRequiredMixin, TemplateView):
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        profile = CustomerProfile.objects.get(user=self.request.user)
+        # One JOIN loads both one-to-one reverse relations read below
+        profile = CustomerProfile.objects.select_related(
+            'driving_history', 'risk_profile'
+        ).get(user=self.request.user)
         context['profile'] = profile
         
         # Medical disclosure for health insurance
@@ -372,15 +375,9 @@ class InsuranceTypeDetailView(CustomerRequiredMixin, TemplateView):
         # Get active companies
         context['companies'] = InsuranceCompany.objects.filter(is_active=True)
         
-        # Icon mapping
-        icon_map = {
-            'MOTOR': 'car-front',
-            'HEALTH': 'heart-pulse',
-            'TRAVEL': 'airplane',
-            'WC': 'briefcase',
-            'CPM': 'building',
-        }
-        context['icon_name'] = icon_map.get(insurance_type.type_code, 'shield')
+        # Icon mapping (shared with the explore API)
+        from apps.catalog.serializers import ICON_MAP
+        context['icon_name'] = ICON_MAP.get(insurance_type.type_code, 'shield')
         
         return context
 
@@ -484,7 +481,7 @@ class BackofficeClaimListView(BackofficeRequiredMixin, ListView):
     
     def get_queryset(self):
         status_filter = self.request.GET.get('status')
-        queryset = Claim.objects.all().order_by('-created_at')
+        queryset = Claim.review_list_qs().order_by('-created_at')
         if status_filter:
             queryset = queryset.filter(status=status_filter)
         return queryset
@@ -496,6 +493,10 @@ class BackofficeClaimDetailView(BackofficeRequiredMixin, DetailView):
     context_object_name = 'claim'
     model = Claim
     
+    def get_queryset(self):
+        # Everything the page reads off the claim, in one query
+        return Claim.list_qs().select_related('policy__insurance_type', 'settlement')
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         claim = self.object
@@ -504,7 +505,7 @@ class BackofficeClaimDetailView(BackofficeRequiredMixin, DetailView):
         from apps.claims.models import ClaimStatusHistory, ClaimAssessment, ClaimSettlement
         context['status_history'] = ClaimStatusHistory.objects.filter(
             claim=claim
-        ).order_by('-status_changed_at')
+        ).select_related('changed_by').order_by('-status_changed_at')
         
         # Assessments
         context['assessments'] = ClaimAssessment.objects.filter(
@@ -713,7 +714,7 @@ class AdminInsuranceTypeListView(AdminRequiredMixin, ListView):
     context_object_name = 'types'
     
     def get_queryset(self):
-        queryset = InsuranceType.objects.prefetch_related('coverage_types').all()
+        queryset = InsuranceType.objects.all()
         
         # Search functionality
         search_query = self.request.GET.get('q', '').strip()
@@ -731,16 +732,24 @@ class AdminInsuranceTypeListView(AdminRequiredMixin, ListView):
         elif is_active == 'false':
             queryset = queryset.filter(is_active=False)
         
-        # Annotate with coverage count and premium range
-        types_with_data = []
-        for ins_type in queryset:
-            premiums = [c.base_premium_per_unit for c in ins_type.coverage_types.all() if c.base_premium_per_unit]
-            ins_type.min_premium = min(premiums) if premiums else 0
-            ins_type.max_premium = max(premiums) if premiums else 0
-            ins_type.coverage_count = ins_type.coverage_types.count()
-            types_with_data.append(ins_type)
-        
-        return types_with_data
+        # Annotate with coverage count and premium range in one grouped
+        # query (zero/blank premiums don't count toward the range)
+        from decimal import Decimal
+        from django.db.models import DecimalField, Max, Min, Value
+        from django.db.models.functions import Coalesce
+        
+        priced = Q(coverage_types__base_premium_per_unit__gt=0)
+        return queryset.annotate(
+            min_premium=Coalesce(
+                Min('coverage_types__base_premium_per_unit', filter=priced),
+                Value(Decimal('0')), output_field=DecimalField()
+            ),
+            max_premium=Coalesce(
+                Max('coverage_types__base_premium_per_unit', filter=priced),
+                Value(Decimal('0')), output_field=DecimalField()
+            ),
+            coverage_count=Count('coverage_types'),
+        ).order_by('type_name')
 
 
 class AdminCoverageTypeListView(AdminRequiredMixin, ListView):
@@ -1120,21 +1129,27 @@ class AdminPremiumSlabListView(AdminRequiredMixin, ListView):
         from apps.catalog.config_models import PremiumSlab
         from decimal import Decimal
         from django.contrib import messages
+        from django.core.exceptions import ValidationError
         
         action = request.POST.get('action', 'create')
         slab_id = request.POST.get('slab_id')
         
         try:
             if action == 'create':
-                PremiumSlab.objects.create(
+                slab = PremiumSlab(
                     insurance_type_id=request.POST.get('insurance_type'),
                     slab_name=request.POST.get('slab_name'),
                     min_coverage_amount=Decimal(request.POST.get('min_coverage_amount', '0')),
-                    max_coverage_amount=Decimal(request.POST.get('max_coverage_amount', '0')),
+                    max_coverage_amount=(
+                        Decimal(request.POST['max_coverage_amount'])
+                        if request.POST.get('max_coverage_amount') else None
+                    ),
                     base_premium=Decimal(request.POST.get('base_premium', '0')),
                     percentage_markup=Decimal(request.POST.get('percentage_markup', '0')),
                     is_active=True
                 )
+                slab.full_clean()
+                slab.save()
                 messages.success(request, 'Premium slab created successfully.')
             
             elif action == 'update' and slab_id:
@@ -1155,6 +1170,8 @@ class AdminPremiumSlabListView(AdminRequiredMixin, ListView):
                 PremiumSlab.objects.filter(id=slab_id).delete()
                 messages.success(request, 'Premium slab deleted successfully.')
                 
+        except ValidationError as e:
+            messages.error(request, ' '.join(e.messages))
         except Exception as e:
             messages.error(request, f'Error: {str(e)}')
         
@@ -1265,6 +1282,7 @@ class AdminBusinessConfigListView(AdminRequiredMixin, ListView):
         context = super().get_context_data(**kwargs)
         from apps.catalog.config_models import BusinessConfiguration
         context['config_types'] = BusinessConfiguration.CONFIG_TYPE_CHOICES
+        context['value_types'] = BusinessConfiguration.VALUE_TYPE_CHOICES
         return context
     
     def post(self, request, *args, **kwargs):
@@ -1277,9 +1295,14 @@ class AdminBusinessConfigListView(AdminRequiredMixin, ListView):
         
         try:
             if action == 'create':
+                config_value = request.POST.get('config_value', '')
                 BusinessConfiguration.objects.create(
                     config_key=request.POST.get('config_key'),
-                    config_value=request.POST.get('config_value'),
+                    config_value=config_value,
+                    config_value_type=(
+                        request.POST.get('config_value_type')
+                        or BusinessConfiguration.infer_value_type(config_value)
+                    ),
                     config_type=request.POST.get('config_type', 'GENERAL'),
                     config_description=request.POST.get('config_description', ''),
                     is_active=True
@@ -12,10 +12,12 @@ Uses Gmail SMTP configured in settings.py
 """
 
 import logging
+import threading
 from django.core.mail import send_mail, EmailMultiAlternatives
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 from django.conf import settings
+from django.db import connection, transaction
 
 logger = logging.getLogger(__name__)
 
@@ -219,6 +221,35 @@ def send_claim_status_email(claim, old_status=None):
     )
 
 
+def queue_claim_status_email(claim_id, old_status=None):
+    """
+    Send the claim status email off the request thread.
+    
+    Queued only once the status change commits; the worker re-reads the
+    claim by pk, so nothing request-bound crosses the thread.
+    """
+    transaction.on_commit(
+        lambda: threading.Thread(
+            target=_send_claim_status_email_by_id,
+            args=(claim_id, old_status),
+            daemon=True,
+        ).start()
+    )
+
+
+def _send_claim_status_email_by_id(claim_id, old_status):
+    from apps.claims.models import Claim
+    
+    try:
+        claim = Claim.objects.select_related('customer__user', 'policy').get(pk=claim_id)
+        send_claim_status_email(claim, old_status)
+    except Exception as e:
+        logger.error(f"Failed to send status email for claim {claim_id}: {str(e)}")
+    finally:
+        # The thread opened its own connection; don't leak it
+        connection.close()
+
+
 def send_application_status_email(application, old_status=None):
     """
     Notify customer when their application status changes.
@@ -101,6 +101,10 @@ class Policy(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # insurance_type_id as last read from or written to the database;
+    # None until then
+    _stored_insurance_type_id = None
+    
     class Meta:
         db_table = 'policies'
         verbose_name_plural = 'Policies'
@@ -115,6 +119,12 @@ class Policy(models.Model):
     def __str__(self):
         return f"{self.policy_number} - {self.customer.user.email}"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._stored_insurance_type_id = instance.__dict__.get('insurance_type_id')
+        return instance
+    
     @property
     def is_active(self):
         """Check if policy is currently active."""
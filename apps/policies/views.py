@@ -87,7 +87,7 @@ class PolicyViewSet(viewsets.ReadOnlyModelViewSet):
         if company:
             queryset = queryset.filter(insurance_company_id=company)
         
-        return queryset.distinct()
+        return queryset
     
     def get_serializer_class(self):
         if self.action == 'list':
@@ -11,13 +11,12 @@ This module provides business logic for quote generation:
 from decimal import Decimal
 from datetime import date
 from typing import List, Optional, Tuple
-from django.db.models import Q
 
 from apps.catalog.models import (
     InsuranceType, InsuranceCompany, CoverageType, RiderAddon,
     PremiumSlab, DiscountRule, QuoteCalculationWeight
 )
-from apps.customers.models import CustomerProfile, CustomerRiskProfile
+from apps.customers.models import ClaimHistory, CustomerProfile, CustomerRiskProfile
 from apps.applications.models import InsuranceApplication
 
 
@@ -45,12 +44,7 @@ class QuoteCalculationService:
         Finds the matching slab for the coverage amount and applies
         base premium + percentage markup.
         """
-        slab = PremiumSlab.objects.filter(
-            insurance_type=self.insurance_type,
-            min_coverage_amount__lte=self.sum_assured,
-            max_coverage_amount__gte=self.sum_assured,
-            is_active=True
-        ).first()
+        slab = PremiumSlab.find_for_amount(self.insurance_type, self.sum_assured)
         
         if slab:
             return slab.calculate_premium(self.sum_assured)
@@ -98,17 +92,10 @@ class QuoteCalculationService:
         applicable_discounts = []
         today = date.today()
         
-        # Get active discount rules for this insurance type
-        rules = DiscountRule.objects.filter(
-            Q(insurance_type=self.insurance_type) | Q(insurance_type__isnull=True),
-            is_active=True
-        ).order_by('-rule_priority')
+        # Active rules for this insurance type, already date-filtered in SQL
+        rules = DiscountRule.get_applicable_rules(self.insurance_type, today)
         
         for rule in rules:
-            # Check date validity
-            if not rule.is_valid_for_date(today):
-                continue
-            
             # Evaluate rule conditions
             if self._evaluate_discount_condition(rule):
                 discount_amount = base_premium * (rule.discount_percentage / 100)
@@ -158,10 +145,10 @@ class QuoteCalculationService:
         # Check no-claim years condition
         if 'min_years_no_claim' in conditions:
             years_required = conditions['min_years_no_claim']
-            recent_histories = self.customer.claim_histories.filter(
-                claim_year__gte=date.today().year - years_required
+            recent = ClaimHistory.summary_for_customer(
+                self.customer.pk, since_year=date.today().year - years_required
             )
-            if recent_histories.filter(claim_count__gt=0).exists():
+            if recent['total_claims'] > 0:
                 return False
         
         # Check age condition
@@ -273,9 +260,8 @@ class QuoteCalculationService:
         
         Higher score = better value quote.
         """
-        weights = QuoteCalculationWeight.objects.filter(
-            insurance_type=self.insurance_type,
-            is_active=True
+        weights = QuoteCalculationWeight.evaluator_qs().filter(
+            insurance_type=self.insurance_type
         )
         
         score = Decimal('50.00')  # Base score
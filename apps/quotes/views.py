@@ -88,7 +88,7 @@ class QuoteViewSet(viewsets.ReadOnlyModelViewSet):
         if max_premium:
             queryset = queryset.filter(total_premium_with_gst__lte=max_premium)
         
-        return queryset.distinct()
+        return queryset
     
     def get_serializer_class(self):
         if self.action == 'list':
@@ -146,10 +146,10 @@ class QuoteViewSet(viewsets.ReadOnlyModelViewSet):
         # Get coverages and addons for this insurance type
         type_coverages = CoverageType.objects.filter(
             insurance_type=application.insurance_type
-        )
+        ).defer('description')
         type_addons = RiderAddon.objects.filter(
             insurance_type=application.insurance_type
-        )
+        ).defer('description')
         
         # Use provided IDs or default to mandatory coverages
         if not coverage_ids:
@@ -281,7 +281,7 @@ class QuoteViewSet(viewsets.ReadOnlyModelViewSet):
     
     def _calculate_base_premium(self, application, company, coverage_ids):
         """Calculate base premium from coverages."""
-        coverages = CoverageType.objects.filter(id__in=coverage_ids)
+        coverages = CoverageType.objects.filter(id__in=coverage_ids).only('base_premium_per_unit')
         base = sum(c.base_premium_per_unit for c in coverages)
         
         # Apply company-specific multiplier (simplified)
@@ -295,7 +295,7 @@ class QuoteViewSet(viewsets.ReadOnlyModelViewSet):
     
     def _calculate_addon_premium(self, base_premium, addon_ids):
         """Calculate addon premium."""
-        addons = RiderAddon.objects.filter(id__in=addon_ids)
+        addons = RiderAddon.objects.filter(id__in=addon_ids).only('premium_percentage')
         total = Decimal('0')
         for addon in addons:
             total += base_premium * (addon.premium_percentage / 100)
@@ -469,10 +469,10 @@ class QuoteViewSet(viewsets.ReadOnlyModelViewSet):
         # Get coverages and addons for this insurance type
         type_coverages = CoverageType.objects.filter(
             insurance_type=application.insurance_type
-        )
+        ).defer('description')
         type_addons = RiderAddon.objects.filter(
             insurance_type=application.insurance_type
-        )
+        ).defer('description')
         
         # Use provided IDs or default to mandatory coverages
         if not coverage_ids:
@@ -38,6 +38,15 @@ DEBUG = config('DEBUG', default=True, cast=bool)
 
 ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='localhost,127.0.0.1', cast=Csv())
 
+# Key for the PAN/Aadhaar lookup hashes (CustomerProfile.pan_hash etc.).
+# Separate from SECRET_KEY, so rotating the secret key leaves stored
+# hashes valid, and required unless DEBUG is on. If this key itself is
+# changed, run `manage.py rehash_identity_numbers`.
+if DEBUG:
+    PII_HMAC_KEY = config('PII_HMAC_KEY', default='django-insecure-pii-hmac-key')
+else:
+    PII_HMAC_KEY = config('PII_HMAC_KEY')
+
 
 # =============================================================================
 # APPLICATION DEFINITION
@@ -121,6 +130,11 @@ DATABASES = {
         'PASSWORD': config('DB_PASSWORD', default=''),
         'HOST': config('DB_HOST', default='localhost'),
         'PORT': config('DB_PORT', default='3306'),
+        # Persistent connections: reuse each worker's MySQL connection
+        # across requests instead of reconnecting per request. Set
+        # DB_CONN_MAX_AGE=0 when a pooler such as ProxySQL sits in front.
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
         'OPTIONS': {
             'charset': 'utf8mb4',
             'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
@@ -129,6 +143,36 @@ DATABASES = {
 }
 
 
+# =============================================================================
+# CACHE CONFIGURATION
+# =============================================================================
+# Response caches (policy explore, claim lists, customer details) and the
+# config memos are invalidated by replacing a version stamp in this cache,
+# so every worker must share it. REDIS_URL (e.g. redis://localhost:6379/1)
+# is required unless DEBUG is on; the DEBUG fallback, LocMemCache, is per
+# process, so a write only invalidates the worker that handled it.
+
+if DEBUG:
+    REDIS_URL = config('REDIS_URL', default='')
+else:
+    REDIS_URL = config('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'insurehub',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
 # =============================================================================
 # AUTHENTICATION & CUSTOM USER MODEL
 # =============================================================================
@@ -261,6 +305,14 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 MEDIA_URL = 'media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Uploads above this many bytes (claim documents, mostly) are streamed
+# to a temp file instead of buffered in the worker's memory; the default
+# storage then moves that file into MEDIA_ROOT rather than copying it.
+# Point FILE_UPLOAD_TEMP_DIR at MEDIA_ROOT's filesystem to keep the move
+# a rename.
+FILE_UPLOAD_MAX_MEMORY_SIZE = config('FILE_UPLOAD_MAX_MEMORY_SIZE', default=1024 * 1024, cast=int)
+FILE_UPLOAD_TEMP_DIR = config('FILE_UPLOAD_TEMP_DIR', default=None)
+
 
 # =============================================================================
 # DEFAULT PRIMARY KEY FIELD TYPE
@@ -51,19 +51,22 @@ def api_root(request):
 
 
 urlpatterns = [
-    # API root
-    path('api/v1/', api_root, name='api_root'),
-    
-    # REST API endpoints
-    path('api/v1/', include('apps.accounts.urls')),
-    path('api/v1/', include('apps.catalog.urls')),
-    path('api/v1/', include('apps.customers.urls')),
-    path('api/v1/', include('apps.applications.urls')),
-    path('api/v1/', include('apps.quotes.urls')),
-    path('api/v1/', include('apps.policies.urls')),
-    path('api/v1/', include('apps.claims.urls')),
-    path('api/v1/', include('apps.notifications.urls')),
-    path('api/v1/', include('apps.analytics.urls')),
+    # REST API endpoints, behind a single prefix so frontend requests
+    # skip the whole API with one check
+    path('api/v1/', include([
+        # API root
+        path('', api_root, name='api_root'),
+        
+        path('', include('apps.accounts.urls')),
+        path('', include('apps.catalog.urls')),
+        path('', include('apps.customers.urls')),
+        path('', include('apps.applications.urls')),
+        path('', include('apps.quotes.urls')),
+        path('', include('apps.policies.urls')),
+        path('', include('apps.claims.urls')),
+        path('', include('apps.notifications.urls')),
+        path('', include('apps.analytics.urls')),
+    ])),
     
     # Frontend Template Routes
     path('', include('apps.frontend.urls')),